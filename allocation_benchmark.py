@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 03:02:18 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import argparse
+import sys
+import time
+import numpy as np
+
+from basic_classes import Position, Drywall, Cut, Stud
+from wall_class import Wall
+from data_loader import DataLoader
+from simulation import runTrial, createPlanner, METHODS
+
+#Value types counted by the benchmark
+VALUE_TYPES = [Position, Drywall, Cut, Stud]
+
+
+def getFootprint(obj):
+    '''
+    Returns: the bytes of an object, its attribute dictionary (if it has one)
+    and the float values it holds (Python floats or numpy scalars).
+    '''
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+        values = list(vars(obj).values())
+    elif isinstance(obj, tuple):
+        values = list(obj)
+    else:
+        values = [getattr(obj, name) for name in getattr(type(obj), '__slots__', ()) if hasattr(obj, name)]
+    for value in values:
+        if isinstance(value, (float, np.generic)):
+            size += sys.getsizeof(value)
+    return size
+
+
+class AllocationCounter(object):
+    """
+    Counts the instances of the value types created while it is active, with
+    their footprint (see getFootprint), and the sheets placed on the walls
+    (calls to Wall.updateDrywallDataframe).
+
+    The constructors are wrapped while the counter is active (with
+    statement) and restored when it exits.
+    """
+    def __init__(self, classes=VALUE_TYPES):
+        self.classes = list(classes)
+        self.counts = {cls.__name__: 0 for cls in self.classes}
+        self.sizes = {cls.__name__: 0 for cls in self.classes}
+        self.placements = 0
+        self.originals = {}
+
+    def wrapInit(self, cls):
+        init = cls.__dict__.get('__init__')
+        name = cls.__name__
+        def countedInit(obj, *args, **kwargs):
+            if init is not None:
+                init(obj, *args, **kwargs)
+            self.counts[name] += 1
+            self.sizes[name] += getFootprint(obj)
+        return countedInit
+
+    def wrapPlacement(self, update):
+        def countedUpdate(wall, *args, **kwargs):
+            self.placements += 1
+            return update(wall, *args, **kwargs)
+        return countedUpdate
+
+    def __enter__(self):
+        for cls in self.classes:
+            self.originals[cls] = cls.__dict__.get('__init__')
+            cls.__init__ = self.wrapInit(cls)
+        self.originals[Wall] = Wall.updateDrywallDataframe
+        Wall.updateDrywallDataframe = self.wrapPlacement(Wall.updateDrywallDataframe)
+        return self
+
+    def __exit__(self, *args):
+        Wall.updateDrywallDataframe = self.originals.pop(Wall)
+        for cls, init in self.originals.items():
+            if init is None:
+                del cls.__init__
+            else:
+                cls.__init__ = init
+        self.originals.clear()
+        return False
+
+    def getPlacements(self):
+        return self.placements
+
+    def getCounts(self):
+        return self.counts
+
+    def getSizes(self):
+        return self.sizes
+
+
+def measurePlacementAllocations(loader, trials=1, max_cuts=10, min_area=12, seed=0, method='random'):
+    '''
+    Run trials of every floor of a house and count the value type instances
+    created per sheet placement.
+
+    loader: DataLoader with the house.
+    method: layout method (see createPlanner).
+
+    Returns: dictionary with the placements, the instances and bytes per
+    placement of each value type (and their total) and the time per placement
+    in microseconds.
+    '''
+    catalog = loader.getCatalog()
+    planner = createPlanner(method, catalog)
+    df_walls = loader.getWalls()
+    floors = df_walls['Attribute:Level'].unique().tolist()
+
+    counter = AllocationCounter()
+    start = time.perf_counter()
+    with counter:
+        for floor_name in floors:
+            df_floor = df_walls[df_walls['Attribute:Level'] == floor_name]
+            for trial in range(trials):
+                runTrial(trial, floor_name, df_floor, loader.getStuds(), loader.getDoors(), loader.getWindows(), max_cuts, min_area, seed, catalog=catalog, planner=planner)
+    elapsed = time.perf_counter() - start
+
+    placements = max(counter.getPlacements(), 1)
+    result = {'placements': counter.getPlacements(), 'us_per_placement': round(elapsed / placements * 1e6, 1)}
+    for name, count in counter.getCounts().items():
+        result[name] = round(count / placements, 2)
+        result[name + '_bytes'] = round(counter.getSizes()[name] / placements, 1)
+    result['total'] = round(sum(counter.getCounts().values()) / placements, 2)
+    result['total_bytes'] = round(sum(counter.getSizes().values()) / placements, 1)
+    return result
+
+
+def main(argv=None):
+    '''
+    Command line entry point: print the value type instances and bytes
+    allocated per sheet placement.
+    '''
+    parser = argparse.ArgumentParser(description='Count the Position, Drywall, Cut and Stud instances created per sheet placement.')
+    parser.add_argument('--trials', type=int, default=1, help='number of trials per floor (default: 1)')
+    parser.add_argument('--max-cuts', type=int, default=10, help='max. number of times a sheet can be cut (default: 10)')
+    parser.add_argument('--min-area', type=float, default=12, help='min. area of a reusable cut in ft2 (default: 12)')
+    parser.add_argument('--method', default='random', choices=METHODS, help='layout method (default: random)')
+    parser.add_argument('--seed', type=int, default=0, help='base seed of the trials (default: 0)')
+    parser.add_argument('--data-dir', default=None, help='directory of the input files (default: the simulation directory)')
+    args = parser.parse_args(argv)
+
+    result = measurePlacementAllocations(DataLoader(args.data_dir), args.trials, args.max_cuts, args.min_area, args.seed, args.method)
+    print('Placements: %s (%s us per placement)' % (result['placements'], result['us_per_placement']))
+    print('%-10s %12s %12s' % ('type', 'per place.', 'bytes'))
+    for cls in VALUE_TYPES + ['total']:
+        name = cls if isinstance(cls, str) else cls.__name__
+        print('%-10s %12s %12s' % (name, result[name], result[name + '_bytes']))
+    return result
+
+
+if __name__ == '__main__':
+    main()
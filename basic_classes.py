@@ -10,39 +10,67 @@ import pandas as pd
 import numpy as np
 import random
 import string
-import matplotlib.pylab as plt
-import matplotlib.patches as patches
-import matplotlib as mpl
-import pyclipper
-import seaborn as sns
-mpl.style.use(['seaborn-white'])
 
-#Create filenames
-drywalls_filename = 'df_drywalls.csv'
-df_drywalls = pd.read_csv(drywalls_filename)
+from simulation_log import getLogger
+from phase_timer import timed, STAGGER_CHECK, CORNER_CHECK, CLIPPER
+from data_loader import getDefaultLoader
+
+#Design rule checks (stagger joints, opening corners)
+logger = getLogger('rules')
+
+
+def importPlotting():
+    '''
+    Import the plotting libraries. They are only needed by the visualizations,
+    so they are not imported with the simulation modules.
+
+    Returns: (matplotlib.pylab, matplotlib.patches, seaborn)
+    '''
+    import matplotlib as mpl
+    import matplotlib.pylab as plt
+    import matplotlib.patches as patches
+    import seaborn as sns
+    mpl.style.use(['seaborn-white'])
+    return plt, patches, sns
+
+
+def roundFloat(value, decimals=4):
+    '''
+    Round a number like np.round (round half to even of value * 10^decimals)
+    and return a plain Python float instead of a numpy scalar.
+    '''
+    scale = 10.0 ** decimals
+    return round(float(value) * scale) / scale
+
 
 # Create class Position
-class Position(object):
+class Position(tuple):
     """
     A Position represents a location in a two-dimensional wall.
+
+    Positions are immutable (x, y) tuples of plain floats, rounded to 4
+    decimals. Many are created on every time-step, so they have no
+    attribute dictionary.
     """
-    def __init__(self, x, y):
+    __slots__ = ()
+    def __new__(cls, x, y):
         """
         Initializes a position with coordinates (x, y).
         """
-        self.x = x
-        self.x = round(x, 4)
-        self.y = round(y, 4)
+        return tuple.__new__(cls, (roundFloat(x), roundFloat(y)))
+    def __getnewargs__(self):
+        #Pickled as (x, y), e.g. to be sent to a worker process
+        return tuple(self)
     def getX(self):
         """
         Returns position coordinate in the X axis.
         """
-        return self.x  
+        return self[0]
     def getY(self):
         """
         Returns position coordinate in the Y axis.
         """
-        return self.y
+        return self[1]
     def getNewPosition(self, delta_x, delta_y):
         """
         Computes and returns the new Position after a single clock-tick has
@@ -55,31 +83,38 @@ class Position(object):
         
         Returns: a Position object representing the new position.
         """
-        old_x, old_y = self.getX(), self.getY()
-        
-        # Calculate new coordinates
-        new_x = np.round(float(old_x + delta_x), 4)
-        new_y = np.round(float(old_y + delta_y), 4)
-        
-        return Position(new_x, new_y)
+        return Position(self[0] + delta_x, self[1] + delta_y)
     def __str__(self):  
-        return "(%0.2f, %0.2f)" % (self.x, self.y)
+        return "(%0.2f, %0.2f)" % (self[0], self[1])
 
+#Origin of the walls, shared by the new sheets and cuts (Positions are
+#immutable)
+ORIGIN = Position(0, 0)
 
 class Drywall(object):
-    def __init__(self, name, height, width):
+    __slots__ = ('name', 'height', 'width', 'nominal_area', 'position', 'rng', 'ID', 'vertical_cut', 'horizontal_cut',
+                 'door_clipper', 'window_clipper', 'no_cuts', 'cutting_losses', 'cutting_loss_position', 'cutting_loss_width', 'cutting_loss_height')
+    def __init__(self, name, height, width, rng=None, nominal_area=None):
+        '''
+        nominal_area: area of the nominal sheet the drywall comes from
+        (defaults to height * width).
+        '''
         self.name = name
         self.height = height
         self.width = width
-        self.position = Position(0,0)
-        self.ID = generateID(name + '_')
+        if nominal_area is None:
+            nominal_area = float(height * width)
+        self.nominal_area = nominal_area
+        self.position = ORIGIN
+        self.rng = rng
+        self.ID = generateID(name + '_', rng)
         self.vertical_cut = 0
         self.horizontal_cut = 0
         self.door_clipper = 0
         self.window_clipper = 0
         self.no_cuts = 0
         self.cutting_losses=[]
-        self.cutting_loss_position = Position(0, 0)
+        self.cutting_loss_position = ORIGIN
         self.cutting_loss_width = 0
         self.cutting_loss_height = 0
     def getName(self):
@@ -91,14 +126,11 @@ class Drywall(object):
     def getArea(self):
         return self.height * self.width
     def getNominalArea(self):
-        if '4x8' in self.name:
-            return float(4*8)
-        if '4x10' in self.name:
-            return float(4*10)
-        if '4x12' in self.name:
-            return float(4*12)
+        return self.nominal_area
     def getID(self):
         return self.ID
+    def getRandom(self):
+        return self.rng
     def getNoCuts(self):
         return self.no_cuts        
     def setNoCuts(self, number):
@@ -155,15 +187,24 @@ class Drywall(object):
         return self.name + ' ' 
 
 class Cut(object):
-    def __init__(self, drywall, width, height, cut_type):
+    __slots__ = ('drywall', 'drywall_ID', 'cname', 'height', 'width', 'cut_type', 'position', 'no_cuts', 'wall_name')
+    def __init__(self, drywall, width, height, cut_type, name=None, no_cuts=0):
+        '''
+        drywall: the Drywall (or SheetRecord) the cut comes from.
+        name: name of the cut (a new ID is drawn if None). Given when a cut
+        is rebuilt from the waste table (see OffcutRegistry).
+        no_cuts: number of times the cut has been cut.
+        '''
         self.drywall = drywall
         self.drywall_ID = drywall.getID()
-        self.cname = generateID( self.drywall.getID() + '_' + 'Cut')
+        if name is None:
+            name = generateID( self.drywall.getID() + '_' + 'Cut', drywall.getRandom())
+        self.cname = name
         self.height = height
         self.width = width
         self.cut_type = cut_type #Ex. Vertical cut, Horizontal cut, Door clipper, Window clipper
-        self.position = Position(0,0)  
-        self.no_cuts = 0
+        self.position = ORIGIN
+        self.no_cuts = no_cuts
         self.wall_name = 0
     def getName(self):
         return self.cname    
@@ -207,12 +248,13 @@ class Cut(object):
     def __str__(self):
         return self.cname + ' ' 
 
-def CreateDrywallInstances(df_drywalls):
+def CreateDrywallInstances(df_drywalls, rng=None):
     '''
     Generate drywall instances on the class Drywall to easily access
     drywall properties.
     
     df_drywalls: complete drywall dataframe.
+    rng: TrialRandom used to generate the drywall IDs.
     
     Returns: a drywall_list which contains each drywall element as an
     #instance of the class Drywall.
@@ -222,11 +264,12 @@ def CreateDrywallInstances(df_drywalls):
         name = df_drywalls.loc[index, 'drywall_name']
         height = df_drywalls.loc[index, 'drywall_height']
         width = df_drywalls.loc[index, 'drywall_width']
-        drywall_list.append(Drywall(name, height, width))
+        drywall_list.append(Drywall(name, height, width, rng))
     return drywall_list
 
 
 class Stud(object):
+    __slots__ = ('name', 'locationX', 'function')
     def __init__(self, name, locationX, function):
         self.name = name
         self.locationX = locationX
@@ -314,28 +357,33 @@ def isEdgeOnStud(next_position, stud_location_X):
 #         #print('No need to stagger joints')
 #         return False
 
+def isNearJoint(x, joints):
+    '''
+    Check if an edge at x is within 0.4' of a joint of the row below.
+    
+    joints: list with the X location of the joints of the row below.
+    '''
+    for joint in joints:
+        if x >= (joint - 0.4) and x <= (joint + 0.4):
+            return True
+    return False
+
+@timed(STAGGER_CHECK)
 def staggerJoints(robot, position):
     
     joints = robot.wall.getJoints()
     row_number = robot.getRowNumber()
     #print(row_number)
-    x = False
-    if (len(joints)!=0) and ((row_number-1)>=0):
-        for joint in joints[row_number-1]:
-            min_value = joint - 0.4
-            max_value = joint + 0.4
-            if position.getX() >= min_value and position.getX() <= max_value:
-                print("Need to Stagger Joints")
-                print('PROBLEM - Select different drywall size')
-                x = True
-                return True
-    if x == False:
-        print('No need to stagger joints')
-        return False
+    if (len(joints)!=0) and ((row_number-1)>=0) and isNearJoint(position.getX(), joints[row_number-1]):
+        logger.debug('Need to stagger joints at X = %s', position.getX())
+        return True
+    logger.debug('No need to stagger joints')
+    return False
     
+@timed(CORNER_CHECK)
 def isEdgeAroundDoorOpeningCorner(robot, position):
   
-    doors_df = robot.wall.getDoors()
+    openings = robot.wall.getOpenings()
     
     # Check if position is on the edge of the wall. if True, ignore rule.
     
@@ -343,44 +391,30 @@ def isEdgeAroundDoorOpeningCorner(robot, position):
     if (wall_edge - 0.125 ) <= position.getX():
         return False
 
-    if len(doors_df)==0:
+    if openings.getNumDoors()==0:
         return False
     
-    else:
-        x = False
-        #print(position)
-        
-        for index, value in doors_df.iterrows():
-            d_start_point_x = doors_df.loc[index, 'Doors.Openning.StartPoint.Attribute:X']
-            d_start_point_y = doors_df.loc[index, 'Doors.Openning.StartPoint.Attribute:Y']
-            d_end_point_x = doors_df.loc[index, 'Doors.Openning.EndPoint.Attribute:X']
-            d_end_point_y = doors_df.loc[index, 'Doors.Openning.EndPoint.Attribute:Y']
-            #door_width = end_point_x - start_point_x 
-            #door_height = end_point_y - start_point_y  
-            #print(d_start_point_x)
-            #print(d_end_point_x)
-        
-            
-            if (((d_start_point_x - 1) < position.getX()) and (position.getX() < (d_start_point_x + 1))) or \
-                (((d_end_point_x - 0.125) < position.getX()) and (position.getX() < (d_end_point_x + 1))):
-                    print('Edge is around Door Opening Corner')
-                    x = True
-                    
-                    if ((position.getY() < (d_start_point_y )) and (position.getY() + 4 < (d_start_point_y ))) or \
-                        (position.getY() > (d_end_point_y )):
-                         return False
-                    else:
-                        return True
-                        break
-        
-        if x == False:
-            #print('Edge is NOT around Door Opening Corner')
+    # First door whose corner zone contains the edge
+    door = openings.getDoorInCornerZone(position.getX())
+    if door is None:
+        #print('Edge is NOT around Door Opening Corner')
+        return False
+    
+    d_start_point_y = door[1]
+    d_end_point_y = door[3]
+    logger.debug('Edge is around Door Opening Corner at X = %s', position.getX())
+    
+    if ((position.getY() < (d_start_point_y )) and (position.getY() + 4 < (d_start_point_y ))) or \
+        (position.getY() > (d_end_point_y )):
             return False
+    else:
+        return True
 
 
+@timed(CORNER_CHECK)
 def isEdgeAroundWindowOpeningCorner(robot, position):    
     
-    windows_df = robot.wall.getWindows()
+    openings = robot.wall.getOpenings()
     
     # Check if position is on the edge of the wall. if True, ignore rule.
     
@@ -388,36 +422,24 @@ def isEdgeAroundWindowOpeningCorner(robot, position):
     if (wall_edge - 0.125 ) <= position.getX():
         return False
     
-    if len(windows_df)==0:
+    if openings.getNumWindows()==0:
         return False
     
-    else:
-        x = False
-        for index, value in windows_df.iterrows():
-            w_start_point_x = windows_df.loc[index, 'Windows.Openning.StartPoint.Attribute:X']
-            w_start_point_y = windows_df.loc[index, 'Windows.Openning.StartPoint.Attribute:Y']
-            w_end_point_x = windows_df.loc[index, 'Windows.Openning.EndPoint.Attribute:X']
-            w_end_point_y = windows_df.loc[index, 'Windows.Openning.EndPoint.Attribute:Y']
-            #window_width = end_point_x - start_point_x 
-            #window_height = end_point_y - start_point_y
-            #print(w_start_point_x)
-            #print(w_end_point_x)
-            
-            if (((w_start_point_x - 1) <= position.getX()) and (position.getX() <= (w_start_point_x + 0.125))) or \
-            (((w_end_point_x - 0.125) <= position.getX()) and (position.getX() <= (w_end_point_x + 0.8))): 
-                print('Edge is around Window Opening Corner')
-                x = True
-                
-                if ((position.getY() < (w_start_point_y )) and (position.getY() + 4 < (w_start_point_y ))) or \
-                    (position.getY() > (w_end_point_y )):
-                        return False
-                else:
-                    return True
-                    break
-            
-        if x == False:
-            #print('Edge is NOT around Door Opening Corner')
+    # First window whose corner zone contains the edge
+    window = openings.getWindowInCornerZone(position.getX())
+    if window is None:
+        #print('Edge is NOT around Window Opening Corner')
+        return False
+    
+    w_start_point_y = window[1]
+    w_end_point_y = window[3]
+    logger.debug('Edge is around Window Opening Corner at X = %s', position.getX())
+    
+    if ((position.getY() < (w_start_point_y )) and (position.getY() + 4 < (w_start_point_y ))) or \
+        (position.getY() > (w_end_point_y )):
             return False
+    else:
+        return True
                
 
 def verticalOrientation(wall_length, wall_height, drywall_width, drywall_height):
@@ -426,185 +448,185 @@ def verticalOrientation(wall_length, wall_height, drywall_width, drywall_height)
         return True
         
     
-def verticalPossibility(wall_length, wall_height):
+def verticalPossibility(wall_length, wall_height, catalog=None):
+    '''
+    Check if a sheet of the catalog can be placed on the wall in a vertical
+    orientation.
+    
+    catalog: DrywallCatalog (defaults to the catalog of the default DataLoader).
+    '''
+    if catalog is None:
+        catalog = getDefaultLoader().getCatalog()
+    return catalog.fitsVertically(wall_length, wall_height)
+
+
+def getRowsHeight(wall_height, drywall_height=4):
+    '''
+    Split a wall in rows of horizontal drywall sheets: full rows of
+    drywall_height and a last row with the rest of the wall height.
     
-    drywall_list = CreateDrywallInstances(df_drywalls)
+    Returns: list with the height of every row, from the bottom.
+    '''
+    rows = wall_height / drywall_height 
+    rows_floor = int(np.floor(rows))
+    dif = (rows-rows_floor)*drywall_height #last row height
     
-    for drywall in drywall_list:
-        drywall_width = drywall.getWidth()
-        #print('d_width: ' + str(drywall_width))
-        drywall_height = drywall.getHeight()  
-        #print('d_height: ' + str(drywall_height))
-        #print('wall_length: ' + str(wall_length))
-        #print('wall_height: ' + str(wall_height))
-   
-        if wall_length <= drywall_height and wall_height <= drywall_width:
-            #print('Place Drywall Sheet on a Vertical Orientation')
-            return True
-            break
+    rows_height=[]
+    for i in range(rows_floor):
+        rows_height.append(drywall_height)
+    if dif!=0:
+        rows_height.append(dif)
+    return rows_height
 
         
-def clipper(subject, clip):
+def getRectangleBounds(polygon):
+    '''
+    Returns: the bounds (x0, y0, x1, y1) of a polygon, with x0 <= x1 and y0 <= y1.
     '''
-    Parameters:
-    subject : list of coordinates (x, y) representing a polygon. Ex. drywall = [(x1, y1), (x2, y2), (x3, y3), (x4, y4)].
-    clip : list of tuples (x, y) representing a polygon. Ex. Window = [(x1, y1), (x2, y2), (x3, y3), (x4, y4)].
+    xs = [c[0] for c in polygon]
+    ys = [c[1] for c in polygon]
+    return min(xs), min(ys), max(xs), max(ys)
 
-    Returns
-    intersection (i.e. cutting loss) = list of lists
 
+def rectangleIntersection(subject, clips):
     '''
-    subject = pyclipper.scale_to_clipper(subject)
-    clip = pyclipper.scale_to_clipper(clip)
-    
-    pc = pyclipper.Pyclipper()
-    pc.AddPath(clip, pyclipper.PT_CLIP, True)
-    pc.AddPath(subject, pyclipper.PT_SUBJECT, True)
-    
-    intersection = pyclipper.scale_from_clipper(pc.Execute(pyclipper.CT_INTERSECTION))
-    
-    return intersection
+    Intersect one axis-aligned rectangle with several axis-aligned rectangles
+    at once.
+
+    subject: bounds (x0, y0, x1, y1) of a rectangle. Ex. a drywall sheet.
+    clips: array of shape (n, 4) with the bounds (x0, y0, x1, y1) of each
+    rectangle. Ex. the doors of a wall.
+
+    Returns
+    overlap: boolean array, True where the intersection has a positive area.
+    origin_x, origin_y, width, height: arrays with the bottom-left corner and
+    size of each intersection (only meaningful where overlap is True).
+    '''
+    clips = np.asarray(clips, dtype='float64').reshape(-1, 4)
+    x0 = np.maximum(clips[:, 0], subject[0])
+    y0 = np.maximum(clips[:, 1], subject[1])
+    x1 = np.minimum(clips[:, 2], subject[2])
+    y1 = np.minimum(clips[:, 3], subject[3])
+    width = x1 - x0
+    height = y1 - y0
+    overlap = (width > 0) & (height > 0)
+    return overlap, x0, y0, width, height
+
 
-            
 def getFourCoordinates(origin, width, height):
+    '''
+    Returns: the four corners (x, y) of a rectangle, counter-clockwise from
+    its origin (bottom left corner), rounded like Position.getNewPosition.
+    '''
+    x, y = origin
+    right = roundFloat(x + width)
+    top = roundFloat(y + height)
     
-    c_1 = origin
-    c_2 = origin.getNewPosition(width, 0)
-    c_3 = c_2.getNewPosition(0, height)
-    c_4 = c_1.getNewPosition(0, height)
-    
-    c_1 = origin.getX(), origin.getY()
-    c_2 = c_2.getX(), c_2.getY()
-    c_3 = c_3.getX(), c_3.getY()
-    c_4 = c_4.getX(), c_4.getY()
-    
-    coordinates = [c_1, c_2, c_3, c_4]
+    coordinates = [(x, y), (right, y), (right, top), (x, top)]
     
     return coordinates
 
+def clipperAtOpenings(robot, drywall, openings, cut_type):
+    '''
+    Clip a drywall sheet against a set of rectangular openings at once and
+    record each overlap as a cutting loss.
+
+    drywall: a Drywall object placed on the wall.
+    openings: array with one row (x0, y0, x1, y1, ...) per opening.
+    cut_type: 'door_clipper' or 'window_clipper'.
+    '''
+    if drywall.getWidth()==0 or len(openings)==0:
+        return
+    
+    subject = getRectangleBounds(getFourCoordinates(drywall.getPosition(), drywall.getWidth(), drywall.getHeight()))
+    overlap, origin_x, origin_y, widths, heights = rectangleIntersection(subject, openings[:, :4])
+    
+    for i in np.flatnonzero(overlap):
+        origin = roundFloat(origin_x[i]), roundFloat(origin_y[i])
+        width = roundFloat(widths[i])
+        height = roundFloat(heights[i])
+        cutting_loss = Cut(drywall, width, height, cut_type)
+        cutting_loss.setPosition(Position(origin[0],origin[1]))
+        
+        cutting_loss_area = width*height
+        drywall.setCuttingLosses(cutting_loss)
+        if cut_type == 'door_clipper':
+            drywall.setDoorCut(cutting_loss)
+        else:
+            drywall.setWindowCut(cutting_loss)
+        robot.wall.setCuttingLosses(cutting_loss_area)
+        simulation_number = 'Simulation_' + str(robot.getSimulationNumber())
+        cutting_loss.setWallName(robot.wall.getName())
+        robot.wall.updateWasteDF(cutting_loss, simulation_number)
+
+@timed(CLIPPER)
 def clipperAtDoor(robot, drywall):
     
-    doors_df = robot.wall.getDoors()
-    #print(doors_df)
-    #doors_df.fillna(0, inplace=True)
-    cutting_losses=[]
-    #print(doors_df.empty)
-    #print(doors_df['Doors.Openning.StartPoint.Attribute:X'])
-    if doors_df['Doors.Openning.StartPoint.Attribute:X'].isnull().values.any()==False:
-        for index, value in doors_df.iterrows():
-            d_start_point_x = doors_df.loc[index, 'Doors.Openning.StartPoint.Attribute:X']
-            d_start_point_y = doors_df.loc[index, 'Doors.Openning.StartPoint.Attribute:Y']
-            d_end_point_x = doors_df.loc[index, 'Doors.Openning.EndPoint.Attribute:X']
-            d_end_point_y = doors_df.loc[index, 'Doors.Openning.EndPoint.Attribute:Y']
-            door_width = d_end_point_x - d_start_point_x 
-            door_height = d_end_point_y - d_start_point_y    
-            
-            subject = getFourCoordinates(drywall.getPosition(), drywall.getWidth(), drywall.getHeight())
-            clip = getFourCoordinates(Position(d_start_point_x, d_start_point_y), door_width, door_height)
-            #print(subject)
-            #print(clip)
-                       
-            if drywall.getWidth()!=0:
-                cutting_loss_coordinates = clipper(subject, clip)
-                           
-                #print(cutting_loss_coordinates)
-                
-                if len(cutting_loss_coordinates) != 0:
-                    
-                    origin = np.round(cutting_loss_coordinates[0][2][0], 4), np.round(cutting_loss_coordinates[0][2][1], 4)
-                    width = np.round((cutting_loss_coordinates[0][0][0] - cutting_loss_coordinates[0][2][0]), 4)
-                    height = np.round((cutting_loss_coordinates[0][0][1] - cutting_loss_coordinates[0][2][1]), 4)
-                    cutting_loss = Cut(drywall, width, height, 'door_clipper')
-                    cutting_loss.setPosition(Position(origin[0],origin[1]))
-                    
-                    #cutting_losses.append(cutting_loss)
-                    cutting_loss_area = width*height
-                    #print('CLIPPER_DOOR: ', cutting_loss)
-                    drywall.setCuttingLosses(cutting_loss)
-                    drywall.setDoorCut(cutting_loss)
-                    #print(drywall.getDoorClipper())
-                    robot.wall.setCuttingLosses(cutting_loss_area)
-                    simulation_number = 'Simulation_' + str(robot.getSimulationNumber())
-                    cutting_loss.setWallName(robot.wall.getName())
-                    robot.wall.updateWasteDF(cutting_loss, simulation_number)
-                    #print(robot.wall.getWaste())
+    openings = robot.wall.getOpenings()
+    
+    if openings.clipDoors()==True:
+        clipperAtOpenings(robot, drywall, openings.getDoors(), 'door_clipper')
 
+@timed(CLIPPER)
 def clipperAtWindow(robot, drywall):
     
-    windows_df = robot.wall.getWindows()
-
-    #print(windows_df.empty)
-    #print(windows_df['Windows.Openning.StartPoint.Attribute:X'])
-    #print(windows_df)
-    if windows_df['Windows.Openning.StartPoint.Attribute:X'].isnull().values.any()==False:
-        for index, value in windows_df.iterrows():
-            w_start_point_x = windows_df.loc[index, 'Windows.Openning.StartPoint.Attribute:X']
-            w_start_point_y = windows_df.loc[index, 'Windows.Openning.StartPoint.Attribute:Y']
-            w_end_point_x = windows_df.loc[index, 'Windows.Openning.EndPoint.Attribute:X']
-            w_end_point_y = windows_df.loc[index, 'Windows.Openning.EndPoint.Attribute:Y']
-            window_width = w_end_point_x - w_start_point_x 
-            window_height = w_end_point_y - w_start_point_y   
-            
-            #print(drywall.getWidth())
-            #print(drywall.getHeight())
-            
-            subject = getFourCoordinates(drywall.getPosition(), drywall.getWidth(), drywall.getHeight())
-            clip = getFourCoordinates(Position(w_start_point_x, w_start_point_y), window_width, window_height)
-            #print(subject)
-            #print(clip)
-            
-            if drywall.getWidth()!=0:
-                cutting_loss_coordinates = clipper(subject, clip)
-                #print(cutting_loss_coordinates)
-                
-                if len(cutting_loss_coordinates) != 0:
-                    
-                    #print(cutting_loss_coordinates)
-                    origin = np.round(cutting_loss_coordinates[0][2][0], 4), np.round(cutting_loss_coordinates[0][2][1], 4)
-                    width = np.round((cutting_loss_coordinates[0][0][0] - cutting_loss_coordinates[0][2][0]), 4)
-                    height = np.round((cutting_loss_coordinates[0][0][1] - cutting_loss_coordinates[0][2][1]), 4)
-                    
-                    cutting_loss = Cut(drywall, width, height, 'window_clipper')
-                    cutting_loss.setPosition(Position(origin[0],origin[1]))
-                    
-                    cutting_loss_area = width*height
-                    #print('CLIPPER_WINDOW: ', cutting_loss)
-                    #print(cutting_loss.getPosition())
-                    #print(width)
-                    #print(cutting_loss.getWidth())
-                    drywall.setCuttingLosses(cutting_loss)
-                    drywall.setWindowCut(cutting_loss)
-                    robot.wall.setCuttingLosses(cutting_loss_area)
-                    simulation_number = 'Simulation_' + str(robot.getSimulationNumber())
-                    cutting_loss.setWallName(robot.wall.getName())
-                    robot.wall.updateWasteDF(cutting_loss, simulation_number)
-    
-def generateID(name):
+    openings = robot.wall.getOpenings()
+
+    if openings.clipWindows()==True:
+        clipperAtOpenings(robot, drywall, openings.getWindows(), 'window_clipper')
+    
+def generateID(name, rng=None):
+    '''
+    Returns: name followed by 6 random digits, drawn from the ID stream of rng
+    (a TrialRandom) or from the random module if rng is None.
+    '''
     name = name + '_'
     alphabet = string.digits
-    return name + ''.join(random.choices(alphabet, k=6)) 
+    if rng is None:
+        rng = random
+    return name + ''.join(rng.choices(alphabet, k=6)) 
                          
 
+def concatFrames(frames):
+    '''
+    Concatenate the saved result frames once, instead of appending them one by
+    one (which copies the whole frame on every call).
+
+    frames: list of DataFrames.
+
+    Returns: a DataFrame (empty if no frames were saved).
+    '''
+    if len(frames) == 0:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
 class Floor(object):
     def __init__(self, floor_name):
         self.floor_name = floor_name
-        self.drywallDF = pd.DataFrame()
-        self.wasteDF = pd.DataFrame()
-        self.jointsDF = pd.DataFrame()
+        self.drywall_frames = []
+        self.waste_frames = []
+        self.joints_frames = []
+        self.timing_frames = []
     def getDrywallDF(self):
-        return self.drywallDF
+        return concatFrames(self.drywall_frames)
     def saveDrywallDF(self, df_drywall):
-        self.drywallDF = self.drywallDF.append(df_drywall, ignore_index=True)
+        self.drywall_frames.append(df_drywall)
     def getWasteDF(self):
-        return self.wasteDF
+        return concatFrames(self.waste_frames)
     def saveWasteDF(self, df_waste):
-        self.wasteDF = self.wasteDF.append(df_waste, ignore_index=True)
+        self.waste_frames.append(df_waste)
     def getJointsDF(self):
-        return self.jointsDF
+        return concatFrames(self.joints_frames)
     def saveJointsDF(self, df_joints):
-        self.jointsDF = self.jointsDF.append(df_joints, ignore_index=True)
+        self.joints_frames.append(df_joints)
+    def getTimingDF(self):
+        return concatFrames(self.timing_frames)
+    def saveTimingDF(self, df_timing):
+        self.timing_frames.append(df_timing)
     def visual(self, name, df1, df2):
 
+        plt, patches, sns = importPlotting()
         sns_colors = sns.hls_palette(10, h=.5)
         
         fig = plt.figure(figsize=(20, 20))
@@ -641,25 +663,31 @@ class Floor(object):
 class House(object):
     def __init__(self, house_name):
         self.house_name = house_name
-        self.drywallDF = pd.DataFrame()
-        self.wasteDF = pd.DataFrame()
-        self.jointsDF = pd.DataFrame()
+        self.drywall_frames = []
+        self.waste_frames = []
+        self.joints_frames = []
+        self.timing_frames = []
     def getDrywallDF(self):
-        return self.drywallDF
+        return concatFrames(self.drywall_frames)
     def saveDrywallDF(self, df_drywall):
-        self.drywallDF = self.drywallDF.append(df_drywall, ignore_index=True)
+        self.drywall_frames.append(df_drywall)
     def getWasteDF(self):
-        return self.wasteDF
+        return concatFrames(self.waste_frames)
     def saveWasteDF(self, df_waste):
-        self.wasteDF = self.wasteDF.append(df_waste, ignore_index=True)
+        self.waste_frames.append(df_waste)
     def getJointsDF(self):
-        return self.jointsDF
+        return concatFrames(self.joints_frames)
     def saveJointsDF(self, df_joints):
-        self.jointsDF = self.jointsDF.append(df_joints, ignore_index=True)
+        self.joints_frames.append(df_joints)
+    def getTimingDF(self):
+        return concatFrames(self.timing_frames)
+    def saveTimingDF(self, df_timing):
+        self.timing_frames.append(df_timing)
 
 
 def visual(name, df1, df2, df_doors, df_windows):
 
+    plt, patches, sns = importPlotting()
     sns_colors = sns.hls_palette(10, h=.5)
     
     fig = plt.figure(figsize=(20, 20))
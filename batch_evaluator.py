@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 04:11:52 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+from collections import namedtuple
+import numpy as np
+
+
+#Result of a sheet placed on a row
+REJECTED = 0    #the sheet does not comply with the design rules
+PLACED = 1      #the sheet was placed, the row continues at its right edge
+LAST = 2        #the sheet was cut at the end of the wall, the row is done
+
+#Kinds of candidate pieces
+SHEET = 0       #nominal sheet of the catalog
+OFFCUT = 1      #cut of the offcut inventory
+
+#Min. width of a reusable cut (16in, min. stud frame spacing), as in the
+#reuse strategies of the Robot
+MIN_CUT_WIDTH = 1.33333
+
+
+class CandidateBatch(namedtuple('CandidateBatch', ['kind', 'index', 'status', 'edge_x', 'width', 'loss'])):
+    """
+    The candidate pieces at a robot position, evaluated at once (one array
+    entry per piece): the catalog sheets first, in catalog order, then the
+    eligible offcuts, from the largest to the smallest area.
+
+    kind: SHEET or OFFCUT.
+    index: index of the sheet in the catalog, or key of the offcut in the
+    OffcutInventory.
+    status: REJECTED, PLACED or LAST.
+    edge_x: X location of the right edge of the placed piece (NaN if
+    rejected).
+    width: width of the piece after the cuts (0 if rejected).
+    loss: area of the piece that does not cover the row (ft2, NaN if
+    rejected): its area minus width x row height.
+    """
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self.status)
+
+    def getFeasible(self):
+        """
+        Returns: a boolean array, True for the pieces that can be placed.
+        """
+        return self.status != REJECTED
+
+    def getSheets(self):
+        """
+        Returns: the indexes in the batch of the catalog sheets.
+        """
+        return np.flatnonzero(self.kind == SHEET)
+
+    def getOffcuts(self):
+        """
+        Returns: the indexes in the batch of the offcuts.
+        """
+        return np.flatnonzero(self.kind == OFFCUT)
+
+
+class BatchEvaluator(object):
+    """
+    Evaluation of the pieces that can be placed at a robot position.
+
+    Given the robot position and row, every sheet of the catalog (and every
+    eligible cut of an offcut inventory) is evaluated with the same cuts and
+    design rules as Robot.placeSheet and Robot.reuseCut: the X location of
+    its right edge, the on-stud check, the corner zones of the openings, the
+    staggered joints and its cutting loss, with numpy arrays instead of one
+    piece at a time. A planner can then pick a piece from the feasible ones
+    in a single call. A piece with no stud to the left of its edge is
+    rejected.
+    """
+    def __init__(self, catalog):
+        """
+        catalog: DrywallCatalog with the sheets that can be placed.
+        """
+        self.catalog = catalog
+        sheets = catalog.getSheets()
+        self.sheet_widths = np.array([sheet.getWidth() for sheet in sheets], dtype='float64')
+        self.sheet_areas = np.array([sheet.getNominalArea() for sheet in sheets], dtype='float64')
+        self.sheet_indexes = np.arange(len(sheets))
+
+    def getCatalog(self):
+        return self.catalog
+
+    def getEligibleOffcuts(self, offcuts, row_height, min_area, max_cuts=None):
+        """
+        Find the cuts of an inventory that can be reused on a row: height >=
+        row height, wider than 16in and width >= min_area (as in
+        OffcutInventory.iterLargestPieces) and, if max_cuts is given, cut from
+        a sheet cut less than max_cuts times (as in the Greedy strategy).
+
+        offcuts: the OffcutInventory of the wall.
+
+        Returns: the keys, widths, heights and areas of the cuts (arrays),
+        from the largest to the smallest area.
+        """
+        keys, widths, heights = [], [], []
+        for key in offcuts.iterLargestPieces(row_height, MIN_CUT_WIDTH, min_area):
+            cut = offcuts.getCut(key)
+            if max_cuts is not None:
+                no_cuts = cut.getDrywall().getNoCuts()
+                if not no_cuts < max_cuts:
+                    continue
+            keys.append(key)
+            widths.append(cut.getWidth())
+            heights.append(cut.getHeight())
+        widths = np.array(widths, dtype='float64')
+        heights = np.array(heights, dtype='float64')
+        return np.array(keys, dtype='int64'), widths, heights, widths * heights
+
+    def evaluate(self, robot, position=None, row_height=None, previous_joints=None, offcuts=None, min_area=0, max_cuts=None):
+        """
+        Evaluate every sheet of the catalog, and the eligible cuts of an
+        offcut inventory, placed with their left edge at position.
+
+        robot: the Robot (its wall and row number are used).
+        position: Position of the left edge of the pieces (defaults to the
+        robot position).
+        row_height: height of the row (defaults to the robot row height).
+        previous_joints: joints of the row below (defaults to the joints set
+        on the wall, see getPreviousJoints).
+        offcuts: OffcutInventory whose cuts are also evaluated (see
+        getEligibleOffcuts for min_area and max_cuts).
+
+        Returns: a CandidateBatch.
+        """
+        if position is None:
+            position = robot.getRobotPosition()
+        if row_height is None:
+            row_height = robot.getRowHeight()
+
+        kinds = np.full(len(self.sheet_indexes), SHEET)
+        indexes, widths, areas = self.sheet_indexes, self.sheet_widths, self.sheet_areas
+        if offcuts is not None and offcuts.isEmpty() == False:
+            keys, cut_widths, cut_heights, cut_areas = self.getEligibleOffcuts(offcuts, row_height, min_area, max_cuts)
+            kinds = np.concatenate([kinds, np.full(len(keys), OFFCUT)])
+            indexes = np.concatenate([indexes, keys])
+            widths = np.concatenate([widths, cut_widths])
+            areas = np.concatenate([areas, cut_areas])
+
+        status, edge_x, placed_widths = self.evaluatePieces(robot, position, widths, previous_joints)
+        loss = np.where(status != REJECTED, areas - placed_widths * row_height, np.nan)
+        return CandidateBatch(kinds, indexes, status, edge_x, placed_widths, loss)
+
+    def evaluateSheets(self, robot, position, previous_joints=None):
+        """
+        Evaluate the sheets of the catalog only (see evaluatePieces).
+        """
+        return self.evaluatePieces(robot, position, self.sheet_widths, previous_joints)
+
+    def evaluatePieces(self, robot, position, widths, previous_joints=None):
+        """
+        Work out where pieces of the given widths placed with their left edge
+        at position would end, with the same cuts and design rules as
+        Robot.placeSheet and Robot.reuseCut, without placing them.
+
+        widths: array with the nominal width of each piece.
+
+        Returns
+        (status, edge_x, width): arrays with REJECTED, PLACED or LAST, the X
+        location of the right edge and the width after the cuts of each piece.
+        """
+        wall = robot.wall
+        stud_index = wall.getStudIndex()
+        x, y = position.getX(), position.getY()
+        wall_length = wall.getLength()
+
+        #Right edge of the nominal pieces (rounded like Position)
+        next_x = np.round(x + widths, 4)
+        inside = (next_x >= 0) & (next_x < wall_length) & (y >= 0) & (y < wall.getHeight())
+        on_stud = inside & stud_index.areOnStuds(next_x)
+
+        #Pieces not on a stud are cut at the closest stud on the left, pieces
+        #past the end of the wall are cut at the last stud
+        cut_widths = np.round(stud_index.getDistancesToStudLeftOf(next_x), 4)
+        widths_after_cut = widths - cut_widths
+        width = np.where(on_stud, widths, np.where(inside, widths_after_cut, np.round(widths_after_cut, 4)))
+        edge_x = np.where(on_stud | ~inside, next_x, np.round(x + np.round(widths_after_cut, 4), 4))
+
+        with np.errstate(invalid='ignore'):
+            status = np.where(on_stud | (width > 0), np.where(inside, PLACED, LAST), REJECTED)
+
+        #Design rules of the edges inside the wall (the end of the wall is
+        #exempt from the corner rules)
+        placed = status == PLACED
+        if placed.any():
+            openings = wall.getOpenings()
+            edges = edge_x[placed]
+            broken = np.zeros(len(edges), dtype=bool)
+            corner = edges < (wall_length - 0.125)
+            if openings.getNumDoors() != 0:
+                broken |= corner & openings.areAroundDoorCorners(edges, y)
+            if openings.getNumWindows() != 0:
+                broken |= corner & openings.areAroundWindowCorners(edges, y)
+            joints = self.getPreviousJoints(robot, previous_joints)
+            if len(joints) != 0:
+                joints = np.asarray(joints, dtype='float64')
+                broken |= ((edges[:, None] >= (joints - 0.4)) & (edges[:, None] <= (joints + 0.4))).any(axis=1)
+            status[np.flatnonzero(placed)[broken]] = REJECTED
+
+        rejected = status == REJECTED
+        return status, np.where(rejected, np.nan, edge_x), np.where(rejected, 0, width)
+
+    def getPreviousJoints(self, robot, previous_joints=None):
+        """
+        Returns: the joints the edges must be staggered against: previous_joints
+        if given, otherwise the joints set on the wall for the row below the
+        robot (see staggerJoints).
+        """
+        if previous_joints is not None:
+            return previous_joints
+        joints = robot.wall.getJoints()
+        row_number = robot.getRowNumber()
+        if len(joints) != 0 and (row_number - 1) >= 0:
+            return joints[row_number - 1]
+        return []
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 05:20:43 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import argparse
+import sys
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+
+from data_loader import DataLoader
+from offcut_registry import OffcutRegistry
+from trial_random import TrialRandom, getTrialSeed
+from basic_classes import verticalPossibility
+from simulation import runSimulation_Wall_to_Wall, runSimulation_floor, runSimulationForHouse, createPlanner, METHODS
+from allocation_benchmark import AllocationCounter
+
+#Benchmark cases: single walls of each kind, a floor, the house and the house
+#scaled up (copies of its walls)
+WALL_CASES = ['wall_plain', 'wall_door', 'wall_window', 'wall_vertical']
+CASES = WALL_CASES + ['floor', 'house', 'house_x10', 'house_x100']
+SCALES = {'house': 1, 'house_x10': 10, 'house_x100': 100}
+
+#Columns of the results (placements: sheets placed in one trial)
+RESULT_COLUMNS = ['case', 'walls', 'trials', 'seconds', 'trials_per_sec', 'placements', 'us_per_placement', 'allocations_per_placement', 'bytes_per_placement', 'peak_rss_mb']
+
+HOUSE_NAME = 'Benchmark House'
+
+
+def countOpenings(df, column, wall_name):
+    '''
+    Returns: the number of openings of a wall with coordinates (the door and
+    window dataframes have a row with missing coordinates for the walls
+    without openings).
+    '''
+    return int(df.loc[df['Attribute:ID'] == wall_name, column].notna().sum())
+
+
+def findWall(loader, kind):
+    '''
+    Find a representative wall of the house for a single wall case.
+
+    kind: 'wall_plain' (no openings), 'wall_door' (doors only), 'wall_window'
+    (windows only) or 'wall_vertical' (covered by a single vertical sheet).
+
+    Returns: the row of the wall in the walls dataframe (the longest wall of
+    its kind in horizontal orientation), or None if the house has no wall of
+    this kind.
+    '''
+    catalog = loader.getCatalog()
+    candidates = []
+    for index, wall in loader.getWalls().iterrows():
+        wall_name = wall['Attribute:ID']
+        vertical = verticalPossibility(wall['Attribute:Length'], wall['Attribute:Height'], catalog)
+        doors = countOpenings(loader.getDoors(), 'Doors.Openning.StartPoint.Attribute:X', wall_name)
+        windows = countOpenings(loader.getWindows(), 'Windows.Openning.StartPoint.Attribute:X', wall_name)
+        if kind == 'wall_vertical':
+            matches = vertical
+        else:
+            matches = vertical == False and (doors != 0, windows != 0) == {'wall_plain': (False, False), 'wall_door': (True, False), 'wall_window': (False, True)}[kind]
+        if matches:
+            candidates.append(wall)
+    if len(candidates) == 0:
+        return None
+    if kind == 'wall_vertical':
+        return candidates[0]
+    return max(candidates, key=lambda wall: wall['Attribute:Length'])
+
+
+def scaleHouse(df_walls, df_studs, df_doors, df_windows, factor):
+    '''
+    Scale up a house with copies of its walls: copy k of each floor becomes
+    the floor '<floor> #k', with new wall IDs (and the studs, doors and
+    windows of the copied walls), so each floor keeps its size and the house
+    has factor times more floors and walls.
+
+    Returns: the walls, studs, doors and windows dataframes of the scaled
+    house.
+    '''
+    if factor == 1:
+        return df_walls, df_studs, df_doors, df_windows
+    offset = int(df_walls['Attribute:ID'].max()) + 1
+    frames = []
+    for df in (df_walls, df_studs, df_doors, df_windows):
+        copies = []
+        for k in range(factor):
+            copy = df.copy()
+            if k != 0:
+                copy['Attribute:ID'] = copy['Attribute:ID'] + k * offset
+                copy['Attribute:Level'] = copy['Attribute:Level'].astype(str) + ' #' + str(k)
+            copies.append(copy)
+        frames.append(pd.concat(copies, ignore_index=True))
+    return tuple(frames)
+
+
+def getPeakRSS():
+    '''
+    Returns: the peak resident set size of the process in MB (NaN where the
+    resource module is not available, e.g. on Windows).
+    '''
+    try:
+        import resource
+    except ImportError:
+        return float('nan')
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    #ru_maxrss is in bytes on macOS, in kB elsewhere
+    if sys.platform == 'darwin':
+        return round(peak / 2**20, 1)
+    return round(peak / 2**10, 1)
+
+
+def getCaseRunner(case, loader, max_cuts, min_area, seed, method):
+    '''
+    Returns: a function running a number of trials of a case (None if the
+    house has no wall for the case) and the number of walls of the case.
+    '''
+    catalog = loader.getCatalog()
+    planner = createPlanner(method, catalog)
+    df_walls, df_studs, df_doors, df_windows = loader.getWalls(), loader.getStuds(), loader.getDoors(), loader.getWindows()
+
+    if case in WALL_CASES:
+        wall = findWall(loader, case)
+        if wall is None:
+            return None, 0
+        wall_name = wall['Attribute:ID']
+        stud_df, door_df, window_df = loader.getWallGeometry().getWall(wall_name)
+        def runWall(trials):
+            for trial in range(trials):
+                rng = TrialRandom(getTrialSeed(seed, HOUSE_NAME, wall['Attribute:Level'], trial))
+                runSimulation_Wall_to_Wall(trial, wall_name, wall['Attribute:Length'], wall['Attribute:Height'], stud_df, door_df, window_df,
+                                           pd.DataFrame(), max_cuts, min_area, rng, catalog, planner, None, OffcutRegistry())
+        return runWall, 1
+
+    if case == 'floor':
+        #Floor with the most walls
+        floor_name = df_walls['Attribute:Level'].value_counts().index[0]
+        df_floor = df_walls.loc[df_walls['Attribute:Level'] == floor_name]
+        def runFloor(trials):
+            runSimulation_floor(trials, floor_name, df_floor, df_studs, df_doors, df_windows, max_cuts, min_area, seed=seed, house_name=HOUSE_NAME, catalog=catalog, planner=planner)
+        return runFloor, len(df_floor)
+
+    df_walls, df_studs, df_doors, df_windows = scaleHouse(df_walls, df_studs, df_doors, df_windows, SCALES[case])
+    def runHouse(trials):
+        runSimulationForHouse(trials, HOUSE_NAME, df_walls, df_studs, df_doors, df_windows, max_cuts, min_area, seed=seed, catalog=catalog, planner=planner)
+    return runHouse, len(df_walls)
+
+
+def runCase(case, data_dir=None, trials=3, max_cuts=10, min_area=12, seed=0, method='random'):
+    '''
+    Run a benchmark case: time its trials, then count the value type
+    instances created per sheet placement in one more trial (see
+    AllocationCounter, counting slows the simulation down).
+
+    case: one of CASES.
+    data_dir: directory of the input files (defaults to the simulation
+    directory).
+
+    Returns: dictionary with the RESULT_COLUMNS of the case (None values if
+    the house has no wall for the case).
+    '''
+    loader = DataLoader(data_dir)
+    run, walls = getCaseRunner(case, loader, max_cuts, min_area, seed, method)
+    result = dict.fromkeys(RESULT_COLUMNS)
+    result.update({'case': case, 'walls': walls, 'trials': trials})
+    if run is None:
+        return result
+
+    start = time.perf_counter()
+    run(trials)
+    elapsed = time.perf_counter() - start
+
+    counter = AllocationCounter()
+    with counter:
+        run(1)
+
+    placements = max(counter.getPlacements(), 1)
+    result.update({'seconds': round(elapsed, 3),
+                   'trials_per_sec': round(trials / elapsed, 3) if elapsed > 0 else None,
+                   'placements': counter.getPlacements(),
+                   'us_per_placement': round(elapsed / trials / placements * 1e6, 1),
+                   'allocations_per_placement': round(sum(counter.getCounts().values()) / placements, 2),
+                   'bytes_per_placement': round(sum(counter.getSizes().values()) / placements, 1),
+                   'peak_rss_mb': getPeakRSS()})
+    return result
+
+
+def runSuite(cases=CASES, data_dir=None, trials=3, max_cuts=10, min_area=12, seed=0, method='random', isolate=True):
+    '''
+    Run benchmark cases.
+
+    cases: list of case names (see CASES).
+    trials: number of timed trials of each case (the scaled-up houses run a
+    single trial).
+    isolate: run each case in a new process, so the peak RSS is the one of
+    the case only.
+
+    Returns: a DataFrame with one row per case (RESULT_COLUMNS).
+    '''
+    results = []
+    for case in cases:
+        if case not in CASES:
+            raise ValueError('Unknown benchmark case: ' + str(case))
+        case_trials = 1 if SCALES.get(case, 1) > 1 else trials
+        args = (case, data_dir, case_trials, max_cuts, min_area, seed, method)
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+                results.append(executor.submit(runCase, *args).result())
+        else:
+            results.append(runCase(*args))
+    return pd.DataFrame(results, columns=RESULT_COLUMNS)
+
+
+def main(argv=None):
+    '''
+    Command line entry point: run the benchmark suite and print the results.
+    '''
+    parser = argparse.ArgumentParser(description='Time the wall, floor and house simulation with fixed seeds.')
+    parser.add_argument('--cases', nargs='+', default=CASES, choices=CASES, help='cases to run (default: all)')
+    parser.add_argument('--trials', type=int, default=3, help='number of timed trials per case, 1 for the scaled-up houses (default: 3)')
+    parser.add_argument('--max-cuts', type=int, default=10, help='max. number of times a sheet can be cut (default: 10)')
+    parser.add_argument('--min-area', type=float, default=12, help='min. area of a reusable cut in ft2 (default: 12)')
+    parser.add_argument('--method', default='random', choices=METHODS, help='layout method (default: random)')
+    parser.add_argument('--seed', type=int, default=0, help='base seed of the trials (default: 0)')
+    parser.add_argument('--data-dir', default=None, help='directory of the input files (default: the simulation directory)')
+    parser.add_argument('--no-isolate', action='store_true', help='run every case in this process (the peak RSS is then cumulative)')
+    parser.add_argument('--output', default=None, help='also write the results to this CSV file')
+    args = parser.parse_args(argv)
+
+    results = runSuite(args.cases, args.data_dir, args.trials, args.max_cuts, args.min_area, args.seed, args.method, not args.no_isolate)
+    with pd.option_context('display.max_columns', None, 'display.width', 200):
+        print(results.to_string(index=False))
+    if args.output is not None:
+        results.to_csv(args.output, index=False)
+    return results
+
+
+if __name__ == '__main__':
+    main()
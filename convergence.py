@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:14:08 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import math
+import time
+import pandas as pd
+
+#Two-sided 95% normal quantile, used for the confidence intervals
+Z_95 = 1.959964
+
+
+class RunningStats(object):
+    """
+    Running statistics of the total cutting loss area of a wall (or floor)
+    over the trials: best (lowest) value, mean and a confidence interval of
+    the mean (Welford's algorithm, nothing is kept per trial).
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.best = None
+        self.best_trial = None
+
+    def add(self, value, trial=None):
+        """
+        value: total cutting loss area of a trial (ft2).
+        trial: trial number, kept for the best value.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.best is None or value < self.best:
+            self.best = value
+            self.best_trial = trial
+
+    def getCount(self):
+        return self.count
+
+    def getMean(self):
+        return self.mean
+
+    def getBest(self):
+        return self.best
+
+    def getBestTrial(self):
+        return self.best_trial
+
+    def getStd(self):
+        if self.count < 2:
+            return float('nan')
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def getHalfWidth(self, z=Z_95):
+        """
+        Returns: half width of the confidence interval of the mean (inf with
+        less than 2 trials).
+        """
+        if self.count < 2:
+            return float('inf')
+        return z * self.getStd() / math.sqrt(self.count)
+
+    def getConfidenceInterval(self, z=Z_95):
+        half_width = self.getHalfWidth(z)
+        return self.mean - half_width, self.mean + half_width
+
+
+class ConvergenceMonitor(object):
+    """
+    Decides when the trials of a floor can stop.
+
+    A wall has converged once it has run min_trials trials, the confidence
+    interval of its mean cutting loss is narrower than +- tolerance ft2 and
+    its best cutting loss has not improved by more than tolerance in the last
+    patience trials. This is checked again after every trial: a wall whose
+    best value improves again is no longer converged. A floor has converged
+    when all its walls have and the confidence interval of the floor total
+    is also narrower than +- tolerance.
+
+    The trials also stop when the time budget runs out. The budget is shared
+    by the floors (see startFloor), and every floor runs at least min_trials
+    trials before its time is checked.
+
+    The monitor records the trial count at which each wall converged, so a
+    run can report how many trials each wall actually needed.
+    """
+    def __init__(self, tolerance=None, time_budget=None, min_trials=5, patience=None, z=Z_95):
+        """
+        tolerance: max. half width of the confidence interval (ft2). None to
+        only stop on the time budget.
+        time_budget: max. time of the trials in seconds (None for no limit).
+        min_trials: min. number of trials of a wall before it can converge.
+        patience: trials without improvement of the best value (defaults to
+        min_trials).
+        z: normal quantile of the confidence intervals (95% by default).
+        """
+        self.tolerance = tolerance
+        self.time_budget = time_budget
+        self.min_trials = max(min_trials, 2)
+        self.patience = self.min_trials if patience is None else patience
+        self.z = z
+        self.start_time = None
+        self.deadlines = {}     # floor -> elapsed time at which its share of the budget is used up
+        self.walls = {}         # (floor, wall) -> RunningStats
+        self.floors = {}        # floor -> RunningStats of the floor total
+        self.last_improvement = {}  # (floor, wall) -> trial count of the last improvement
+        self.converged_at = {}  # (floor, wall) -> trial count at convergence
+
+    def start(self):
+        """
+        Start the clock of the time budget.
+        """
+        self.start_time = time.perf_counter()
+
+    def startFloor(self, floor_name, remaining_floors=1):
+        """
+        Give a floor its share of the time budget: the time left split evenly
+        between it and the floors after it (the time a floor does not use is
+        left to the next ones). Starts the clock if it is not running.
+
+        remaining_floors: number of floors still to run, this one included.
+        """
+        if self.start_time is None:
+            self.start()
+        if self.time_budget is None:
+            return
+        elapsed = self.getElapsedTime()
+        self.deadlines[floor_name] = elapsed + max(self.time_budget - elapsed, 0) / max(remaining_floors, 1)
+
+    def getElapsedTime(self):
+        if self.start_time is None:
+            return 0.0
+        return time.perf_counter() - self.start_time
+
+    def isOutOfTime(self, floor_name=None):
+        """
+        Returns: True if the time budget (or the share of the floor, see
+        startFloor) is used up.
+        """
+        if self.time_budget is None:
+            return False
+        return self.getElapsedTime() >= self.deadlines.get(floor_name, self.time_budget)
+
+    def getFloorTrials(self, floor_name):
+        """
+        Returns: the number of trials of the floor added so far.
+        """
+        if floor_name not in self.floors:
+            return 0
+        return self.floors[floor_name].getCount()
+
+    def update(self, floor_name, trial, losses):
+        """
+        Add the results of a trial of a floor.
+
+        losses: list of (wall name, total cutting loss area) of the trial.
+        """
+        for wall_name, loss in losses:
+            key = (floor_name, wall_name)
+            if key not in self.walls:
+                self.walls[key] = RunningStats()
+                self.last_improvement[key] = 0
+            stats = self.walls[key]
+            previous_best = stats.getBest()
+            stats.add(loss, trial)
+            if previous_best is None or previous_best - loss > self.getTolerance():
+                self.last_improvement[key] = stats.getCount()
+            if self.isWallStable(key):
+                if key not in self.converged_at:
+                    self.converged_at[key] = stats.getCount()
+            elif key in self.converged_at:
+                del self.converged_at[key]
+
+        if floor_name not in self.floors:
+            self.floors[floor_name] = RunningStats()
+        self.floors[floor_name].add(round(sum(loss for wall_name, loss in losses), 4), trial)
+
+    def getTolerance(self):
+        return 0 if self.tolerance is None else self.tolerance
+
+    def isWallStable(self, key):
+        if self.tolerance is None:
+            return False
+        stats = self.walls[key]
+        return stats.getCount() >= self.min_trials and \
+            stats.getHalfWidth(self.z) <= self.tolerance and \
+            (stats.getCount() - self.last_improvement[key]) >= self.patience
+
+    def isWallConverged(self, floor_name, wall_name):
+        return (floor_name, wall_name) in self.converged_at
+
+    def isFloorStable(self, floor_name):
+        """
+        Returns: True if the confidence interval of the floor total is within
+        +- tolerance (after min_trials trials).
+        """
+        if self.tolerance is None or floor_name not in self.floors:
+            return False
+        stats = self.floors[floor_name]
+        return stats.getCount() >= self.min_trials and stats.getHalfWidth(self.z) <= self.tolerance
+
+    def isFloorConverged(self, floor_name):
+        """
+        Returns: True if every wall of the floor has converged and the floor
+        total is stable (False before the first trial).
+        """
+        keys = [key for key in self.walls if key[0] == floor_name]
+        return len(keys) != 0 and all(key in self.converged_at for key in keys) and self.isFloorStable(floor_name)
+
+    def isDone(self, floor_name):
+        """
+        Returns: True if the trials of the floor can stop. A floor with less
+        than min_trials trials is never done.
+        """
+        if self.getFloorTrials(floor_name) < self.min_trials:
+            return False
+        return self.isOutOfTime(floor_name) or self.isFloorConverged(floor_name)
+
+    def getWallStats(self, floor_name, wall_name):
+        return self.walls[(floor_name, wall_name)]
+
+    def getFloorStats(self, floor_name):
+        return self.floors[floor_name]
+
+    def getReport(self):
+        """
+        Returns: a DataFrame with one row per wall and one per floor total
+        (wall 'total'): trials run, trials needed to converge (NaN if the wall
+        did not converge), best and mean cutting loss and the confidence
+        interval of the mean.
+        """
+        rows = []
+        for floor_name, floor_stats in self.floors.items():
+            for key, stats in self.walls.items():
+                if key[0] == floor_name:
+                    rows.append(self.getReportRow(floor_name, key[1], stats, self.converged_at.get(key)))
+            converged = self.isFloorConverged(floor_name)
+            trials_needed = max(self.converged_at[key] for key in self.walls if key[0] == floor_name) if converged else None
+            rows.append(self.getReportRow(floor_name, 'total', floor_stats, trials_needed))
+        columns = ['level', 'wall', 'trials', 'trials_needed', 'best', 'best_trial', 'mean', 'ci_low', 'ci_high']
+        return pd.DataFrame(rows, columns=columns)
+
+    def getReportRow(self, floor_name, wall_name, stats, trials_needed):
+        ci_low, ci_high = stats.getConfidenceInterval(self.z)
+        return (floor_name, wall_name, stats.getCount(), float('nan') if trials_needed is None else trials_needed,
+                stats.getBest(), stats.getBestTrial(), round(stats.getMean(), 4), round(ci_low, 4), round(ci_high, 4))
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:25:37 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import os
+import uuid
+import pandas as pd
+
+#Directory holding the input files shipped with the simulation
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+
+#Default input files
+WALLS_FILENAME = 'df_walls.csv'
+STUDS_FILENAME = 'df_studs_new.csv'
+DOORS_FILENAME = 'df_doors_new.csv'
+WINDOWS_FILENAME = 'df_windows_new.csv'
+DRYWALLS_FILENAME = 'df_drywalls.csv'
+
+#Column with the wall of each stud, door and window
+WALL_ID_COLUMN = 'Attribute:ID'
+
+
+class DataLoader(object):
+    """
+    Loads the input dataframes of a house (walls, studs, doors, windows) and
+    the drywall sheets available to the robot.
+
+    Nothing is read when the loader is created: each file is read the first
+    time it is requested and then kept in memory. The drywall sheets are also
+    available as a DrywallCatalog (getCatalog).
+    """
+    def __init__(self, data_dir=None, walls_filename=WALLS_FILENAME, studs_filename=STUDS_FILENAME,
+                 doors_filename=DOORS_FILENAME, windows_filename=WINDOWS_FILENAME, drywalls_filename=DRYWALLS_FILENAME):
+        """
+        data_dir: directory of the input files (defaults to DATA_DIR). Relative
+        filenames are read from this directory.
+        """
+        self.data_dir = DATA_DIR if data_dir is None else data_dir
+        self.filenames = {'walls': walls_filename,
+                          'studs': studs_filename,
+                          'doors': doors_filename,
+                          'windows': windows_filename,
+                          'drywalls': drywalls_filename}
+        self.frames = {}
+        self.catalog = None
+        self.geometry = None
+
+    def getDataDir(self):
+        return self.data_dir
+
+    def getPath(self, name):
+        """
+        Returns: the path of the input file name ('walls', 'studs', 'doors',
+        'windows' or 'drywalls').
+        """
+        return os.path.join(self.data_dir, self.filenames[name])
+
+    def load(self, name):
+        """
+        Returns: the dataframe of the input file name, reading it on first use.
+        """
+        if name not in self.frames:
+            self.frames[name] = pd.read_csv(self.getPath(name))
+        return self.frames[name]
+
+    def isLoaded(self, name):
+        return name in self.frames
+
+    def getWalls(self):
+        return self.load('walls')
+
+    def getStuds(self):
+        return self.load('studs')
+
+    def getDoors(self):
+        return self.load('doors')
+
+    def getWindows(self):
+        return self.load('windows')
+
+    def getDrywalls(self):
+        return self.load('drywalls')
+
+    def getCatalog(self):
+        """
+        Returns: the DrywallCatalog of the drywall sheets, built on first use.
+        """
+        if self.catalog is None:
+            #Imported here, drywall_catalog depends on basic_classes
+            from drywall_catalog import createCatalog
+            self.catalog = createCatalog(self.getDrywalls())
+        return self.catalog
+
+    def getWallGeometry(self):
+        """
+        Returns: the WallGeometry of the studs, doors and windows, built on
+        first use.
+        """
+        if self.geometry is None:
+            self.geometry = WallGeometry(self.getStuds(), self.getDoors(), self.getWindows())
+        return self.geometry
+
+
+def roundNumeric(df, decimals=4):
+    '''
+    Returns: a copy of df with its numeric columns rounded to the given number
+    of decimals (the other columns are left as they are).
+    '''
+    df = df.copy()
+    numeric = df.select_dtypes('number').columns
+    if len(numeric) != 0:
+        df[numeric] = df[numeric].round(decimals)
+    return df
+
+
+class WallGeometry(object):
+    """
+    The studs, doors and windows of each wall, ready to build its Wall.
+
+    The input dataframes are rounded (numeric columns, 4 decimals) and
+    grouped by wall ID once, so the rows of a wall are a dictionary lookup
+    instead of a scan of the whole dataframe on every wall of every trial.
+    The rows of a wall are the same as np.round(df.loc[df['Attribute:ID'] ==
+    wall_name], 4), in file order. The frames are shared: do not modify them.
+
+    Each WallGeometry has a random key, kept by its copies in other
+    processes, that identifies the walls built from it (see WallPool).
+    """
+    def __init__(self, df_studs, df_doors, df_windows, decimals=4):
+        self.key = uuid.uuid4().hex
+        self.frames = {}    # 'studs', 'doors' or 'windows' -> {wall ID: rows}
+        self.empty = {}     # 'studs', 'doors' or 'windows' -> no rows
+        for name, df in (('studs', df_studs), ('doors', df_doors), ('windows', df_windows)):
+            df = roundNumeric(df, decimals)
+            self.frames[name] = {wall_name: rows for wall_name, rows in df.groupby(WALL_ID_COLUMN, sort=False)}
+            self.empty[name] = df.iloc[:0]
+
+    def getKey(self):
+        return self.key
+
+    def getRows(self, name, wall_name):
+        """
+        Returns: the rows of the wall in the dataframe name ('studs', 'doors'
+        or 'windows'), an empty dataframe if it has none.
+        """
+        return self.frames[name].get(wall_name, self.empty[name])
+
+    def getStuds(self, wall_name):
+        return self.getRows('studs', wall_name)
+
+    def getDoors(self, wall_name):
+        return self.getRows('doors', wall_name)
+
+    def getWindows(self, wall_name):
+        return self.getRows('windows', wall_name)
+
+    def getWall(self, wall_name):
+        """
+        Returns: the studs, doors and windows dataframes of the wall.
+        """
+        return self.getStuds(wall_name), self.getDoors(wall_name), self.getWindows(wall_name)
+
+
+#Loader used when no dataframe is given explicitly (created on first use)
+default_loader = None
+
+
+def getDefaultLoader():
+    '''
+    Returns: the default DataLoader (input files in DATA_DIR).
+    '''
+    global default_loader
+    if default_loader is None:
+        default_loader = DataLoader()
+    return default_loader
+
+
+def setDefaultLoader(loader):
+    '''
+    Replace the default DataLoader, e.g. to read the input files from another
+    directory.
+    '''
+    global default_loader
+    default_loader = loader
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:05:19 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+from collections import namedtuple
+
+from basic_classes import Drywall
+
+
+class DrywallSheet(namedtuple('DrywallSheet', ['name', 'height', 'width', 'nominal_area'])):
+    """
+    A nominal drywall sheet of the catalog (immutable).
+
+    height and width keep the values (and types) read from the drywall
+    dataframe; nominal_area is the area of the full sheet.
+    """
+    __slots__ = ()
+
+    def getName(self):
+        return self.name
+    def getHeight(self):
+        return self.height
+    def getWidth(self):
+        return self.width
+    def getNominalArea(self):
+        return self.nominal_area
+    def fitsVertically(self, wall_length, wall_height):
+        """
+        Returns: True if the sheet, turned 90 degrees, covers a wall of
+        wall_length x wall_height with a single piece.
+        """
+        return wall_length <= self.height and wall_height <= self.width
+
+
+class DrywallCatalog(object):
+    """
+    The drywall sheets available to the robot, built once from the drywall
+    dataframe.
+
+    The catalog itself never changes: the robot asks it for a new Drywall
+    instance (with its own ID and cuts) each time a sheet is placed.
+    """
+    def __init__(self, sheets):
+        """
+        sheets: iterable of DrywallSheet, in selection order.
+        """
+        self.sheets = tuple(sheets)
+        self.sheets_by_name = {sheet.name: sheet for sheet in self.sheets}
+        self.vertical_sheets = {}
+
+    def __len__(self):
+        return len(self.sheets)
+
+    def __iter__(self):
+        return iter(self.sheets)
+
+    def getSheets(self):
+        """
+        Returns: a tuple with the sheets of the catalog.
+        """
+        return self.sheets
+
+    def getSheet(self, name):
+        return self.sheets_by_name[name]
+
+    def getNames(self):
+        return [sheet.name for sheet in self.sheets]
+
+    def createDrywall(self, sheet, rng=None):
+        """
+        Create a Drywall instance of a sheet of the catalog, to be placed on a
+        wall.
+
+        sheet: a DrywallSheet.
+        rng: TrialRandom used to generate the drywall ID.
+
+        Returns: a Drywall object.
+        """
+        return Drywall(sheet.name, sheet.height, sheet.width, rng, sheet.nominal_area)
+
+    def createDrywalls(self, rng=None):
+        """
+        Returns: a list with a new Drywall instance of each sheet.
+        """
+        return [self.createDrywall(sheet, rng) for sheet in self.sheets]
+
+    def getVerticalSheets(self, wall_length, wall_height):
+        """
+        Returns: a tuple with the sheets that cover a wall of wall_length x
+        wall_height in a vertical orientation, in catalog order.
+        """
+        key = (wall_length, wall_height)
+        if key not in self.vertical_sheets:
+            self.vertical_sheets[key] = tuple(sheet for sheet in self.sheets if sheet.fitsVertically(wall_length, wall_height))
+        return self.vertical_sheets[key]
+
+    def fitsVertically(self, wall_length, wall_height):
+        """
+        Returns: True if any sheet covers the wall in a vertical orientation.
+        """
+        return len(self.getVerticalSheets(wall_length, wall_height)) != 0
+
+
+def createCatalog(df_drywalls):
+    '''
+    Build a DrywallCatalog from the drywall dataframe.
+
+    df_drywalls: dataframe with the drywall_name, drywall_height and
+    drywall_width of each sheet.
+
+    Returns: a DrywallCatalog.
+    '''
+    sheets = []
+    for name, height, width in zip(df_drywalls['drywall_name'].to_numpy(), df_drywalls['drywall_height'].to_numpy(), df_drywalls['drywall_width'].to_numpy()):
+        sheets.append(DrywallSheet(name, height, width, float(height * width)))
+    return DrywallCatalog(sheets)
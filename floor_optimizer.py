@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 21:06:52 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+from collections import namedtuple
+import numpy as np
+
+from basic_classes import Position, verticalPossibility, getRowsHeight, getFourCoordinates, getRectangleBounds, rectangleIntersection
+from wall_class import Wall
+from robot_class import Robot
+from batch_evaluator import BatchEvaluator, PLACED, LAST
+from wall_planner import BeamPlanner
+from simulation_log import getLogger
+from data_loader import WallGeometry
+
+logger = getLogger('floor')
+
+#Min. width of a reusable cut, as in the reuse strategies of the Robot (16in)
+MIN_CUT_WIDTH = 1.33333
+
+
+class Gap(namedtuple('Gap', ['wall', 'row', 'x', 'y', 'status', 'edge', 'width', 'row_height', 'sheet', 'previous_joints'])):
+    """
+    A new sheet of the layout of a wall: the piece of row, from x to edge, a
+    new sheet would cover (a reused cut can cover it instead).
+    """
+    __slots__ = ()
+
+    def getKey(self):
+        return (self.row, round(self.x, 4))
+
+
+class PlannedCut(namedtuple('PlannedCut', ['wall', 'width', 'height', 'cut_type'])):
+    """
+    A cutting loss expected from the layout of a wall (vertical and
+    horizontal cuts of a sheet or the piece clipped at a door or window).
+    """
+    __slots__ = ()
+
+    def getArea(self):
+        return self.width * self.height
+
+
+def maxWeightMatching(weights, edges):
+    '''
+    Maximum weight matching of a bipartite graph whose weights are on the
+    left vertices (gaps): the gaps are tried from the heaviest and each one is
+    matched through an augmenting path if possible (Kuhn). A gap matched once
+    stays matched, so the greedy order gives the matching of max. weight.
+
+    weights: weight of each left vertex.
+    edges: list with the right vertices (cuts) each left vertex can be
+    matched to, in order of preference.
+
+    Returns: dictionary {left vertex: right vertex}.
+    '''
+    match_right = {}
+
+    def augment(left, visited):
+        for right in edges[left]:
+            if right in visited:
+                continue
+            visited.add(right)
+            if right not in match_right or augment(match_right[right], visited):
+                match_right[right] = left
+                return True
+        return False
+
+    for left in sorted(range(len(weights)), key=lambda i: (-weights[i], i)):
+        if len(edges[left]) != 0:
+            augment(left, set())
+    return {left: right for right, left in match_right.items()}
+
+
+class FloorPlan(object):
+    """
+    Plan of the walls of a floor built by the FloorOptimizer: the order the
+    walls are simulated in, the layout of new sheets of every wall and the
+    cut of an earlier wall assigned to some of its gaps.
+
+    The plan also works as the planner of the simulation: it hands out the
+    planned sheet (getNextSheet) and the assigned cut (findAssignedCut) for
+    the position of the robot, and falls back to the planner it was built
+    with for positions that are not in the plan.
+    """
+    def __init__(self, order, plans, assignments, saving, planner=None):
+        """
+        order: list with the names of the walls, in simulation order.
+        plans: dictionary {wall name: {(row, x): Gap}} with the layout of new
+        sheets of each wall.
+        assignments: dictionary {wall name: {(row, x): PlannedCut}}.
+        saving: nominal area of the sheets replaced by cuts (ft2).
+        planner: RowSolver or BeamPlanner used off the plan (None for random
+        sheets).
+        """
+        self.order = order
+        self.plans = plans
+        self.assignments = assignments
+        self.saving = saving
+        self.planner = planner
+
+    def getOrder(self):
+        return self.order
+
+    def getSaving(self):
+        return self.saving
+
+    def getAssignments(self, wall_name):
+        return self.assignments.get(wall_name, {})
+
+    def getNumAssigned(self):
+        return sum(len(assigned) for assigned in self.assignments.values())
+
+    def getWallKey(self, wall_name):
+        """
+        Returns: a tuple with the planned sheets and the assigned cuts of a
+        wall (e.g. to tell walls with the same plan apart).
+        """
+        gaps = tuple(sorted((key, gap.sheet.getName()) for key, gap in self.plans.get(wall_name, {}).items()))
+        assigned = tuple(sorted((key, tuple(cut)) for key, cut in self.getAssignments(wall_name).items()))
+        return gaps, assigned
+
+    def getPositionKey(self, robot):
+        return (robot.getRowNumber(), round(robot.getRobotPosition().getX(), 4))
+
+    def getNextSheet(self, robot, rows_height=None):
+        """
+        Returns: the planned sheet at the robot position, or the next sheet of
+        the fallback planner (None if there is none).
+        """
+        gap = self.plans.get(robot.wall.getName(), {}).get(self.getPositionKey(robot))
+        if gap is not None:
+            return gap.sheet
+        if self.planner is not None:
+            return self.planner.getNextSheet(robot, rows_height)
+        return None
+
+    def findAssignedCut(self, robot, offcuts):
+        """
+        Returns: the key of the cut of the offcut inventory assigned to the
+        robot position, or None.
+        """
+        planned = self.getAssignments(robot.wall.getName()).get(self.getPositionKey(robot))
+        if planned is None:
+            return None
+        return offcuts.findPiece(planned.height, planned.width, planned.wall)
+
+
+class FloorOptimizer(object):
+    """
+    Floor-level optimizer of the reuse of cutting losses.
+
+    Walls are simulated one after the other and a wall can only reuse the
+    cuts of the walls before it, so the order of the walls matters. The
+    optimizer lays out every wall of the floor with new sheets (BeamPlanner)
+    and works out the cuts each layout leaves (vertical and horizontal cuts
+    and door/window clippings). It then builds the order one wall at a time:
+    the next wall is the one whose gaps can take the largest nominal area of
+    cuts from the walls already ordered (maxWeightMatching, a gap is a new
+    sheet the cut replaces exactly), or if no wall can reuse cuts, the one
+    that leaves the largest area of reusable cuts.
+    """
+    def __init__(self, catalog, min_area=12, planner=None, cost=None):
+        """
+        catalog: DrywallCatalog of the sheets.
+        min_area: min. area of a reusable cut (as in the reuse strategies).
+        planner: BeamPlanner used to lay out the walls (defaults to a beam of
+        width 1, i.e. the best row over the best row below it).
+        cost: LayoutCost of the default planner.
+        """
+        self.catalog = catalog
+        self.min_area = min_area
+        self.planner = BeamPlanner(catalog, 1, cost) if planner is None else planner
+        self.evaluator = BatchEvaluator(catalog)
+
+    def isReusable(self, width, height):
+        #Same filter as OffcutInventory.iterLargestPieces
+        return height > 0 and width > MIN_CUT_WIDTH and width >= self.min_area
+
+    def layoutWall(self, wall):
+        """
+        Lay out a wall with new sheets.
+
+        wall: a Wall object.
+
+        Returns: a list of Gap (empty for walls covered by a single vertical
+        sheet), or None if the wall cannot be laid out.
+        """
+        if verticalPossibility(wall.getLength(), wall.getHeight(), self.catalog) == True:
+            return []
+
+        rows_height = getRowsHeight(wall.getHeight())
+        robot = Robot(wall, catalog=self.catalog)
+        robot.setRowHeight(rows_height[0])
+        plan = self.planner.planWall(robot, rows_height)
+        if plan is None:
+            return None
+
+        gaps = []
+        previous_joints = []
+        for row, row_plan in enumerate(plan.getRows()):
+            x = 0
+            y = 4 * row
+            for sheet, edge, width in zip(row_plan.getSheets(), row_plan.getEdges(), row_plan.getWidths()):
+                status = LAST if wall.isPositionInWall(Position(edge, y)) == False else PLACED
+                gaps.append(Gap(wall.getName(), row, x, y, status, edge, width, rows_height[row], sheet, tuple(previous_joints)))
+                x = edge
+            previous_joints = row_plan.getJoints(wall.getLength())
+        return gaps
+
+    def getCuts(self, wall_name, width, height, sheet_width, sheet_height):
+        """
+        Returns: the reusable vertical and horizontal cuts of a sheet (or of a
+        reused cut) of sheet_width x sheet_height placed as a piece of
+        width x height.
+        """
+        cuts = []
+        vc_width = round(sheet_width - width, 4)
+        hc_height = round(sheet_height - height, 4)
+        if self.isReusable(vc_width, sheet_height):
+            cuts.append(PlannedCut(wall_name, vc_width, sheet_height, 'vertical_cut'))
+        if self.isReusable(width, hc_height):
+            cuts.append(PlannedCut(wall_name, width, hc_height, 'horizontal_cut'))
+        return cuts
+
+    def getClippings(self, wall, gap):
+        """
+        Returns: the reusable pieces clipped from the piece covering a gap at
+        the doors and windows of the wall (see clipperAtOpenings).
+        """
+        openings = wall.getOpenings()
+        subject = getRectangleBounds(getFourCoordinates(Position(gap.x, gap.y), gap.width, gap.row_height))
+        cuts = []
+        for clip, rectangles, cut_type in ((openings.clipDoors(), openings.getDoors(), 'door_clipper'), (openings.clipWindows(), openings.getWindows(), 'window_clipper')):
+            if clip == False or len(rectangles) == 0:
+                continue
+            overlap, origin_x, origin_y, widths, heights = rectangleIntersection(subject, rectangles[:, :4])
+            for i in np.flatnonzero(overlap):
+                width, height = np.round(widths[i], 4), np.round(heights[i], 4)
+                if self.isReusable(width, height):
+                    cuts.append(PlannedCut(wall.getName(), width, height, cut_type))
+        return cuts
+
+    def fitsGap(self, robot, gap, cut):
+        """
+        Returns: True if the cut placed at the gap ends at the edge of the gap
+        (so the rest of the layout does not change) and complies with the
+        design rules.
+        """
+        if cut.height < gap.row_height or cut.width < (gap.width - 0.0625):
+            return False
+        status, edge_x, width = self.evaluator.evaluatePieces(robot, Position(gap.x, gap.y), np.array([cut.width], dtype='float64'), list(gap.previous_joints))
+        if status[0] == LAST or gap.status == LAST:
+            return status[0] == gap.status
+        return status[0] == PLACED and edge_x[0] == round(gap.edge, 4)
+
+    def matchWall(self, robot, gaps, pool, fits):
+        """
+        Assign the cuts of the pool to the gaps of a wall.
+
+        fits: dictionary used as a cache of fitsGap, {(gap, cut): bool}.
+
+        Returns: dictionary {gap index: pool index}.
+        """
+        weights = [gap.sheet.getNominalArea() for gap in gaps]
+        #Smaller cuts are tried first, to keep the large ones for later walls
+        by_area = sorted(range(len(pool)), key=lambda j: (pool[j].getArea(), j))
+        edges = []
+        for gap in gaps:
+            fitting = []
+            for j in by_area:
+                key = (gap, pool[j].width, pool[j].height)
+                if key not in fits:
+                    fits[key] = self.fitsGap(robot, gap, pool[j])
+                if fits[key] == True:
+                    fitting.append(j)
+            edges.append(fitting)
+        return maxWeightMatching(weights, edges)
+
+    def getWallCuts(self, wall, gaps, matching, pool):
+        """
+        Returns: the reusable cuts a wall leaves once its gaps are covered
+        (new sheets or the matched cuts of the pool).
+        """
+        cuts = []
+        for i, gap in enumerate(gaps):
+            if i in matching:
+                used = pool[matching[i]]
+                cuts += self.getCuts(wall.getName(), gap.width, gap.row_height, used.width, used.height)
+            else:
+                cuts += self.getCuts(wall.getName(), gap.width, gap.row_height, gap.sheet.getWidth(), gap.sheet.getHeight())
+            cuts += self.getClippings(wall, gap)
+        return cuts
+
+    def planFloor(self, walls, fallback_planner=None):
+        """
+        Plan the order of the walls of a floor and the cuts reused by each
+        wall.
+
+        walls: list of Wall objects, in their original order.
+        fallback_planner: planner of the FloorPlan for positions off the plan.
+
+        Returns: a FloorPlan.
+        """
+        layouts = {}
+        robots = {}
+        for wall in walls:
+            gaps = self.layoutWall(wall)
+            if gaps is None:
+                logger.info('Wall %s: no layout found, left out of the floor plan', wall.getName())
+                gaps = []
+            layouts[wall.getName()] = gaps
+            robots[wall.getName()] = Robot(wall, catalog=self.catalog)
+
+        order = []
+        assignments = {}
+        saving = 0
+        pool = []
+        fits = {}
+        remaining = list(walls)
+        while len(remaining) != 0:
+            best = None
+            for i, wall in enumerate(remaining):
+                gaps = layouts[wall.getName()]
+                matching = self.matchWall(robots[wall.getName()], gaps, pool, fits)
+                wall_saving = sum(gaps[g].sheet.getNominalArea() for g in matching)
+                wall_cuts = self.getWallCuts(wall, gaps, matching, pool)
+                candidate = (wall_saving, sum(cut.getArea() for cut in wall_cuts), -i)
+                if best is None or candidate > best[0]:
+                    best = (candidate, i, matching, wall_cuts)
+
+            #Walls are compared by content (dictionaries), remove by index
+            candidate, i, matching, wall_cuts = best
+            wall = remaining.pop(i)
+            gaps = layouts[wall.getName()]
+            order.append(wall.getName())
+            assignments[wall.getName()] = {gaps[g].getKey(): pool[j] for g, j in matching.items()}
+            saving += candidate[0]
+            used = set(matching.values())
+            pool = [cut for j, cut in enumerate(pool) if j not in used] + wall_cuts
+            logger.debug('Floor plan: wall %s reuses %s cuts', wall.getName(), len(matching))
+
+        plans = {name: {gap.getKey(): gap for gap in gaps} for name, gaps in layouts.items()}
+        logger.info('Floor plan: %s cuts reused, %s ft2 of new sheets saved', sum(len(a) for a in assignments.values()), saving)
+        return FloorPlan(order, plans, assignments, saving, fallback_planner)
+
+
+def createWalls(df_walls, df_studs, df_doors, df_windows, geometry=None):
+    '''
+    Create the Wall objects of a floor, as in runTrial.
+
+    geometry: WallGeometry with the studs, doors and windows of the walls
+    (built from df_studs, df_doors and df_windows if None).
+
+    Returns: a list of Wall objects, in the order of df_walls.
+    '''
+    if geometry is None:
+        geometry = WallGeometry(df_studs, df_doors, df_windows)
+    walls = []
+    for wall_name, wall_length, wall_height in zip(df_walls['Attribute:ID'], df_walls['Attribute:Length'], df_walls['Attribute:Height']):
+        unique_stud_df, unique_door_df, unique_window_df = geometry.getWall(wall_name)
+        walls.append(Wall(wall_name, wall_length, wall_height, unique_stud_df, unique_door_df, unique_window_df))
+    return walls
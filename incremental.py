@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 00:12:45 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import hashlib
+import os
+import pickle
+import numpy as np
+
+from simulation_log import getLogger
+
+logger = getLogger('incremental')
+
+
+def hashValue(value):
+    return hashlib.sha1(repr(value).encode('utf-8')).hexdigest()
+
+
+def getFrameRows(df):
+    '''
+    Group the rows of an input dataframe by wall in one pass.
+
+    Returns: dictionary {wall name: (columns, rows)} with the columns and a
+    tuple with the rows of each wall (numbers rounded to 4 decimals), in file
+    order. Walls with no rows are not in it.
+    '''
+    columns = sorted(df.columns)
+    frame_rows = {}
+    for wall_name, rows in df[columns].groupby('Attribute:ID', sort=False):
+        values = []
+        for row in rows.itertuples(index=False, name=None):
+            values.append(tuple(round(float(value), 4) if isinstance(value, (float, np.floating)) else value for value in row))
+        frame_rows[wall_name] = (tuple(columns), tuple(values))
+    return frame_rows
+
+
+def getInputFingerprints(df_walls, df_studs, df_doors, df_windows):
+    '''
+    Fingerprint the input rows of every wall (its row in the walls dataframe
+    and its studs, doors and windows).
+
+    Returns: dictionary {(floor name, wall name): hex digest}, in the order
+    of df_walls.
+    '''
+    frames = [(tuple(sorted(df.columns)), getFrameRows(df)) for df in (df_walls, df_studs, df_doors, df_windows)]
+    fingerprints = {}
+    for wall_name, floor_name in zip(df_walls['Attribute:ID'], df_walls['Attribute:Level']):
+        rows = tuple(frame_rows.get(wall_name, (columns, ())) for columns, frame_rows in frames)
+        fingerprints[(floor_name, wall_name)] = hashValue(rows)
+    return fingerprints
+
+
+def getPoolFingerprint(df_waste, registry):
+    '''
+    Returns: the fingerprint (hex digest) of the cuts of a waste dataframe as
+    a wall would receive them: name, wall, type, size and number of cuts of
+    the sheet of each cut, in inventory order.
+    
+    registry: OffcutRegistry with the sheets of the cuts.
+    '''
+    if df_waste.empty:
+        return hashValue(())
+    pool = []
+    for name, wall_name, cut_type, height, width, drywall_ID in zip(df_waste['name'], df_waste['wall'], df_waste['type_of_cut'], df_waste['height'], df_waste['width'], df_waste['drywall_ID']):
+        pool.append((name, int(wall_name), cut_type, round(float(height), 4), round(float(width), 4),
+                     tuple(np.ravel(registry.getSheet(drywall_ID).getNoCuts()).tolist())))
+    return hashValue(tuple(pool))
+
+
+class WallRecord(object):
+    """
+    The results of a wall in a trial, kept to be reused by the next
+    incremental run: the fingerprints of its inputs and of the cuts it
+    received, its drywall and joints dataframes, its cutting loss and the
+    waste dataframe and OffcutRegistry it handed to the next wall.
+
+    The registry is kept pickled: the next walls change the state of the
+    sheets they cut, and each reuse needs its own copy.
+    """
+    def __init__(self, wall_fingerprint, pool_fingerprint, df_drywall, df_joints, loss, df_waste, registry, reused=False):
+        self.wall_fingerprint = wall_fingerprint
+        self.pool_fingerprint = pool_fingerprint
+        self.df_drywall = df_drywall
+        self.df_joints = df_joints
+        self.loss = loss
+        self.df_waste = df_waste
+        self.registry = pickle.dumps(registry, pickle.HIGHEST_PROTOCOL)
+        self.reused = reused
+
+    def matches(self, wall_fingerprint, pool_fingerprint):
+        """
+        Returns: True if the wall had the same inputs and received the same
+        cuts, so its results can be reused.
+        """
+        return self.wall_fingerprint == wall_fingerprint and self.pool_fingerprint == pool_fingerprint
+
+    def getDrywallDF(self):
+        return self.df_drywall
+
+    def getJointsDF(self):
+        return self.df_joints
+
+    def getLoss(self):
+        return self.loss
+
+    def getWasteDF(self):
+        return self.df_waste
+
+    def getRegistry(self):
+        """
+        Returns: a new copy of the OffcutRegistry handed to the next wall.
+        """
+        return pickle.loads(self.registry)
+
+    def isReused(self):
+        return self.reused
+
+    def copyAsReused(self):
+        record = WallRecord.__new__(WallRecord)
+        record.__dict__.update(self.__dict__)
+        record.reused = True
+        return record
+
+
+class IncrementalState(object):
+    """
+    The results of the last run of a house, by floor, trial and wall, used to
+    run the house again after a change of its input dataframes.
+
+    A wall is simulated again if its inputs changed or if the cuts it
+    receives from the walls before it changed (the df_waste chain of a
+    trial). Every other wall reuses its results. Each wall draws its random
+    numbers from its own stream (see getWallSeed), so simulating a wall
+    again does not change the random numbers of the walls after it.
+
+    The results only hold for the same run settings (seed, cuts, area,
+    planner...): a run with other settings starts from scratch.
+    """
+    def __init__(self):
+        self.settings = None
+        self.inputs = {}
+        self.records = {}   # (floor, trial) -> {wall name: WallRecord}
+
+    def checkSettings(self, settings):
+        """
+        Drop the stored results if the run settings changed.
+
+        settings: tuple with the settings of the run.
+        """
+        key = hashValue(settings)
+        if self.settings is not None and self.settings != key:
+            logger.info('Run settings changed, every wall is simulated again')
+            self.records.clear()
+        self.settings = key
+
+    def diff(self, df_walls, df_studs, df_doors, df_windows):
+        """
+        Compare the input dataframes with the ones of the last run and keep
+        the new fingerprints.
+
+        Returns: list of (floor name, wall name) of the walls that are new or
+        changed since the last run.
+        """
+        inputs = getInputFingerprints(df_walls, df_studs, df_doors, df_windows)
+        changed = [key for key, fingerprint in inputs.items() if self.inputs.get(key) != fingerprint]
+        removed = [key for key in self.inputs if key not in inputs]
+        if len(self.inputs) != 0:
+            logger.info('Incremental run: %s walls changed, %s removed', len(changed), len(removed))
+            for floor_name, wall_name in changed:
+                logger.debug('Wall %s (%s) changed', wall_name, floor_name)
+        self.inputs = inputs
+        return changed
+
+    def getRecords(self, floor_name, trial):
+        return self.records.get((floor_name, trial), {})
+
+    def setRecords(self, floor_name, trial, records):
+        """
+        records: dictionary {wall name: WallRecord} of a trial.
+        """
+        self.records[(floor_name, trial)] = records
+
+    def getNumReused(self):
+        return sum(record.isReused() for records in self.records.values() for record in records.values())
+
+    def getNumWalls(self):
+        return sum(len(records) for records in self.records.values())
+
+    def save(self, path):
+        """
+        Save the state to a pickle file (written through a temporary file).
+        """
+        temp_path = path + '.' + str(os.getpid())
+        with open(temp_path, 'wb') as file:
+            pickle.dump(self, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+
+def loadState(path):
+    '''
+    Returns: the IncrementalState saved in path, or a new one if the file
+    does not exist.
+    '''
+    if not os.path.exists(path):
+        return IncrementalState()
+    with open(path, 'rb') as file:
+        return pickle.load(file)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 10:41:37 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import bisect
+import heapq
+import pandas as pd
+
+
+class OffcutInventory(object):
+    """
+    Keeps the pool of reusable cutting losses (offcuts) of a wall.
+
+    Pieces are grouped in height classes (one class per distinct piece height)
+    and, inside each class, kept in a list sorted by width. This allows the
+    reuse strategies to find the largest piece that fits the current row with
+    bisect lookups instead of sorting and scanning the whole waste table on
+    every time-step.
+
+    Each piece is identified by an integer key handed out by add(). The
+    inventory also keeps the waste table row of each piece, so it can be
+    exported as a DataFrame with the same columns as the waste dataframe. The
+    rows only hold plain values, the Cut objects are only kept while the
+    pieces are in the inventory.
+    """
+    def __init__(self, columns, dtypes=None):
+        """
+        columns: waste table column labels. Must include 'name' and 'wall'.
+        dtypes: dictionary {column: dtype} applied when building the DataFrame.
+        """
+        self.columns = list(columns)
+        self.dtypes = dict(dtypes or {})
+        self.name_index = self.columns.index('name')
+        self.rows = {}      # key -> waste table row (insertion ordered)
+        self.pieces = {}    # key -> (height, width, cut)
+        self.names = {}     # cut name -> key
+        self.heights = []   # sorted list of height classes
+        self.classes = {}   # height -> sorted list of (width, -key)
+        self.next_key = 0
+
+    def __len__(self):
+        return len(self.rows)
+
+    def isEmpty(self):
+        return len(self.rows) == 0
+
+    def add(self, row, cut):
+        """
+        Add a piece to the inventory. If a piece with the same name is
+        already stored it is replaced (the last one is kept).
+
+        row: a waste table row, as a sequence in the same order as the columns.
+        cut: the Cut object of the row (see OffcutRegistry.createCut).
+
+        Returns: the key of the new piece.
+        """
+        name = row[self.name_index]
+        if name in self.names:
+            self.remove(self.names[name])
+
+        height = cut.getHeight()
+        width = cut.getWidth()
+        key = self.next_key
+        self.next_key += 1
+
+        self.rows[key] = tuple(row)
+        self.pieces[key] = (height, width, cut)
+        self.names[name] = key
+
+        if height not in self.classes:
+            bisect.insort(self.heights, height)
+            self.classes[height] = []
+        bisect.insort(self.classes[height], (width, -key))
+        return key
+
+    def remove(self, key):
+        """
+        Remove the piece with the given key from the inventory.
+        """
+        height, width, cut = self.pieces.pop(key)
+        row = self.rows.pop(key)
+        del self.names[row[self.name_index]]
+
+        pieces = self.classes[height]
+        i = bisect.bisect_left(pieces, (width, -key))
+        del pieces[i]
+        if len(pieces) == 0:
+            del self.classes[height]
+            del self.heights[bisect.bisect_left(self.heights, height)]
+
+    def clear(self):
+        self.rows.clear()
+        self.pieces.clear()
+        self.names.clear()
+        self.classes.clear()
+        del self.heights[:]
+
+    def getCut(self, key):
+        return self.pieces[key][2]
+
+    def getRow(self, key):
+        return self.rows[key]
+
+    def widthBounds(self, pieces, min_width, min_area):
+        """
+        Returns the index of the first piece in a height class with
+        width > min_width and width >= min_area (see Cut.compliesArea).
+        """
+        lo = bisect.bisect_right(pieces, (min_width, float('inf')))
+        return max(lo, bisect.bisect_left(pieces, (min_area, -float('inf'))))
+
+    def iterLargestPieces(self, min_height, min_width, min_area):
+        """
+        Iterate over the pieces with height >= min_height, width > min_width
+        and width >= min_area, from the largest to the smallest area. Pieces
+        with the same area are returned in the order they were added.
+
+        Do not add or remove pieces while iterating.
+
+        Returns: a generator of keys.
+        """
+        heap = []
+        for height in self.heights[bisect.bisect_left(self.heights, min_height):]:
+            pieces = self.classes[height]
+            lo = self.widthBounds(pieces, min_width, min_area)
+            i = len(pieces) - 1
+            if i >= lo:
+                width, neg_key = pieces[i]
+                heap.append((-(height * width), -neg_key, height, i, lo))
+        heapq.heapify(heap)
+
+        while len(heap) != 0:
+            neg_area, key, height, i, lo = heapq.heappop(heap)
+            yield key
+            i -= 1
+            if i >= lo:
+                width, neg_key = self.classes[height][i]
+                heapq.heappush(heap, (-(height * width), -neg_key, height, i, lo))
+
+    def findLargestOnStud(self, position, min_height, min_width, min_area, studs_locationX):
+        """
+        Find the largest piece (by area) with height >= min_height,
+        width > min_width and width >= min_area whose right edge lands on a
+        stud (stud X +- 0.0625') when its left edge is placed at position.
+
+        position: a Position object (current robot position).
+        studs_locationX: iterable with the X location of the studs.
+
+        Returns: the key of the piece, or None if no piece lands on a stud.
+        """
+        x = position.getX()
+        best = None
+        for height in self.heights[bisect.bisect_left(self.heights, min_height):]:
+            pieces = self.classes[height]
+            lo = self.widthBounds(pieces, min_width, min_area)
+            for stud_x in studs_locationX:
+                # Widths that would put the edge within the stud (small
+                # margin, candidates are checked exactly below).
+                a = max(lo, bisect.bisect_left(pieces, (stud_x - 0.0625 - x - 0.0001, -float('inf'))))
+                b = bisect.bisect_right(pieces, (stud_x + 0.0625 - x + 0.0001, float('inf')))
+                for i in range(b - 1, a - 1, -1):
+                    width, neg_key = pieces[i]
+                    next_x = position.getNewPosition(width, 0).getX()
+                    if (stud_x - 0.0625) <= next_x <= (stud_x + 0.0625):
+                        candidate = (height * width, neg_key)
+                        if best is None or candidate > best:
+                            best = candidate
+                        break
+        if best is None:
+            return None
+        return -best[1]
+
+    def findPiece(self, height, width, wall=None):
+        """
+        Find a piece with the given height and width (+- 0.0001), e.g. a cut
+        assigned to a gap by the FloorOptimizer.
+
+        wall: if given, only pieces cut on this wall are considered.
+
+        Returns: the key of the first piece added that matches, or None.
+        """
+        wall_index = self.columns.index('wall')
+        best = None
+        lo = bisect.bisect_left(self.heights, height - 0.0001)
+        hi = bisect.bisect_right(self.heights, height + 0.0001)
+        for piece_height in self.heights[lo:hi]:
+            pieces = self.classes[piece_height]
+            a = bisect.bisect_left(pieces, (width - 0.0001, -float('inf')))
+            b = bisect.bisect_right(pieces, (width + 0.0001, float('inf')))
+            for piece_width, neg_key in pieces[a:b]:
+                if wall is not None and self.rows[-neg_key][wall_index] != wall:
+                    continue
+                if best is None or -neg_key < best:
+                    best = -neg_key
+        return best
+
+    def toDataFrame(self):
+        """
+        Returns: a DataFrame with the waste table rows of the pieces, in the
+        order they were added.
+        """
+        df = pd.DataFrame.from_records(list(self.rows.values()), columns=self.columns)
+        for column, dtype in self.dtypes.items():
+            df[column] = df[column].astype(dtype)
+        return df
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 02:14:36 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+from basic_classes import Cut, Position
+
+
+class SheetRecord(object):
+    """
+    The state of a sheet shared by the offcuts cut from it: its ID and nominal
+    area, the number of times it has been cut and the random streams the
+    names of its new cuts are drawn from.
+
+    It stands in for the Drywall object as the parent of the offcuts in the
+    waste table (see Cut.getDrywall), so the Drywall object, its cuts and its
+    list of cutting losses are not kept once its wall is done.
+    """
+    __slots__ = ('ID', 'nominal_area', 'no_cuts', 'rng')
+    def __init__(self, ID, nominal_area, no_cuts=0, rng=None):
+        self.ID = ID
+        self.nominal_area = nominal_area
+        self.no_cuts = no_cuts
+        self.rng = rng
+    def getID(self):
+        return self.ID
+    def getNominalArea(self):
+        return self.nominal_area
+    def getNoCuts(self):
+        return self.no_cuts
+    def setNoCuts(self, number):
+        self.no_cuts = number
+    def getRandom(self):
+        return self.rng
+
+
+class OffcutRegistry(object):
+    """
+    ID-addressed registry of the sheets the offcuts of a trial were cut from.
+
+    The waste table only holds plain values: the name of each offcut, the ID
+    of its sheet (drywall_ID), its size, position and number of cuts. The
+    state shared by the offcuts of a sheet is kept here, by drywall ID, and a
+    wall rebuilds the Cut objects of its inventory from the rows of the table
+    (createCut). The waste table can then be copied, pickled or sent to
+    another process as plain data.
+
+    A trial passes the same registry from wall to wall with the waste table.
+    Sheets with no offcut left in the table are dropped (prune), so the
+    registry only grows with the waste table.
+    """
+    def __init__(self):
+        self.sheets = {}    # drywall ID -> SheetRecord
+
+    def __len__(self):
+        return len(self.sheets)
+
+    def __contains__(self, drywall_ID):
+        return drywall_ID in self.sheets
+
+    def addSheet(self, drywall):
+        """
+        Register the sheet of a cut, if it is not registered yet.
+
+        drywall: the Drywall (or SheetRecord) the cut comes from.
+
+        Returns: the SheetRecord of the sheet.
+        """
+        ID = drywall.getID()
+        if ID not in self.sheets:
+            self.sheets[ID] = SheetRecord(ID, drywall.getNominalArea(), drywall.getNoCuts(), drywall.getRandom())
+        return self.sheets[ID]
+
+    def getSheet(self, drywall_ID):
+        """
+        Returns: the SheetRecord of the sheet with the given drywall ID.
+        """
+        if drywall_ID not in self.sheets:
+            raise KeyError('Sheet ' + str(drywall_ID) + ' is not in the offcut registry (pass the registry of the trial with its waste dataframe)')
+        return self.sheets[drywall_ID]
+
+    def createCut(self, drywall_ID, name, height, width, cut_type, x, y, no_cuts, wall_name):
+        """
+        Rebuild the Cut of a waste table row, on the state of its sheet.
+
+        Returns: a Cut object with the name, size, position and number of cuts
+        of the row.
+        """
+        cut = Cut(self.getSheet(drywall_ID), float(width), float(height), cut_type, name, no_cuts)
+        cut.setPosition(Position(x, y))
+        cut.setWallName(wall_name)
+        return cut
+
+    def prune(self, drywall_IDs):
+        """
+        Drop the sheets that are not in drywall_IDs (e.g. the drywall_ID
+        column of the waste dataframe left by a wall).
+        """
+        keep = set(drywall_IDs)
+        for ID in [ID for ID in self.sheets if ID not in keep]:
+            del self.sheets[ID]
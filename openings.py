@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:02:48 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import numpy as np
+
+#Opening kinds
+DOOR = 0
+WINDOW = 1
+
+#Column labels of the openings in the door and window dataframes
+DOOR_COLUMNS = ['Doors.Openning.StartPoint.Attribute:X', 'Doors.Openning.StartPoint.Attribute:Y', 'Doors.Openning.EndPoint.Attribute:X', 'Doors.Openning.EndPoint.Attribute:Y']
+WINDOW_COLUMNS = ['Windows.Openning.StartPoint.Attribute:X', 'Windows.Openning.StartPoint.Attribute:Y', 'Windows.Openning.EndPoint.Attribute:X', 'Windows.Openning.EndPoint.Attribute:Y']
+
+
+def openingRectangles(df, columns, kind):
+    '''
+    Read the openings of a door or window dataframe as an array of
+    rectangles.
+
+    df: door or window dataframe of a wall.
+    columns: start X, start Y, end X and end Y column labels.
+    kind: DOOR or WINDOW.
+
+    Returns: a float array with one row (x0, y0, x1, y1, kind) per opening.
+    '''
+    rects = np.empty((len(df), 5), dtype='float64')
+    if len(df) != 0:
+        rects[:, :4] = df[columns].to_numpy(dtype='float64')
+    rects[:, 4] = kind
+    return rects
+
+
+class Openings(object):
+    """
+    The door and window openings of a wall, stored as a compact float array
+    of rectangles (x0, y0, x1, y1, kind), in the same order as the rows of
+    the door and window dataframes.
+
+    Built once per wall, it also precomputes the corner exclusion zones used
+    by isEdgeAroundDoorOpeningCorner and isEdgeAroundWindowOpeningCorner so
+    that a candidate edge is checked against every opening at once.
+    """
+    def __init__(self, doors_df, windows_df):
+        """
+        doors_df: door dataframe of the wall.
+        windows_df: window dataframe of the wall.
+        """
+        self.rects = np.concatenate([openingRectangles(doors_df, DOOR_COLUMNS, DOOR),
+                                     openingRectangles(windows_df, WINDOW_COLUMNS, WINDOW)])
+        self.doors = self.rects[self.rects[:, 4] == DOOR]
+        self.windows = self.rects[self.rects[:, 4] == WINDOW]
+
+        # Openings with a missing coordinate are ignored by the clippers
+        self.clip_doors = not np.isnan(self.doors[:, 0]).any()
+        self.clip_windows = not np.isnan(self.windows[:, 0]).any()
+
+        # Corner exclusion zones (x - 1 to x + 1 around the start of a door,
+        # x - 0.125 to x + 1 around its end; open intervals)
+        x0, x1 = self.doors[:, 0], self.doors[:, 2]
+        self.door_zones = (x0 - 1, x0 + 1, x1 - 0.125, x1 + 1)
+
+        # (x - 1 to x + 0.125 around the start of a window, x - 0.125 to
+        # x + 0.8 around its end; closed intervals)
+        x0, x1 = self.windows[:, 0], self.windows[:, 2]
+        self.window_zones = (x0 - 1, x0 + 0.125, x1 - 0.125, x1 + 0.8)
+
+    def getRectangles(self):
+        return self.rects
+
+    def getDoors(self):
+        return self.doors
+
+    def getWindows(self):
+        return self.windows
+
+    def getNumDoors(self):
+        return len(self.doors)
+
+    def getNumWindows(self):
+        return len(self.windows)
+
+    def clipDoors(self):
+        """
+        Returns: True if the door openings can be clipped from the drywall
+        sheets (no missing coordinates), False otherwise.
+        """
+        return self.clip_doors
+
+    def clipWindows(self):
+        return self.clip_windows
+
+    def getDoorInCornerZone(self, x):
+        """
+        Find the first door whose corner exclusion zone contains x.
+
+        Returns: the door rectangle (x0, y0, x1, y1, kind), or None.
+        """
+        a, b, c, d = self.door_zones
+        mask = ((a < x) & (x < b)) | ((c < x) & (x < d))
+        if not mask.any():
+            return None
+        return self.doors[mask.argmax()]
+
+    def getWindowInCornerZone(self, x):
+        """
+        Find the first window whose corner exclusion zone contains x.
+
+        Returns: the window rectangle (x0, y0, x1, y1, kind), or None.
+        """
+        a, b, c, d = self.window_zones
+        mask = ((a <= x) & (x <= b)) | ((c <= x) & (x <= d))
+        if not mask.any():
+            return None
+        return self.windows[mask.argmax()]
+
+    def areAroundDoorCorners(self, xs, y):
+        """
+        Vectorized door corner rule of isEdgeAroundDoorOpeningCorner (without
+        the exception at the end of the wall): for each edge, the first door
+        whose corner exclusion zone contains it is checked against the row
+        starting at y.
+
+        xs: array with edge locations in the X axis.
+        y: Y location of the row.
+
+        Returns: a boolean array, True where the edge breaks the rule.
+        """
+        a, b, c, d = self.door_zones
+        xs = np.asarray(xs, dtype='float64')[:, None]
+        mask = ((a < xs) & (xs < b)) | ((c < xs) & (xs < d))
+        return self.isCornerRowInOpenings(mask, self.doors, y)
+
+    def areAroundWindowCorners(self, xs, y):
+        """
+        Vectorized window corner rule of isEdgeAroundWindowOpeningCorner (see
+        areAroundDoorCorners).
+        """
+        a, b, c, d = self.window_zones
+        xs = np.asarray(xs, dtype='float64')[:, None]
+        mask = ((a <= xs) & (xs <= b)) | ((c <= xs) & (xs <= d))
+        return self.isCornerRowInOpenings(mask, self.windows, y)
+
+    def isCornerRowInOpenings(self, mask, rects, y):
+        """
+        mask: boolean array (edges x openings) of the corner zones containing
+        each edge.
+        rects: the door or window rectangles.
+
+        Returns: a boolean array, True where the first opening around the edge
+        overlaps the row starting at y.
+        """
+        if len(rects) == 0:
+            return np.zeros(len(mask), dtype=bool)
+        first = rects[mask.argmax(axis=1)]
+        y0, y1 = first[:, 1], first[:, 3]
+        return mask.any(axis=1) & ~(((y < y0) & (y + 4 < y0)) | (y > y1))
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 07:12:40 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import functools
+import time
+import pandas as pd
+
+#Phases of a trial
+SHEET_SELECTION = 'sheet_selection'     #new sheets: selection and placement
+REUSE = 'reuse'                         #reuse of the cutting losses
+STUD_LOOKUP = 'stud_lookup'             #stud queries (StudIndex)
+CORNER_CHECK = 'corner_check'           #door and window opening corners
+STAGGER_CHECK = 'stagger_check'         #staggered joints
+CLIPPER = 'clipper'                     #door and window clippers
+DATAFRAME_UPDATE = 'dataframe_update'   #drywall and joints dataframes
+WASTE_BOOKKEEPING = 'waste_bookkeeping' #waste dataframe and offcut inventory
+OTHER = 'other'                         #rest of the wall simulation
+PHASES = [SHEET_SELECTION, REUSE, STUD_LOOKUP, CORNER_CHECK, STAGGER_CHECK, CLIPPER, DATAFRAME_UPDATE, WASTE_BOOKKEEPING, OTHER]
+
+#Columns of the timing dataframe (one row per wall and phase)
+TIMING_COLUMNS = ['simulation', 'floor', 'wall', 'phase', 'calls', 'ns']
+
+
+class PhaseTimer(object):
+    """
+    Call counts and cumulative time (ns) of the phases of the simulation.
+
+    The functions of a phase are wrapped with timed(phase). While the timer
+    is disabled (default) the wrapper only checks the enabled flag and calls
+    the function. When it is enabled, the time of each call is added to its
+    phase, minus the time spent in the timed calls it makes (self time), so
+    the times of the phases add up to the time of the wall. A timed call made
+    directly inside a call of the same phase (e.g. getDistanceToStudLeftOf
+    calling getStudLeftOf) is part of the outer call: it is not counted
+    again.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.calls = {}
+        self.ns = {}
+        self.stack = []     # [phase, start ns, ns of the timed calls made] per active call
+
+    def isEnabled(self):
+        return self.enabled
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        del self.stack[:]
+
+    def isInPhase(self, phase):
+        """
+        Returns: True if the innermost active timed call is of this phase.
+        """
+        return len(self.stack) != 0 and self.stack[-1][0] == phase
+
+    def start(self, phase):
+        self.stack.append([phase, time.perf_counter_ns(), 0])
+
+    def stop(self):
+        phase, start, inner = self.stack.pop()
+        elapsed = time.perf_counter_ns() - start
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self.ns[phase] = self.ns.get(phase, 0) + elapsed - inner
+        if len(self.stack) != 0:
+            self.stack[-1][2] += elapsed
+
+    def getCounters(self):
+        """
+        Returns: dictionary {phase: (calls, ns)} of the phases timed since the
+        last reset.
+        """
+        return {phase: (self.calls[phase], self.ns[phase]) for phase in PHASES if phase in self.calls}
+
+    def reset(self):
+        self.calls.clear()
+        self.ns.clear()
+
+    def collect(self, simulation, floor_name, wall_name):
+        """
+        Take the counters of a wall and reset them.
+
+        Returns: a DataFrame with the TIMING_COLUMNS, one row per phase.
+        """
+        rows = [(simulation, floor_name, wall_name, phase, calls, ns) for phase, (calls, ns) in self.getCounters().items()]
+        self.reset()
+        return pd.DataFrame(rows, columns=TIMING_COLUMNS)
+
+
+#Phase timer shared by the simulation (disabled until enableTiming is called)
+timer = PhaseTimer()
+
+
+def enableTiming():
+    '''
+    Start timing the phases of the simulation (in this process).
+    '''
+    timer.reset()
+    timer.enable()
+
+
+def disableTiming():
+    timer.disable()
+
+
+def timed(phase):
+    '''
+    Decorator adding the calls of a function to a phase of the timer.
+    '''
+    def decorate(function):
+        @functools.wraps(function)
+        def timedFunction(*args, **kwargs):
+            if not timer.enabled or timer.isInPhase(phase):
+                return function(*args, **kwargs)
+            timer.start(phase)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                timer.stop()
+        return timedFunction
+    return decorate
+
+
+def summarizeTiming(df_timing, level='house'):
+    '''
+    Roll up the timing dataframe of the walls.
+
+    df_timing: DataFrame with the TIMING_COLUMNS (e.g. House.getTimingDF).
+    level: 'wall', 'floor' or 'house'.
+
+    Returns: a DataFrame with the calls, time (ms) and share of the time of
+    each phase, per wall (and floor), per floor or for the house, summed over
+    the trials.
+    '''
+    keys = {'wall': ['floor', 'wall'], 'floor': ['floor'], 'house': []}[level]
+    columns = keys + ['phase', 'calls', 'ms', 'share']
+    if len(df_timing) == 0:
+        return pd.DataFrame(columns=columns)
+    df = df_timing.groupby(keys + ['phase'], sort=False, as_index=False)[['calls', 'ns']].sum()
+    df['ms'] = (df['ns'] / 1e6).round(3)
+    if len(keys) == 0:
+        total = df['ns'].sum()
+    else:
+        total = df.groupby(keys, sort=False)['ns'].transform('sum')
+    df['share'] = (df['ns'] / total).round(4)
+    order = {phase: i for i, phase in enumerate(PHASES)}
+    df = df.sort_values(keys + ['phase'], key=lambda column: column.map(order) if column.name == 'phase' else column, kind='stable')
+    return df[columns].reset_index(drop=True)
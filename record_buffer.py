@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:12:05 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import pandas as pd
+
+
+class RecordBuffer(object):
+    """
+    An append-only columnar table used to collect simulation results
+    (placements, waste pieces and joints).
+
+    Each column is kept as a plain Python list, so appending a row is amortized
+    O(1). The rows are only turned into a pandas DataFrame when toDataFrame()
+    is called; numeric columns are cast to the dtypes given at construction
+    instead of the object/string dtypes produced by np.array([[...]]).
+    """
+    def __init__(self, columns, dtypes=None):
+        """
+        columns: list of column labels, in output order.
+        dtypes: dictionary {column: dtype} applied when building the DataFrame.
+        """
+        self.columns = list(columns)
+        self.dtypes = dict(dtypes or {})
+        self.data = {column: [] for column in self.columns}
+        self.length = 0
+        self.frame = None
+
+    def __len__(self):
+        return self.length
+
+    def isEmpty(self):
+        return self.length == 0
+
+    def getColumns(self):
+        return self.columns
+
+    def append(self, row):
+        """
+        Append a single row.
+
+        row: a sequence of values in the same order as the columns.
+        """
+        for column, value in zip(self.columns, row):
+            self.data[column].append(value)
+        self.length += 1
+        self.frame = None
+
+    def extend(self, rows):
+        """
+        Append several rows.
+
+        rows: an iterable of sequences, each in the same order as the columns.
+        """
+        for row in rows:
+            self.append(row)
+
+    def appendBuffer(self, other):
+        """
+        Append every row of another RecordBuffer with the same columns.
+        """
+        for column in self.columns:
+            self.data[column].extend(other.data[column])
+        self.length += other.length
+        self.frame = None
+
+    def clear(self):
+        for column in self.columns:
+            del self.data[column][:]
+        self.length = 0
+        self.frame = None
+
+    def iterRows(self):
+        """
+        Returns: an iterator of row tuples, in the same order as the columns.
+        """
+        return zip(*[self.data[column] for column in self.columns])
+
+    def getColumn(self, column):
+        """
+        Returns the list holding the values of column. Do not modify it
+        directly, use setValue() instead.
+        """
+        return self.data[column]
+
+    def getValue(self, index, column):
+        return self.data[column][index]
+
+    def setValue(self, index, column, value):
+        self.data[column][index] = value
+        self.frame = None
+
+    def findRows(self, column, value):
+        """
+        Returns the list of row indexes where column == value.
+        """
+        return [i for i, v in enumerate(self.data[column]) if v == value]
+
+    def dropWhere(self, column, value):
+        """
+        Remove every row where column == value.
+        """
+        keep = [i for i, v in enumerate(self.data[column]) if v != value]
+        if len(keep) == self.length:
+            return
+        for c in self.columns:
+            values = self.data[c]
+            self.data[c] = [values[i] for i in keep]
+        self.length = len(keep)
+        self.frame = None
+
+    def toDataFrame(self):
+        """
+        Build (and cache until the next change) a DataFrame with the buffered
+        rows.
+
+        Returns: a pandas DataFrame.
+        """
+        if self.frame is None:
+            df = pd.DataFrame(self.data, columns=self.columns)
+            for column, dtype in self.dtypes.items():
+                df[column] = df[column].astype(dtype)
+            self.frame = df
+        return self.frame
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 01:03:27 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import os
+from urllib.parse import quote
+import pandas as pd
+
+from wall_class import DRYWALL_COLUMNS, DRYWALL_DTYPES, WASTE_COLUMNS, WASTE_DTYPES, JOINTS_COLUMNS, JOINTS_DTYPES
+
+#Result tables: columns and dtypes. The cuts are stored by name, None if there
+#is no cut
+CUT_COLUMNS = ['vertical_cut', 'horizontal_cut', 'door_clipper', 'window_clipper']
+TABLES = {'drywall': (DRYWALL_COLUMNS, DRYWALL_DTYPES),
+          'waste': (WASTE_COLUMNS, WASTE_DTYPES),
+          'joints': (JOINTS_COLUMNS, JOINTS_DTYPES)}
+
+#Partition columns, from the outermost directory
+PARTITIONS = ['house', 'floor', 'trial']
+
+
+def importArrow():
+    '''
+    Import pyarrow (only needed to write or read Parquet results).
+
+    Returns: the pyarrow, pyarrow.parquet and pyarrow.dataset modules.
+    '''
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise ImportError('The Parquet result store needs pyarrow (pip install pyarrow)')
+    return pa, pq, ds
+
+
+def getCutID(value):
+    '''
+    Returns: the name of a cut, None for the 0 or NaN used when there is no
+    cut.
+    '''
+    if isinstance(value, str):
+        return value
+    return None
+
+
+def toStorableFrame(df, table):
+    '''
+    Convert a result dataframe to the columns and dtypes of a table: cut
+    columns with None if there is no cut, numeric columns with their numeric
+    dtypes and the other columns as strings.
+
+    table: 'drywall', 'waste' or 'joints'.
+    '''
+    columns, dtypes = TABLES[table]
+    df = df.reindex(columns=columns).copy()
+    for column in columns:
+        if column in CUT_COLUMNS:
+            df[column] = df[column].map(getCutID).astype('object')
+        elif column in dtypes:
+            df[column] = df[column].astype(dtypes[column])
+        else:
+            df[column] = df[column].map(lambda value: None if pd.isna(value) else str(value)).astype('object')
+    return df.reset_index(drop=True)
+
+
+class ResultStore(object):
+    """
+    Parquet store of the result tables (drywall, waste and joints) of the
+    simulation, partitioned by house, floor and trial:
+
+        root/<table>/house=<house>/floor=<floor>/trial=<trial>/part-0.parquet
+
+    The simulation writes each trial as soon as it is done (see
+    simulation.createStoreWriter) and does not keep its tables, so a batch
+    never holds the tables of a whole run in memory. Writing a trial again
+    replaces it.
+
+    Needs pyarrow (imported on first use).
+    """
+    def __init__(self, root):
+        """
+        root: directory of the store (created if needed).
+        """
+        self.root = root
+
+    def getRoot(self):
+        return self.root
+
+    def getPartitionPath(self, table, house_name, floor_name, trial):
+        parts = [table] + ['%s=%s' % (name, quote(str(value), safe='')) for name, value in zip(PARTITIONS, (house_name, floor_name, trial))]
+        return os.path.join(self.root, *parts)
+
+    def writeTable(self, df, table, house_name, floor_name, trial):
+        """
+        Write the rows of a table of one trial (replacing the ones written
+        before). Empty tables are not written.
+        """
+        pa, pq, ds = importArrow()
+        if len(df) == 0:
+            return
+        path = self.getPartitionPath(table, house_name, floor_name, trial)
+        os.makedirs(path, exist_ok=True)
+        arrow_table = pa.Table.from_pandas(toStorableFrame(df, table), preserve_index=False)
+        #Write to a temporary file first, readers may be scanning the store
+        temp_path = os.path.join(path, 'part-0.parquet.' + str(os.getpid()))
+        pq.write_table(arrow_table, temp_path)
+        os.replace(temp_path, os.path.join(path, 'part-0.parquet'))
+
+    def writeTrial(self, house_name, floor_name, trial, drywall_frames, joints_frames, df_waste):
+        """
+        Write the tables of one trial (the result of runTrial).
+
+        drywall_frames, joints_frames: lists with the dataframes of each wall.
+        df_waste: waste dataframe left after the last wall.
+        """
+        frames = {'drywall': drywall_frames, 'joints': joints_frames, 'waste': [df_waste]}
+        for table, table_frames in frames.items():
+            table_frames = [df for df in table_frames if len(df) != 0]
+            if len(table_frames) != 0:
+                self.writeTable(pd.concat(table_frames, ignore_index=True), table, house_name, floor_name, trial)
+
+    def read(self, table, house_name=None, floor_name=None, trials=None, columns=None):
+        """
+        Read a table of the store.
+
+        table: 'drywall', 'waste' or 'joints'.
+        house_name, floor_name: only read this house or floor.
+        trials: only read these trial numbers (list).
+        columns: only read these columns (the partition columns are always
+        added).
+
+        Returns: a DataFrame with the rows of the table and the house, floor
+        and trial columns, empty if nothing was written.
+        """
+        pa, pq, ds = importArrow()
+        path = os.path.join(self.root, table)
+        table_columns = TABLES[table][0]
+        if not os.path.isdir(path):
+            return pd.DataFrame(columns=table_columns + PARTITIONS)
+
+        schema = pa.schema([('house', pa.string()), ('floor', pa.string()), ('trial', pa.int64())])
+        dataset = ds.dataset(path, format='parquet', partitioning=ds.partitioning(schema, flavor='hive'))
+        condition = None
+        for expression in [None if house_name is None else ds.field('house') == str(house_name),
+                           None if floor_name is None else ds.field('floor') == str(floor_name),
+                           None if trials is None else ds.field('trial').isin(list(trials))]:
+            if expression is not None:
+                condition = expression if condition is None else condition & expression
+        if columns is not None:
+            columns = list(columns) + [column for column in PARTITIONS if column not in columns]
+        df = dataset.to_table(columns=columns, filter=condition).to_pandas()
+        return df.sort_values(PARTITIONS, kind='stable').reset_index(drop=True)
+
+    def getDrywallDF(self, house_name=None, floor_name=None, trials=None):
+        return self.read('drywall', house_name, floor_name, trials)
+
+    def getWasteDF(self, house_name=None, floor_name=None, trials=None):
+        return self.read('waste', house_name, floor_name, trials)
+
+    def getJointsDF(self, house_name=None, floor_name=None, trials=None):
+        return self.read('joints', house_name, floor_name, trials)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:52:44 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import heapq
+import numpy as np
+
+from basic_classes import Position
+from batch_evaluator import BatchEvaluator, REJECTED, LAST
+
+
+class LayoutCost(object):
+    """
+    Cost of a layout of drywall sheets: a weighted sum of its cutting loss
+    area (ft2, the area added to Wall.getCuttingLosses), number of sheets and
+    number of cuts.
+    """
+    def __init__(self, waste_weight=1.0, sheet_weight=0.0, cut_weight=0.0):
+        self.waste_weight = waste_weight
+        self.sheet_weight = sheet_weight
+        self.cut_weight = cut_weight
+
+    def getWeights(self):
+        return self.waste_weight, self.sheet_weight, self.cut_weight
+
+    def getCost(self, cutting_loss, num_sheets, num_cuts):
+        return self.waste_weight * cutting_loss + self.sheet_weight * num_sheets + self.cut_weight * num_cuts
+
+
+class RowPlan(object):
+    """
+    The sheets of a row, from left to right, as laid out by a row solver.
+    """
+    def __init__(self, sheets, edges, widths, cutting_loss, num_cuts=0, cost=None):
+        """
+        sheets: list of DrywallSheet.
+        edges: X location of the right edge of each sheet (the last one can be
+        outside the wall).
+        widths: width of each sheet after the cuts.
+        cutting_loss: total cutting loss area of the row (ft2).
+        num_cuts: total number of cuts of the sheets.
+        cost: cost of the row (defaults to the cutting loss).
+        """
+        self.sheets = sheets
+        self.edges = edges
+        self.widths = widths
+        self.cutting_loss = cutting_loss
+        self.num_cuts = num_cuts
+        self.cost = cutting_loss if cost is None else cost
+
+    def __len__(self):
+        return len(self.sheets)
+
+    def getSheets(self):
+        return self.sheets
+
+    def getEdges(self):
+        return self.edges
+
+    def getWidths(self):
+        return self.widths
+
+    def getCuttingLoss(self):
+        return self.cutting_loss
+
+    def getNumSheets(self):
+        return len(self.sheets)
+
+    def getNumCuts(self):
+        return self.num_cuts
+
+    def getCost(self):
+        return self.cost
+
+    def getJoints(self, wall_length):
+        """
+        Returns: the joints of the row (edges inside the wall).
+        """
+        return [x for x in self.edges if x < (wall_length - 0.0625)]
+
+
+class RowSolver(object):
+    """
+    Exact solver of the layout of a row of drywall sheets.
+
+    The left edge of a sheet can only be at the start of the row or at a stud,
+    so the row is a shortest path problem over those positions: from the edge
+    at stud k, each sheet of the catalog leads to the stud where its right edge
+    ends up after the cuts (BatchEvaluator), and costs its cutting loss (or the
+    LayoutCost of the sheet). Positions are visited from left to right, and
+    the cheapest layout that reaches the end of the wall is returned.
+
+    Layouts with the same cost are ranked by number of sheets, then by
+    catalog order of the sheets, so the solver is deterministic.
+    """
+    def __init__(self, catalog, cost=None):
+        """
+        catalog: DrywallCatalog with the sheets that can be placed.
+        cost: LayoutCost of the sheets (defaults to the cutting loss area).
+        """
+        self.catalog = catalog
+        self.cost = LayoutCost() if cost is None else cost
+        self.evaluator = BatchEvaluator(catalog)
+
+    def getCatalog(self):
+        return self.catalog
+
+    def getLayoutCost(self):
+        return self.cost
+
+    def getTransitions(self, robot, position, previous_joints=None):
+        """
+        Returns: a list of (status, edge, width, sheet index) with every sheet
+        that can be placed at position (evaluated at once, see BatchEvaluator).
+        """
+        status, edge_x, width = self.evaluator.evaluateSheets(robot, position, previous_joints)
+        return [(int(status[index]), Position(edge_x[index], position.getY()), width[index], int(index)) for index in np.flatnonzero(status != REJECTED)]
+
+    def getBestRows(self, robot, start, row_height, previous_joints=None, k=1):
+        """
+        Find the k layouts of a row with the lowest cost.
+
+        robot: the Robot (its wall and row number are used).
+        start: Position of the left edge of the first sheet.
+        row_height: height of the row.
+        previous_joints: joints of the row below (defaults to the joints set
+        on the wall, see BatchEvaluator.getPreviousJoints).
+        k: number of layouts.
+
+        Returns: a list with up to k RowPlan, from the lowest cost.
+        """
+        sheets = self.catalog.getSheets()
+        wall_edge = robot.wall.getLength()
+
+        #Labels of a position: (cost, no. sheets, sheet indexes, edges,
+        #widths, cutting loss, no. cuts), the k best are kept
+        best = {start.getX(): [(0, 0, (), (), (), 0, 0)]}
+        queue = [start.getX()]
+        done = []
+        while len(queue) != 0:
+            x = heapq.heappop(queue)
+            labels = best.pop(x)
+
+            #Edge at the end of the wall: the row is done
+            if (wall_edge - 0.125) <= x:
+                done = sorted(done + labels)[:k]
+                continue
+
+            for status, edge, width, index in self.getTransitions(robot, Position(x, start.getY()), previous_joints):
+                sheet = sheets[index]
+                loss = sheet.getNominalArea() - width * row_height
+                cuts = (width < sheet.getWidth()) + (sheet.getHeight() > row_height)
+                new_labels = []
+                for label in labels:
+                    new_loss = round(label[5] + loss, 4)
+                    new_cuts = label[6] + cuts
+                    new_labels.append((self.cost.getCost(new_loss, label[1] + 1, new_cuts), label[1] + 1, label[2] + (index,), label[3] + (edge.getX(),), label[4] + (width,), new_loss, new_cuts))
+                if status == LAST:
+                    done = sorted(done + new_labels)[:k]
+                    continue
+                x_edge = edge.getX()
+                if x_edge not in best:
+                    best[x_edge] = []
+                    heapq.heappush(queue, x_edge)
+                best[x_edge] = sorted(best[x_edge] + new_labels)[:k]
+
+        return [RowPlan([sheets[index] for index in label[2]], list(label[3]), list(label[4]), label[5], label[6], label[0]) for label in done if label[1] != 0]
+
+    def solveRow(self, robot):
+        """
+        Find the layout of the current row of the robot (robot position, row
+        height and row number) with the lowest cost. The joints of the
+        previous row must already be set on the wall.
+
+        Returns: a RowPlan, or None if the row cannot be completed with the
+        sheets of the catalog.
+        """
+        plans = self.getBestRows(robot, robot.getRobotPosition(), robot.getRowHeight())
+        if len(plans) == 0:
+            return None
+        return plans[0]
+
+    def getNextSheet(self, robot, rows_height=None):
+        """
+        Returns: the first sheet of the best layout of the rest of the current
+        row, or None if the row cannot be completed.
+        """
+        plan = self.solveRow(robot)
+        if plan is None:
+            return None
+        return plan.getSheets()[0]
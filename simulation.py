@@ -0,0 +1,906 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Apr 14 15:53:43 2020
+
+@author: josec
+"""
+
+#Import relevant libraries
+import argparse
+import logging
+import os
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+#Import python files containing relevant classes
+
+from basic_classes import *
+from wall_class import Wall
+from offcut_registry import OffcutRegistry
+from robot_class import Robot, WallPool
+from simulation_log import getLogger, trace, enableTrace, disableTrace
+from phase_timer import timer, timed, enableTiming, disableTiming, summarizeTiming, SHEET_SELECTION, OTHER
+from data_loader import DataLoader, WallGeometry, getDefaultLoader
+from row_solver import RowSolver, LayoutCost
+from wall_planner import BeamPlanner, CheapestSheetPlanner
+from batch_evaluator import OFFCUT
+from floor_optimizer import FloorOptimizer, createWalls
+from convergence import ConvergenceMonitor
+from wall_cache import WallCache, CachedPlanner, isCacheable, getWallFingerprint
+from incremental import WallRecord, hashValue, getPoolFingerprint, loadState
+from trial_random import TrialRandom, getTrialSeed, getWallSeed
+from result_store import ResultStore, PARTITIONS
+
+#Simulation driver (walls, floors and trials)
+logger = getLogger('simulation')
+
+#Walls of the trials run in this process, reset from one trial to the next
+#(see runTrial). Worker processes have their own pool, kept from task to task
+wall_pool = WallPool()
+
+#Layout methods: new sheets selected at random, from the exact layout of the
+#rest of the row (RowSolver), from the beam search layout of the rest of the
+#wall (BeamPlanner) or the cheapest sheet at the robot position
+#(CheapestSheetPlanner)
+METHODS = ['random', 'row_dp', 'beam', 'cheapest']
+
+
+def traceStep(robot, wall_name, row, time_step, action):
+    '''
+    Write the step event of a time-step to the step trace.
+    
+    action: 'assigned', 'best_fit', 'greedy' or 'nominal' if a sheet was
+    placed on this time-step, None otherwise.
+    '''
+    fields = {}
+    if action is not None:
+        drywall = robot.getDrywall()
+        position = drywall.getPosition()
+        fields = {'name': drywall.getName(), 'x': position.getX(), 'y': position.getY(), 'width': drywall.getWidth(), 'height': drywall.getHeight()}
+    trace.write('step', trial=robot.getSimulationNumber(), wall=wall_name, row=row, step=time_step, action=action, robot_x=robot.getRobotPosition().getX(), **fields)
+
+
+def recordPlacement(robot, simulation_number, joints):
+    '''
+    Record the sheet the robot has just placed: clip the door and window
+    openings, update the drywall and waste dataframes of the wall and add the
+    edge of the sheet to the joints of the row.
+    
+    joints: list with the joints of the current row.
+    '''
+    clipperAtDoor(robot, robot.getDrywall()) 
+    clipperAtWindow(robot, robot.getDrywall())
+    
+    robot.wall.updateDrywallDataframe(robot.getDrywall().getPosition(), robot.getDrywall(), simulation_number)
+    robot.wall.updateWasteDF_VC_HC(robot.getDrywall(), simulation_number)
+    robot.wall.backup_WasteDF(robot.wall.getWasteRecords())
+    
+    #Add joint to Joints DataFrame
+    wall_edge = robot.wall.getLength()
+    if robot.getRobotPosition().getX() < (wall_edge - 0.0625):
+        joints.append(robot.getRobotPosition().getX())
+
+
+@timed(SHEET_SELECTION)
+def nailNewSheet(robot, planner=None, rows_height=None):
+    '''
+    Place a new sheet of the catalog at the robot position: the next sheet of
+    the planner if one is given, a random sheet otherwise (or if the planner
+    finds no layout).
+    
+    planner: a RowSolver, BeamPlanner, CheapestSheetPlanner or FloorPlan.
+    rows_height: list with the height of every row of the wall.
+    
+    Returns: True if a sheet was placed.
+    '''
+    if planner is not None:
+        sheet = planner.getNextSheet(robot, rows_height)
+        if sheet is not None:
+            return robot.placeSheet(sheet)
+    return robot.updatePositionAndNail()
+
+
+@timed(SHEET_SELECTION)
+def reuseCheapestCut(robot, planner, offcuts, max_cuts, min_area):
+    '''
+    Place the cheapest piece at the robot position if it is a cut of the
+    offcut inventory: the sheets of the catalog and the cuts are evaluated
+    together (see CheapestSheetPlanner.getNextPiece).
+    
+    planner: a CheapestSheetPlanner.
+    
+    Returns: True if a cut was placed (False if the cheapest piece is a new
+    sheet, see nailNewSheet).
+    '''
+    piece = planner.getNextPiece(robot, offcuts, min_area, max_cuts)
+    if piece is None or piece[0] != OFFCUT:
+        return False
+    return robot.reuseCut(offcuts, piece[1])
+
+
+@timed(OTHER)
+def runSimulation_Wall_to_Wall(trial, wall_name, wall_length, wall_height, unique_stud_df, unique_door_df, unique_window_df, df_waste, max_cuts, min_area, rng=None, catalog=None, planner=None, floor_plan=None, registry=None, robot=None):
+    '''
+    Simulate the placement of drywall sheets on a wall.
+    
+    planner: if given (a RowSolver, BeamPlanner or CheapestSheetPlanner), the
+    new sheets are selected from the best layout of the rest of the row or
+    wall (or the cheapest sheet at the robot position) instead of at random
+    (see nailNewSheet). Cuts are still reused first when they fit, and
+    the layout is planned again after each sheet. The CheapestSheetPlanner
+    weighs the cuts of the wall against the sheets instead (see
+    reuseCheapestCut).
+    floor_plan: if given (a FloorPlan of the floor), the wall follows its
+    layout: the cuts assigned to the gaps of the wall are placed, new sheets
+    elsewhere. The BestFit and Greedy reuse are not used, they could take the
+    cuts assigned to later walls.
+    registry: OffcutRegistry with the sheets of the cuts of df_waste (see
+    runTrial). The wall adds the sheets of its own cuts to it.
+    robot: Robot at the origin of an empty wall with this name and geometry
+    (e.g. from a WallPool), used instead of building a new wall and robot.
+    
+    Returns: the Wall object with the results. A wall of a WallPool is reset
+    the next time it is taken from the pool: read its results before.
+    '''
+    
+    if catalog is None:
+        catalog = getDefaultLoader().getCatalog()
+    
+    if robot is not None:
+        wall = robot.wall
+    else:
+        #Instanciate the wall
+        wall = Wall(wall_name, wall_length, wall_height, unique_stud_df, unique_door_df, unique_window_df, registry)
+        #Instanciate the robot:
+        robot = Robot(wall, rng, catalog)
+    robot.setSimulationNumber(trial)
+    simulation_number = 'Simulation_' + str(robot.getSimulationNumber())   
+    df_waste_copy = df_waste.copy()
+    robot.wall.backup_WasteDF(df_waste)    
+    
+    #Verify drywall orientation    
+    #If Vertical Orientation,
+    if verticalPossibility(wall_length, wall_height, catalog) == True:
+        
+        #Nail the first sheet of the catalog that covers the wall
+        sheet = catalog.getVerticalSheets(robot.wall.getLength(), robot.wall.getHeight())[0]
+        drywall = catalog.createDrywall(sheet, robot.getRandom())
+        drywall_width = drywall.getWidth()
+        drywall_height = drywall.getHeight()
+        
+        logger.debug('Wall %s: vertical orientation', wall_name)
+        
+        #Set new drywall width and height
+        drywall.setDrywallWidth(drywall_width)
+        drywall.setDrywallHeight(drywall_height)                
+        
+        #Add drywall to the wall
+        robot.NailOnVerticalOrientation(drywall)
+        
+        #Check cutting losses from doors and windows
+        clipperAtDoor(robot, drywall) 
+        #clipperAtWindow(robot, drywall)
+        
+        #Update Wall Dataframe
+        #simulation_number = 'Simulation_' + str(robot.getSimulationNumber())
+        robot.wall.updateDrywallDataframe(robot.getDrywall().getPosition(), robot.getDrywall(), simulation_number)
+        robot.wall.updateWasteDF_VC_HC(robot.getDrywall(), simulation_number)
+        #print(robot.wall.getWaste())
+        robot.wall.backup_WasteDF(robot.wall.getWasteRecords())
+        
+        cutting_losses = wall.getCuttingLosses()
+        total_cutting_loss_area = round(np.sum(cutting_losses), 4)
+        #print('Total cutting loss area: ' + str(total_cutting_loss_area))
+        
+        wall.saveWasteDF()
+        #wall.visualization(trial, total_cutting_loss_area)
+        
+        return wall
+    
+    #Else, place drywalls in Horizontal Orientation
+    else:
+        logger.debug('Wall %s: horizontal orientation', wall_name)
+        
+        #Calculate number of rows
+        drywall_height = 4  #sometimes 5
+        rows_height = getRowsHeight(wall_height, drywall_height)
+       
+        #Clear dataframes at the beginning of each simulation
+        #wall.clear()
+        #wall.drywall_dataframe.drop(wall.drywall_dataframe.index, inplace=True)
+        #wall.waste_dataframe.drop(wall.waste_dataframe.index, inplace=True)
+        #wall.backup_waste.drop(wall.backup_waste.index, inplace=True)
+        #wall.cutting_losses.clear()
+        delta_X = 0
+        delta_Y = 0
+        
+        #df_waste = df_waste[df_waste['simulation'] == simulation_number]
+        #print(robot.wall.getBackupWaste())
+        #robot.wall.backup_WasteDF(df_waste)
+        #print(robot.wall.getBackupWaste())
+        
+        #The cheapest sheet planner chooses between the cuts and new sheets
+        cheapest = floor_plan is None and isinstance(planner, CheapestSheetPlanner)
+        
+        #Iterate through number of rows
+        row = 0
+        while row < len(rows_height):
+            # Set New Robot attributes
+             
+            robot.setRowNumber(row)
+            robot.setRowHeight(rows_height[row])
+            new_origin = robot.getRobotPosition().getNewPosition(delta_X, delta_Y)
+            robot.setRobotPosition(new_origin)
+            
+            logger.debug('Row: %s, origin: %s', row, new_origin)
+            if trace.isEnabled():
+                trace.write('row', trial=trial, wall=wall_name, row=row, x=new_origin.getX(), y=new_origin.getY(), height=rows_height[row])
+
+            #The joints of the row are set on the wall as they are nailed
+            #(the planners stagger the row above against them)
+            joints = []
+            wall.setJoints(row, joints)
+            
+            # Iterate through while loop until row is complete, 
+            # keep track of time_steps every time the robot function is called.
+            
+            temp_time_steps = 0
+            while True:
+                
+                temp_time_steps += 1
+                logger.debug('Time step #%s', temp_time_steps)
+                action = None
+                                
+                # Clear temporary waste dataframe on each time-step. This df helps 
+                # to add aditional info without interference with complete waste_df
+                wall.clearWaste()
+                
+                #df_drywall = robot.wall.getWallDataframe()
+                #print('Drywall DF')
+                #print(df_drywall[['simulation', 'wall', 'drywall_ID', 'name', 'no_cuts']])
+                
+                offcuts = robot.wall.getOffcuts()
+                #print('Backup Waste DF: ')
+                #print(robot.wall.getBackupWaste()[['simulation', 'wall', 'name', 'type_of_cut', 'no_cuts']])
+                
+                assigned = None
+                if floor_plan is not None:
+                    assigned = floor_plan.findAssignedCut(robot, offcuts)
+              
+                if assigned is not None and robot.reuseCut(offcuts, assigned) == True:
+                    action = 'assigned'
+                    recordPlacement(robot, simulation_number, joints)
+                
+                elif cheapest == True and offcuts.isEmpty() == False and reuseCheapestCut(robot, planner, offcuts, max_cuts, min_area) == True:
+                    action = 'cheapest'
+                    recordPlacement(robot, simulation_number, joints)
+                
+                elif floor_plan is None and cheapest == False and offcuts.isEmpty() == False and robot.reuseCuttingLosses_BestFit(offcuts, min_area) == True:
+                    action = 'best_fit'
+                    recordPlacement(robot, simulation_number, joints)
+                 
+                elif floor_plan is None and cheapest == False and offcuts.isEmpty() == False and robot.reuseCuttingLosses_Greedy(offcuts, max_cuts, min_area) == True:
+                        action = 'greedy'
+                        recordPlacement(robot, simulation_number, joints)
+                
+                else:
+                    
+                    if temp_time_steps > 25:
+                        temp_time_steps = 0
+                        joints = []
+                        #Break while loop
+                        wall.getOffcuts().clear()
+                        robot.wall.backup_WasteDF(df_waste_copy) 
+                        robot.wall.DropDrywallResults(simulation_number)
+                        origin = Position(0, 0)
+                        robot.setRobotPosition(origin)
+                        delta_X = 0
+                        delta_Y = 0
+                        row=-1
+                        logger.info('Wall %s: no valid placement after 25 time steps, restart the wall', wall_name)
+                        if trace.isEnabled():
+                            trace.write('restart', trial=trial, wall=wall_name)
+                        break
+                    
+                    
+                    # if current simulation complies with all design rules,
+                    # update drywall and waste dataframe
+                    if nailNewSheet(robot, planner if floor_plan is None else floor_plan, rows_height) == True:
+                        action = 'nominal'
+                        recordPlacement(robot, simulation_number, joints)
+                        
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug('Temp. Waste DF:\n%s', robot.wall.getBackupWaste()[['simulation', 'wall', 'name', 'type_of_cut', 'no_cuts']])
+                    
+                        #print('Row Joints: ', joints)
+                
+                                
+                if trace.isEnabled():
+                    traceStep(robot, wall_name, row, temp_time_steps, action)
+                
+                #print("Wall: " + str(wall))
+                #print("")
+                
+                #print(wall.isPositionInWall(robot.getRobotPosition()))
+                
+                #Add joint to Joints DataFrame
+                #robot.wall.setJointsDF(robot)
+                
+                if wall.isPositionInWall(robot.getRobotPosition()) == False:
+                    # print(robot.getRobotPosition())
+                    #print("Row " + str(row) + " complete.")
+                    delta_X = -robot.getRobotPosition().getX()
+                    delta_Y = 4
+                    break
+             
+            # if temp_time_steps > 25:
+            #     temp_time_steps = 0
+            #     wall.backup_waste.drop(wall.backup_waste.index, inplace=True)
+            #     robot.wall.backup_WasteDF(df_waste_copy)
+            #     robot.wall.DropDrywallResults(simulation_number)
+            #     #Restart while loop
+            #     row = 0
+            #     origin = Position(0, 0)
+            #     robot.setRobotPosition(origin)
+            #     delta_X = 0
+            #     delta_Y = 0
+            #     print('Restart While Loop')
+                
+            
+            wall.setJoints(row, joints)
+            row += 1
+            logger.debug('Wall joints: %s', wall.getJoints())
+            robot.wall.setJointsDF(robot, joints)
+                
+        wall.saveWasteDF()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Joints DF:\n%s', robot.wall.getJointsDF())
+        origin = Position(0, 0)
+        robot.setRobotPosition(origin)     
+        
+        logger.debug('End of simulation #%s for wall %s', trial, wall_name)
+        
+        cutting_losses = wall.getCuttingLosses()
+        total_cutting_loss_area = round(np.sum(cutting_losses), 4)
+        
+        #wall.saveWasteDF()
+        #print(wall.getWasteDF())
+        
+        #wall.visualization(trial, total_cutting_loss_area)
+                
+        return wall
+
+  
+
+def createPlanner(method, catalog, beam_width=4, cost=None):
+    '''
+    Create the planner of a layout method (see METHODS).
+    
+    catalog: DrywallCatalog of the sheets.
+    beam_width: beam width of the 'beam' method.
+    cost: LayoutCost of the layouts (defaults to the cutting loss area).
+    
+    Returns: a RowSolver, BeamPlanner or CheapestSheetPlanner, None for the
+    random robot loop.
+    '''
+    if method == 'random':
+        return None
+    if method == 'row_dp':
+        return RowSolver(catalog, cost)
+    if method == 'beam':
+        return BeamPlanner(catalog, beam_width, cost)
+    if method == 'cheapest':
+        return CheapestSheetPlanner(catalog, cost)
+    raise ValueError('Unknown layout method: ' + str(method))
+
+
+def runTrial(trial, floor_name, df_walls, df_studs, df_doors, df_windows, max_cuts, min_area, seed, house_name=None, trace_path=None, catalog=None, planner=None, floor_plan=None, wall_cache=None, previous=None, keep_records=False, timing=False, geometry=None, reuse_walls=False):
+    '''
+    Run one trial of the simulation over every wall of a floor.
+    
+    The trial draws its random numbers from a TrialRandom seeded with
+    getTrialSeed(seed, house_name, floor_name, trial), so any trial can be
+    re-run on its own and gives the same result as inside a full run.
+
+    The cuts left by each wall are handed to the next one in a waste
+    dataframe of plain values, with an OffcutRegistry holding the state of
+    their sheets, so the results of a trial hold no simulation objects.
+
+    trace_path: JSONL file the step events are appended to (no trace if None).
+    catalog: DrywallCatalog of the sheets available to the robot (defaults
+    to the catalog of the default DataLoader).
+    planner: RowSolver, BeamPlanner or CheapestSheetPlanner selecting the
+    new sheets (random sheets if None, see createPlanner).
+    floor_plan: FloorPlan of the floor (see FloorOptimizer). The walls are
+    simulated in the order of the plan and follow its layout.
+    wall_cache: WallCache with the layouts of walls already simulated. Walls
+    with a layout in the cache replay it instead of planning again (only
+    with a planner or a floor plan, random sheets are not cached).
+    previous: dictionary {wall name: WallRecord} with the results of this
+    trial in the last run of an incremental run. A wall whose inputs and
+    incoming cuts did not change reuses them instead of being simulated.
+    keep_records: return a WallRecord of each wall (incremental runs). Each
+    wall then draws from its own random streams (see getWallSeed).
+    timing: time the phases of each wall (see phase_timer). The timer is
+    enabled in the process running the trial.
+    geometry: WallGeometry with the studs, doors and windows of the walls
+    (built from df_studs, df_doors and df_windows if None). Build it once
+    and pass it to every trial.
+    reuse_walls: take the walls from the WallPool of the process (wall_pool),
+    so the walls are reset from one trial to the next instead of being
+    built again. Each worker process has its own pool.
+    
+    Returns
+    (drywall_frames, joints_frames, df_waste, losses, records, timing_frames):
+    the drywall and joints dataframes of each wall, the waste dataframe left
+    after the last wall, a list of (wall name, total cutting loss area) of
+    each wall, a dictionary {wall name: WallRecord} (None without
+    keep_records) and the phase timing dataframe of each simulated wall
+    (empty list without timing).
+    '''
+    trial_seed = getTrialSeed(seed, house_name, floor_name, trial)
+    rng = TrialRandom(trial_seed)
+    if trace_path is not None:
+        trace.attach(trace_path)
+    else:
+        #Not traced, even if the process inherited the trace of another run
+        trace.close()
+    if catalog is None:
+        catalog = getDefaultLoader().getCatalog()
+    if timing:
+        enableTiming()
+    if geometry is None:
+        geometry = WallGeometry(df_studs, df_doors, df_windows)
+    
+    drywall_frames = []
+    joints_frames = []
+    losses = []
+    timing_frames = []
+    records = {} if keep_records else None
+    if previous is None:
+        previous = {}
+    df_waste = pd.DataFrame()
+    registry = OffcutRegistry()
+    if floor_plan is not None:
+        wall_names = df_walls['Attribute:ID'].tolist()
+        df_walls = df_walls.iloc[[wall_names.index(wall_name) for wall_name in floor_plan.getOrder()]]
+    
+    #Loop through each wall in the corresponding house floor
+    for index, value in df_walls.iterrows():
+        
+        wall_name = df_walls.loc[index, 'Attribute:ID']
+        logger.info('Start Simulation for Wall: %s', wall_name)
+        
+        wall_length = df_walls.loc[index, 'Attribute:Length']
+        wall_height = df_walls.loc[index, 'Attribute:Height']
+        unique_stud_df, unique_door_df, unique_window_df = geometry.getWall(wall_name)
+        
+        
+        if records is not None:
+            wall_fingerprint = hashValue(getWallFingerprint(wall_length, wall_height, unique_stud_df, unique_door_df, unique_window_df, catalog, max_cuts, min_area, planner if floor_plan is None else floor_plan, wall_name))
+            pool_fingerprint = getPoolFingerprint(df_waste, registry)
+            record = previous.get(wall_name)
+            if record is not None and record.matches(wall_fingerprint, pool_fingerprint):
+                logger.info('Wall %s: unchanged, results of the last run reused', wall_name)
+                records[wall_name] = record.copyAsReused()
+                df_waste = record.getWasteDF()
+                registry = record.getRegistry()
+                drywall_frames.append(record.getDrywallDF())
+                joints_frames.append(record.getJointsDF())
+                losses.append((wall_name, record.getLoss()))
+                continue
+            rng = TrialRandom(getWallSeed(trial_seed, wall_name))
+        
+        wall_planner, wall_floor_plan = planner, floor_plan
+        key = None
+        if wall_cache is not None and isCacheable(planner if floor_plan is None else floor_plan):
+            key = wall_cache.getKey(wall_length, wall_height, unique_stud_df, unique_door_df, unique_window_df, df_waste, registry, catalog, max_cuts, min_area, planner if floor_plan is None else floor_plan, wall_name)
+            if floor_plan is None:
+                wall_planner = CachedPlanner(planner, catalog, wall_cache.get(key))
+            else:
+                wall_floor_plan = CachedPlanner(floor_plan, catalog, wall_cache.get(key))
+        
+        robot = None
+        if reuse_walls:
+            robot = wall_pool.getRobot(wall_name, wall_length, wall_height, geometry, rng, catalog, registry)
+        wall = runSimulation_Wall_to_Wall(trial, wall_name, wall_length, wall_height, unique_stud_df, unique_door_df, unique_window_df, df_waste, max_cuts, min_area, rng, catalog, wall_planner, wall_floor_plan, registry, robot)
+        
+        if key is not None:
+            cached = wall_planner if floor_plan is None else wall_floor_plan
+            if cached.isRecording() and cached.isDeterministic():
+                wall_cache.put(key, cached.getSheets())
+        
+        df_waste = wall.getWasteDF()
+        
+        drywall_frames.append(wall.getWallDataframe())
+        joints_frames.append(wall.getJointsDF())
+        losses.append((wall_name, round(np.sum(wall.getCuttingLosses()), 4)))
+        if records is not None:
+            records[wall_name] = WallRecord(wall_fingerprint, pool_fingerprint, drywall_frames[-1], joints_frames[-1], losses[-1][1], df_waste, registry)
+        if timing:
+            timing_frames.append(timer.collect('Simulation_' + str(trial), floor_name, wall_name))
+    
+    if timing:
+        disableTiming()
+    logger.info('End Simulation for Trial: %s', trial)
+    
+    return drywall_frames, joints_frames, df_waste, losses, records, timing_frames
+
+
+def runTrials(tasks, num_workers, handler=None):
+    '''
+    Run trials, one after another if num_workers is 1, otherwise spread over
+    a pool of num_workers processes.
+    
+    tasks: list of argument tuples for runTrial.
+    handler: function handler(task, result) called with the result of each
+    trial as soon as it is done (in the order the trials finish). It returns
+    what is kept of the result (see createStoreWriter).
+    
+    Returns: list with the result of each task (or what the handler kept of
+    it), in the same order as tasks.
+    '''
+    if num_workers <= 1 or len(tasks) <= 1:
+        results = []
+        for task in tasks:
+            result = runTrial(*task)
+            results.append(result if handler is None else handler(task, result))
+        return results
+    
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = {executor.submit(runTrial, *task): i for i, task in enumerate(tasks)}
+        results = [None] * len(tasks)
+        for future in as_completed(futures):
+            i = futures[future]
+            result = future.result()
+            results[i] = result if handler is None else handler(tasks[i], result)
+        return results
+
+
+def runMonitoredTrials(floor_name, tasks, num_workers, monitor, remaining_floors=1, handler=None):
+    '''
+    Run the trials of a floor in batches of num_workers trials (one at a time
+    with a single worker) until the ConvergenceMonitor says the floor is done
+    or every task has run.
+    
+    tasks: list of argument tuples for runTrial, in trial order.
+    remaining_floors: number of floors still to run with the time budget,
+    this one included (see ConvergenceMonitor.startFloor).
+    handler: called with the result of each trial (see runTrials).
+    
+    Returns: list with the result of each trial that was run, in trial order.
+    '''
+    monitor.startFloor(floor_name, remaining_floors)
+    batch_size = max(num_workers, 1)
+    results = []
+    while len(results) < len(tasks) and monitor.isDone(floor_name) == False:
+        batch = tasks[len(results):len(results) + batch_size]
+        for task, result in zip(batch, runTrials(batch, num_workers, handler)):
+            monitor.update(floor_name, task[0], result[3])
+            results.append(result)
+    
+    if monitor.isFloorConverged(floor_name):
+        logger.info('Floor %s converged after %s trials', floor_name, len(results))
+    elif monitor.isOutOfTime(floor_name):
+        logger.info('Floor %s: time budget used up after %s trials', floor_name, len(results))
+    return results
+
+
+def saveIncrementalState(incremental, floor_name, results):
+    '''
+    Keep the WallRecords of the trials of a floor (in trial order) in the
+    IncrementalState for the next run.
+    '''
+    for trial, result in enumerate(results):
+        incremental.setRecords(floor_name, trial, result[4])
+
+
+def createStoreWriter(result_store, house_name):
+    '''
+    Returns: a result handler for runTrials writing the tables of each trial
+    to a ResultStore as soon as the trial is done. The handler keeps the
+    losses, WallRecords and timing of the trial but not its tables, so they
+    are not held in memory until the end of the run.
+    '''
+    def writeTrial(task, result):
+        drywall_frames, joints_frames, df_waste, losses, records, timing_frames = result
+        trial, floor_name = task[0], task[1]
+        result_store.writeTrial(house_name, floor_name, trial, drywall_frames, joints_frames, df_waste)
+        return [], [], pd.DataFrame(), losses, records, timing_frames
+    return writeTrial
+
+
+def saveTrialResults(floor, results):
+    '''
+    Append the results of the trials of a floor to the Floor object, in
+    trial order.
+    '''
+    for drywall_frames, joints_frames, df_waste, losses, records, timing_frames in results:
+        for df_drywall, df_joints in zip(drywall_frames, joints_frames):
+            floor.saveDrywallDF(df_drywall)
+            floor.saveJointsDF(df_joints)
+        floor.saveWasteDF(df_waste)
+        for df_timing in timing_frames:
+            floor.saveTimingDF(df_timing)
+
+
+def planFloor(floor_optimizer, df_walls, df_studs, df_doors, df_windows, planner=None, geometry=None):
+    '''
+    Plan the walls of a floor with a FloorOptimizer (None for no plan).
+    
+    planner: planner of the FloorPlan for the positions off the plan.
+    geometry: WallGeometry of the walls (see createWalls).
+    
+    Returns: a FloorPlan, or None.
+    '''
+    if floor_optimizer is None:
+        return None
+    return floor_optimizer.planFloor(createWalls(df_walls, df_studs, df_doors, df_windows, geometry), planner)
+
+
+def runSimulation_floor(num_trials, floor_name, df_walls, df_studs, df_doors, df_windows, max_cuts, min_area, num_workers=1, seed=0, house_name=None, trace_path=None, catalog=None, planner=None, floor_optimizer=None, monitor=None, wall_cache=None, incremental=None, result_store=None, timing=False):
+    
+    floor = Floor(floor_name)
+    if catalog is None:
+        catalog = getDefaultLoader().getCatalog()
+    if trace_path is not None:
+        enableTrace(trace_path)
+    try:
+        #The studs, doors and windows are grouped by wall once for every trial
+        geometry = WallGeometry(df_studs, df_doors, df_windows)
+    
+        #The floor is planned once, every trial follows the same plan
+        floor_plan = planFloor(floor_optimizer, df_walls, df_studs, df_doors, df_windows, planner, geometry)
+        if incremental is not None:
+            incremental.checkSettings((seed, house_name, floor_optimizer is not None))
+            incremental.diff(df_walls, df_studs, df_doors, df_windows)
+    
+        # Run each trial with its own random streams
+        tasks = [(trial, floor_name, df_walls, df_studs, df_doors, df_windows, max_cuts, min_area, seed, house_name, trace_path, catalog, planner, floor_plan, wall_cache,
+                  None if incremental is None else incremental.getRecords(floor_name, trial), incremental is not None, timing, geometry, True) for trial in range(num_trials)]
+        #With a result store, the tables of each trial are written as soon as
+        #the trial is done and not kept in the Floor
+        handler = None if result_store is None else createStoreWriter(result_store, house_name)
+        if monitor is None:
+            results = runTrials(tasks, num_workers, handler)
+        else:
+            monitor.start()
+            results = runMonitoredTrials(floor_name, tasks, num_workers, monitor, handler=handler)
+        saveTrialResults(floor, results)
+        if incremental is not None:
+            saveIncrementalState(incremental, floor_name, results)
+        #The walls of the run are not needed any more in this process
+        wall_pool.clear()
+    
+        return floor
+    finally:
+        #The next runs in this process are not traced unless they ask for it
+        if trace_path is not None:
+            disableTrace()
+
+
+def runSimulationForHouse(num_trials, house_name, df_walls, df_studs, df_doors, df_windows, max_cuts, min_area, num_workers=1, seed=0, trace_path=None, catalog=None, planner=None, floor_optimizer=None, monitor=None, wall_cache=None, incremental=None, result_store=None, timing=False):
+    '''
+    Run num_trials trials of the simulation on every floor of a house.
+    
+    trace_path: if given, the step events of every trial are written to this
+    JSONL file (see simulation_log.StepTrace).
+    catalog: DrywallCatalog of the sheets available to the robot (defaults
+    to the catalog of the default DataLoader).
+    planner: RowSolver, BeamPlanner or CheapestSheetPlanner selecting the
+    new sheets (random sheets if None, see createPlanner).
+    floor_optimizer: FloorOptimizer planning the order of the walls and the
+    reuse of cuts of each floor (no plan if None).
+    monitor: ConvergenceMonitor. If given, num_trials is the max. number of
+    trials of a floor: the trials of each floor stop once the monitor says
+    the floor has converged or the time budget is used up.
+    wall_cache: WallCache shared by the trials (see runTrial). Worker
+    processes get a copy of it: use a cache with a directory to share the
+    layouts between processes.
+    incremental: IncrementalState with the results of the last run of the
+    house. Only the walls whose inputs changed, and the walls after them
+    whose incoming cuts changed, are simulated again; the state is updated
+    with the results of this run.
+    result_store: ResultStore the tables of each trial are written to, as
+    soon as the trial is done. The tables are then not kept in the House
+    (read them from the store).
+    timing: time the phases of every wall (see runTrial). The timing
+    dataframe of the house is then in House.getTimingDF.
+    '''
+    if catalog is None:
+        catalog = getDefaultLoader().getCatalog()
+    
+    #Initialize an empty house list
+    #columns=['simulation', 'wall', 'name', 'start_point_x', 'start_point_y', 'height', 'width', 'vertical_cut', 'horizontal_cut', 'door_clipper', 'window_clipper']
+    #house = pd.DataFrame(columns=columns)
+    house = House(house_name)
+    
+    #Get list of floors in the house
+    floors = df_walls['Attribute:Level'].unique().tolist()
+    if trace_path is not None:
+        enableTrace(trace_path)
+    try:
+        if incremental is not None:
+            incremental.checkSettings((seed, house_name, floor_optimizer is not None))
+            incremental.diff(df_walls, df_studs, df_doors, df_windows)
+    
+        #The studs, doors and windows are grouped by wall once for the house
+        geometry = WallGeometry(df_studs, df_doors, df_windows)
+        #With a result store, the tables of each trial are written as soon as
+        #the trial is done and not kept in the House
+        handler = None if result_store is None else createStoreWriter(result_store, house_name)
+    
+        #Trials of every floor are independent: run them all in the same pool
+        floor_tasks = []
+        for floor_name in floors:
+        
+            logger.info('Start Simulation for Floor: %s', floor_name)
+        
+            #Get wall dataframe associated to each floor in the house
+            df_walls_floor = df_walls.loc[df_walls['Attribute:Level']== floor_name]
+            floor_plan = planFloor(floor_optimizer, df_walls_floor, df_studs, df_doors, df_windows, planner, geometry)
+            floor_tasks.append([(trial, floor_name, df_walls_floor, df_studs, df_doors, df_windows, max_cuts, min_area, seed, house_name, trace_path, catalog, planner, floor_plan, wall_cache,
+                                 None if incremental is None else incremental.getRecords(floor_name, trial), incremental is not None, timing, geometry, True) for trial in range(num_trials)])
+    
+        if monitor is None:
+            results = runTrials([task for tasks in floor_tasks for task in tasks], num_workers, handler)
+            floor_results = [results[i*num_trials:(i+1)*num_trials] for i in range(len(floors))]
+        else:
+            #The floors are run one after the other, each one until it converges
+            monitor.start()
+            floor_results = [runMonitoredTrials(floor_name, tasks, num_workers, monitor, len(floors) - i, handler) for i, (floor_name, tasks) in enumerate(zip(floors, floor_tasks))]
+    
+        #Loop through each floor in the house
+        for floor_name, results in zip(floors, floor_results):
+        
+            floor = Floor(floor_name)
+            saveTrialResults(floor, results)
+            if incremental is not None:
+                saveIncrementalState(incremental, floor_name, results)
+        
+            #Append the results from each floor simulation to the house list
+            house.saveDrywallDF(floor.getDrywallDF())
+            house.saveWasteDF(floor.getWasteDF())
+            house.saveJointsDF(floor.getJointsDF())
+            house.saveTimingDF(floor.getTimingDF())
+            if timing:
+                logger.info('Phase timing of floor %s:\n%s', floor_name, summarizeTiming(floor.getTimingDF(), 'floor').to_string(index=False))
+        
+            logger.info('End Simulation for Floor: %s', floor_name)
+    
+        if incremental is not None:
+            logger.info('Incremental run: %s of %s walls reused', incremental.getNumReused(), incremental.getNumWalls())
+        #The walls of the run are not needed any more in this process
+        wall_pool.clear()
+    
+        return house
+    finally:
+        #The next runs in this process are not traced unless they ask for it
+        if trace_path is not None:
+            disableTrace()
+                
+
+# df1 = df_walls.loc[df_walls['Attribute:ID']==848955]
+# df2 = df_walls.loc[df_walls['Attribute:ID']==848957]
+# df3= df_walls.loc[df_walls['Attribute:ID']==848959]
+# df4= df_walls.loc[df_walls['Attribute:ID']==848960]
+# df5= df_walls.loc[df_walls['Attribute:ID']==848961]
+# df6= df_walls.loc[df_walls['Attribute:ID']==848962]
+# df_twowalls = pd.concat([df1,df2,df3,df4,df5,df6])
+
+# # 2 walls
+# house = runSimulationForHouse(5, 'House Prototype', df_twowalls, df_studs, df_doors, df_windows, 10, 32)
+
+
+
+def parseArguments(argv=None):
+    
+    parser = argparse.ArgumentParser(description='Simulate the placement of drywall sheets on the walls of a house.')
+    parser.add_argument('--trials', type=int, default=1, help='number of trials per floor, max. number with --tolerance or --time-budget (default: 1)')
+    parser.add_argument('--max-cuts', type=int, default=10, help='max. number of times a sheet can be cut (default: 10)')
+    parser.add_argument('--min-area', type=float, default=12, help='min. area of a reusable cut in ft2 (default: 12)')
+    parser.add_argument('--workers', type=int, default=1, help='number of worker processes (default: 1)')
+    parser.add_argument('--method', default='random', choices=METHODS, help='layout method: random sheets, exact row solver, beam search wall planner or cheapest sheet at each position (default: random)')
+    parser.add_argument('--beam-width', type=int, default=4, help='beam width of the beam method (default: 4)')
+    parser.add_argument('--waste-weight', type=float, default=1.0, help='cost of a ft2 of cutting loss (default: 1)')
+    parser.add_argument('--sheet-weight', type=float, default=0.0, help='cost of a sheet (default: 0)')
+    parser.add_argument('--cut-weight', type=float, default=0.0, help='cost of a cut (default: 0)')
+    parser.add_argument('--optimize-floor', action='store_true', help='plan the order of the walls and the reuse of cuts of each floor before the trials')
+    parser.add_argument('--tolerance', type=float, default=None, help='stop the trials of a floor once the 95%% confidence interval of the cutting loss of every wall is within +- this area in ft2')
+    parser.add_argument('--time-budget', type=float, default=None, help='stop the trials once this time in seconds is used up, split between the floors (every floor runs at least --min-trials trials)')
+    parser.add_argument('--min-trials', type=int, default=5, help='min. number of trials before a wall can converge (default: 5)')
+    parser.add_argument('--cache', action='store_true', help='replay the layout of walls already simulated (row_dp and beam methods)')
+    parser.add_argument('--cache-dir', default=None, help='also store the cached layouts in this directory (implies --cache)')
+    parser.add_argument('--cache-size', type=int, default=1024, help='max. number of layouts cached in memory (default: 1024)')
+    parser.add_argument('--incremental', default=None, metavar='STATE_FILE', help='reuse the results of the last run kept in this file for the walls that did not change, and update it')
+    parser.add_argument('--seed', type=int, default=0, help='base seed of the trials (default: 0)')
+    parser.add_argument('--house-name', default='Residential House Prototype')
+    parser.add_argument('--data-dir', default=None, help='directory of the input files (default: the simulation directory)')
+    parser.add_argument('--walls', default='df_walls.csv', help='walls file (default: df_walls.csv)')
+    parser.add_argument('--output-dir', default=None, help='write the drywall, waste and joints results as CSV files to this directory')
+    parser.add_argument('--parquet-dir', default=None, help='write the drywall, waste and joints tables of each trial to a Parquet store in this directory (needs pyarrow)')
+    parser.add_argument('--trace', default=None, help='write the step events to this JSONL file')
+    parser.add_argument('--phase-timing', action='store_true', help='time the phases of every wall (sheet selection, reuse, stud lookups, ...) and report them per floor and for the house')
+    parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
+    parser.add_argument('--plot', action='store_true', help='plot the drywall sheets of every wall')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    '''
+    Command line entry point: run the simulation of a house.
+    
+    argv: list of command line arguments (defaults to sys.argv[1:]).
+    
+    Returns: the House object with the results (without the drywall, waste
+    and joints tables with --parquet-dir, they are in the store).
+    '''
+    args = parseArguments(argv)
+    logging.basicConfig(level=getattr(logging, args.log_level), format='%(name)s - %(levelname)s - %(message)s')
+    
+    loader = DataLoader(args.data_dir, walls_filename=args.walls)
+    cost = LayoutCost(args.waste_weight, args.sheet_weight, args.cut_weight)
+    planner = createPlanner(args.method, loader.getCatalog(), args.beam_width, cost)
+    floor_optimizer = None
+    if args.optimize_floor:
+        floor_optimizer = FloorOptimizer(loader.getCatalog(), args.min_area, planner if args.method == 'beam' else None, cost)
+    wall_cache = None
+    if args.cache or args.cache_dir is not None:
+        wall_cache = WallCache(args.cache_size, args.cache_dir)
+    incremental = None
+    if args.incremental is not None:
+        incremental = loadState(args.incremental)
+    result_store = None
+    if args.parquet_dir is not None:
+        result_store = ResultStore(args.parquet_dir)
+    if args.output_dir is not None:
+        #Create it before the run, not after it
+        os.makedirs(args.output_dir, exist_ok=True)
+    monitor = None
+    if args.tolerance is not None or args.time_budget is not None:
+        monitor = ConvergenceMonitor(args.tolerance, args.time_budget, args.min_trials)
+    df_doors = loader.getDoors()
+    df_windows = loader.getWindows()
+    
+    house = runSimulationForHouse(args.trials, args.house_name, loader.getWalls(), loader.getStuds(), df_doors, df_windows,
+                                  args.max_cuts, args.min_area, num_workers=args.workers, seed=args.seed,
+                                  trace_path=args.trace, catalog=loader.getCatalog(), planner=planner,
+                                  floor_optimizer=floor_optimizer, monitor=monitor, wall_cache=wall_cache,
+                                  incremental=incremental, result_store=result_store, timing=args.phase_timing)
+    if incremental is not None:
+        incremental.save(args.incremental)
+    
+    #With a Parquet store the tables are not kept in the House: read them back
+    df_drywall, df_waste, df_joints = house.getDrywallDF(), house.getWasteDF(), house.getJointsDF()
+    if result_store is not None and (args.output_dir is not None or args.plot):
+        df_drywall, df_waste, df_joints = [result_store.read(table, args.house_name).drop(columns=PARTITIONS) for table in ('drywall', 'waste', 'joints')]
+    
+    if args.output_dir is not None:
+        df_drywall.to_csv(os.path.join(args.output_dir, 'Results_drywall.csv'), index=None, header=True)
+        df_waste.to_csv(os.path.join(args.output_dir, 'Results_waste.csv'), index=None, header=True)
+        df_joints.to_csv(os.path.join(args.output_dir, 'Results_joints.csv'), index=None, header=True)
+        if monitor is not None:
+            monitor.getReport().to_csv(os.path.join(args.output_dir, 'Results_convergence.csv'), index=None, header=True)
+        if args.phase_timing:
+            house.getTimingDF().to_csv(os.path.join(args.output_dir, 'Results_timing.csv'), index=None, header=True)
+    
+    #The workers count the hits of their own copy of the cache
+    if wall_cache is not None and args.workers <= 1:
+        logger.info('Wall cache: %s hits, %s misses', wall_cache.getHits(), wall_cache.getMisses())
+    
+    if monitor is not None:
+        logger.info('Convergence report:\n%s', monitor.getReport().to_string(index=False))
+    
+    if args.phase_timing:
+        logger.info('Phase timing of the house:\n%s', summarizeTiming(house.getTimingDF(), 'house').to_string(index=False))
+    
+    if args.plot:
+        visualization(df_drywall, df_waste, df_doors, df_windows)
+    
+    return house
+
+
+if __name__ == '__main__':
+    main()
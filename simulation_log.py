@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:40:12 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import json
+import logging
+import os
+
+#Root name of the simulation loggers. Each subsystem logs under its own name
+#(drywall.robot, drywall.rules, drywall.wall, drywall.simulation) so it can be
+#enabled or silenced on its own, e.g.
+#    logging.getLogger('drywall.robot').setLevel(logging.DEBUG)
+ROOT_LOGGER = 'drywall'
+
+#Nothing is printed unless the application configures logging
+logging.getLogger(ROOT_LOGGER).addHandler(logging.NullHandler())
+
+
+def getLogger(subsystem):
+    '''
+    Returns: the logger of a subsystem of the simulation (drywall.<subsystem>).
+    '''
+    return logging.getLogger(ROOT_LOGGER + '.' + subsystem)
+
+
+def toJSON(value):
+    '''
+    Convert the values json cannot serialize (numpy scalars, Position...).
+    '''
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class StepTrace(object):
+    """
+    Writes the step events of the simulation to a JSONL file, one JSON object
+    per line, e.g.
+        {"event": "step", "trial": 0, "wall": 848955, "row": 0, "step": 1, ...}
+
+    The file is opened lazily by each process that writes to it (in append
+    mode and line buffered), so the trials run in a process pool can share the
+    same trace file.
+    """
+    def __init__(self):
+        self.path = None
+        self.file = None
+        self.pid = None
+
+    def isEnabled(self):
+        return self.path is not None
+
+    def getPath(self):
+        return self.path
+
+    def open(self, path):
+        """
+        Start writing the step events to path (the file is truncated).
+        """
+        self.close()
+        open(path, 'w').close()
+        self.path = path
+
+    def attach(self, path):
+        """
+        Write the step events to path, keeping what is already in the file
+        (used by the worker processes of a run).
+        """
+        if self.path != path:
+            self.close()
+            self.path = path
+
+    def close(self):
+        if self.file is not None and self.pid == os.getpid():
+            self.file.close()
+        self.path = None
+        self.file = None
+        self.pid = None
+
+    def write(self, event, **fields):
+        """
+        Write one event.
+
+        event: name of the event ('row', 'step', 'restart', ...).
+        fields: values of the event.
+        """
+        if self.path is None:
+            return
+        if self.pid != os.getpid():
+            self.file = open(self.path, 'a', buffering=1)
+            self.pid = os.getpid()
+        record = {'event': event}
+        record.update(fields)
+        self.file.write(json.dumps(record, default=toJSON) + '\n')
+
+
+#Step trace shared by the simulation (disabled until enableTrace is called)
+trace = StepTrace()
+
+
+def enableTrace(path):
+    '''
+    Write the step events of the simulation to the JSONL file path.
+    '''
+    trace.open(path)
+
+
+def disableTrace():
+    trace.close()
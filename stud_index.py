@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:20:11 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import bisect
+import numpy as np
+
+from phase_timer import timed, STUD_LOOKUP
+
+
+class StudIndex(object):
+    """
+    Sorted X locations of the studs of a wall.
+
+    Built once per wall, it answers the stud queries used on every time-step
+    (is an edge on a stud, which is the closest stud to the left of an edge)
+    with a binary search instead of rebuilding and scanning the stud array.
+    """
+    def __init__(self, locations):
+        """
+        locations: iterable with the X location of each stud (any order,
+        duplicates allowed).
+        """
+        self.locations = np.sort(np.array(list(locations), dtype='float64'))
+        self.locations_list = self.locations.tolist()
+        #Bounds of the on-stud zone of each stud (sorted, see areOnStuds)
+        self.lower = self.locations - 0.0625
+        self.upper = self.locations + 0.0625
+
+    def getLocations(self):
+        """
+        Returns: a sorted numpy array with the X location of the studs.
+        """
+        return self.locations
+
+    @timed(STUD_LOOKUP)
+    def getLocationsRightOf(self, x):
+        """
+        Returns: a sorted list (Python floats) with the studs located at
+        X > x - 0.0625, i.e. the studs an edge starting at x could still land on.
+        """
+        i = bisect.bisect_left(self.locations_list, x - 0.0625)
+        return self.locations_list[i:]
+
+    @timed(STUD_LOOKUP)
+    def isOnStud(self, x):
+        """
+        Check if an edge at x is on a stud position (stud X +- 0.0625').
+
+        x: edge location in the X axis.
+
+        Returns: True if the edge is on a stud, False otherwise.
+        """
+        locations = self.locations_list
+        i = bisect.bisect_left(locations, x - 0.0625 - 0.0001)
+        while i < len(locations) and locations[i] <= x + 0.0625 + 0.0001:
+            if (locations[i] - 0.0625) <= x <= (locations[i] + 0.0625):
+                return True
+            i += 1
+        return False
+
+    @timed(STUD_LOOKUP)
+    def getStudLeftOf(self, x):
+        """
+        Returns: the X location (a Python float) of the closest stud strictly
+        to the left of x.
+
+        Raises ValueError if there is no stud to the left of x.
+        """
+        i = bisect.bisect_left(self.locations_list, x)
+        if i == 0:
+            raise ValueError('No stud to the left of X = ' + str(x))
+        return self.locations_list[i - 1]
+
+    @timed(STUD_LOOKUP)
+    def getDistanceToStudLeftOf(self, x):
+        """
+        Returns: the distance from x to the closest stud strictly to its left
+        (always > 0).
+        """
+        return x - self.getStudLeftOf(x)
+
+    @timed(STUD_LOOKUP)
+    def areOnStuds(self, xs):
+        """
+        Vectorized isOnStud.
+
+        xs: array with edge locations in the X axis.
+
+        Returns: a boolean array, True where the edge is on a stud.
+        """
+        xs = np.asarray(xs, dtype='float64')
+        #First stud whose zone does not end before x: x is on a stud only if
+        #it is on this one (the zones are sorted and have the same width)
+        i = np.searchsorted(self.upper, xs, side='left')
+        inside = i < len(self.upper)
+        on_stud = np.zeros(xs.shape, dtype=bool)
+        on_stud[inside] = self.lower[i[inside]] <= xs[inside]
+        return on_stud
+
+    @timed(STUD_LOOKUP)
+    def getDistancesToStudLeftOf(self, xs):
+        """
+        Vectorized getDistanceToStudLeftOf.
+
+        Returns: an array with the distance from each x to the closest stud
+        strictly to its left, NaN if there is no stud to its left.
+        """
+        xs = np.asarray(xs, dtype='float64')
+        i = np.searchsorted(self.locations, xs, side='left')
+        distances = np.full(xs.shape, np.nan)
+        left = i > 0
+        distances[left] = xs[left] - self.locations[i[left] - 1]
+        return distances
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 06:05:17 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import argparse
+import os
+import shutil
+import numpy as np
+import pandas as pd
+
+from data_loader import DATA_DIR, WALLS_FILENAME, STUDS_FILENAME, DOORS_FILENAME, WINDOWS_FILENAME, DRYWALLS_FILENAME, getDefaultLoader
+from basic_classes import getRowsHeight
+from wall_class import Wall
+from robot_class import Robot
+from wall_planner import BeamPlanner
+
+#Columns of the input files (same schema as the bundled house)
+WALL_COLUMNS = ['Attribute:ID', 'Attribute:ElementType', 'Attribute:Level', 'Attribute:Name', 'Attribute:Length', 'Attribute:Height']
+STUD_COLUMNS = ['Studs.Stud.InsertLocation.Attribute:X', 'Studs.Stud.InsertLocation.Attribute:Y', 'Studs.Stud.InsertLocation.Attribute:Z',
+                'Studs.Stud.Attribute:Function', 'Studs.Stud.Attribute:ID', 'Studs.Stud.Attribute:Type', 'Studs.Stud.Attribute:IsTop', 'Studs.Stud.Attribute:IsBottom',
+                'Plates.Plate.StartPoint.Attribute:X', 'Plates.Plate.StartPoint.Attribute:Y', 'Plates.Plate.StartPoint.Attribute:Z',
+                'Plates.Plate.EndPoint.Attribute:X', 'Plates.Plate.EndPoint.Attribute:Y', 'Plates.Plate.EndPoint.Attribute:Z',
+                'Plates.Plate.Attribute:Function', 'Plates.Plate.Attribute:ID', 'Plates.Plate.Attribute:Type',
+                'Attribute:ID', 'Attribute:ElementType', 'Attribute:Level', 'Attribute:Name', 'Attribute:Length', 'Studs_Location_X']
+OPENING_FIELDS = ['StartPoint.Attribute:X', 'StartPoint.Attribute:Y', 'StartPoint.Attribute:Z', 'EndPoint.Attribute:X', 'EndPoint.Attribute:Y', 'EndPoint.Attribute:Z',
+                  'Attribute:ID', 'Attribute:SillLength', 'Attribute:SillHeight']
+DOOR_COLUMNS = ['Doors.Openning.' + field for field in OPENING_FIELDS] + WALL_COLUMNS + ['EP_X', 'SP_X']
+WINDOW_COLUMNS = ['Windows.Openning.' + field for field in OPENING_FIELDS] + WALL_COLUMNS + ['EP_X', 'SP_X']
+
+#Wall types: element type and stud type
+WALL_TYPES = [('STAR - EXT. 6" WALL - VINYL CLADDING', 'L2X6'), ('STAR - Interior 4" Stud Wall', 'L2X4')]
+
+#Wall heights of the bundled house (main and upper floor)
+DEFAULT_HEIGHT_MIX = {9.09375: 1.0, 8.296061509: 1.0}
+
+#Share of short walls (closets, returns, furring), covered by a single
+#vertical sheet, and length range of the short and long walls (ft)
+SHORT_WALL_SHARE = 0.45
+SHORT_WALL_LENGTH = (0.9, 3.7)
+LONG_WALL_LENGTH = (4.5, 33.0)
+
+#Openings: share of doors, width range (ft), bottom and top (ft)
+DOOR_SHARE = 0.5
+DOOR_WIDTH = (2.5, 3.0)
+DOOR_Y = (0.0, 6.875)
+WINDOW_WIDTH = (2.0, 6.0)
+WINDOW_Y = (1.9271, 6.9479)
+#Min. distance between openings and to the ends of the wall (ft)
+OPENING_MARGIN = 1.0
+
+#Stud width (ft)
+STUD_WIDTH = 0.125
+
+#Openings drawn for a wall before leaving it without openings, if no layout
+#of the wall complies with the design rules
+MAX_ATTEMPTS = 10
+
+
+def roundToSixteenth(value):
+    '''
+    Returns: value (ft) rounded to 1/16 in.
+    '''
+    return round(value * 192) / 192
+
+
+class SyntheticHouseGenerator(object):
+    """
+    Generates the input dataframes of synthetic houses (walls, studs, doors
+    and windows) with the same columns as the bundled house, to run the
+    simulation and the benchmarks on subdivision-sized inputs.
+
+    Each floor of a house has walls_per_floor walls of the same height (drawn
+    from the height mix). About SHORT_WALL_SHARE of the walls are short walls
+    covered by a single vertical sheet, the others are long walls with OC
+    studs at the stud spacing and openings. Every wall has a row in the door
+    and window dataframes (with missing coordinates if it has no door or
+    window), like the bundled house.
+
+    The openings of a wall are drawn again if the wall cannot be laid out
+    with the sheets of the catalog (BeamPlanner): the robot loop would restart
+    such a wall forever.
+
+    The houses only depend on the parameters and the seed.
+    """
+    def __init__(self, stud_spacing=16, opening_density=0.3, height_mix=None, seed=0, catalog=None):
+        """
+        stud_spacing: OC spacing of the studs in inches (16 or 24).
+        opening_density: mean number of openings per 10 ft of long wall.
+        height_mix: dictionary {wall height (ft): weight} the height of each
+        floor is drawn from (defaults to DEFAULT_HEIGHT_MIX).
+        seed: seed of the random generator.
+        catalog: DrywallCatalog the walls are checked with (defaults to the
+        catalog of the default DataLoader).
+        """
+        if stud_spacing not in (16, 24):
+            raise ValueError('The stud spacing must be 16 or 24 in')
+        if opening_density < 0:
+            raise ValueError('The opening density must be >= 0')
+        height_mix = DEFAULT_HEIGHT_MIX if height_mix is None else height_mix
+        self.stud_spacing = stud_spacing / 12
+        self.opening_density = opening_density
+        self.heights = list(height_mix.keys())
+        weights = np.array(list(height_mix.values()), dtype='float64')
+        if len(weights) == 0 or (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError('The height mix must have positive weights')
+        self.height_weights = weights / weights.sum()
+        self.rng = np.random.default_rng(seed)
+        self.catalog = getDefaultLoader().getCatalog() if catalog is None else catalog
+        self.planner = BeamPlanner(self.catalog)
+        self.next_ID = 1000000
+        self.walls = []
+        self.studs = []
+        self.doors = []
+        self.windows = []
+
+    def getID(self):
+        ID = self.next_ID
+        self.next_ID += 1
+        return ID
+
+    def generate(self, num_houses=1, floors=2, walls_per_floor=25):
+        """
+        Generate houses.
+
+        Returns: the walls, studs, doors and windows dataframes of all the
+        houses. The floors of house h are named 'H<h>-<floor> FLOOR PLAN', so
+        each floor of each house is simulated on its own.
+        """
+        for house in range(num_houses):
+            for floor in range(floors):
+                level = 'H%03d-%02d FLOOR PLAN' % (house + 1, floor + 1)
+                height = self.heights[self.rng.choice(len(self.heights), p=self.height_weights)]
+                for number in range(walls_per_floor):
+                    self.addWall(level, 'W%s' % (number + 1), height)
+        return (pd.DataFrame(self.walls, columns=WALL_COLUMNS),
+                pd.DataFrame(self.studs, columns=STUD_COLUMNS),
+                pd.DataFrame(self.doors, columns=DOOR_COLUMNS),
+                pd.DataFrame(self.windows, columns=WINDOW_COLUMNS))
+
+    def addWall(self, level, name, height):
+        """
+        Add a wall with its studs and openings.
+        """
+        short = self.rng.random() < SHORT_WALL_SHARE
+        length = roundToSixteenth(self.rng.uniform(*(SHORT_WALL_LENGTH if short else LONG_WALL_LENGTH)))
+        element_type, stud_type = WALL_TYPES[int(self.rng.integers(len(WALL_TYPES)))]
+        wall = [self.getID(), element_type, level, name, length, height]
+        vertical = self.catalog.fitsVertically(length, height)
+
+        for attempt in range(MAX_ATTEMPTS + 1):
+            openings = [] if short or attempt == MAX_ATTEMPTS else self.getOpenings(length, height)
+            studs = self.getStudRows(wall, stud_type, openings)
+            doors = self.getOpeningRows(wall, [opening for opening in openings if opening[4] == 'door'])
+            windows = self.getOpeningRows(wall, [opening for opening in openings if opening[4] == 'window'])
+            if vertical or len(openings) == 0 or self.isFeasible(wall, studs, doors, windows):
+                break
+
+        self.walls.append(wall)
+        self.studs += studs
+        self.doors += doors
+        self.windows += windows
+
+    def isFeasible(self, wall, studs, doors, windows):
+        """
+        Returns: True if the wall can be laid out with the sheets of the
+        catalog in compliance with the design rules.
+        """
+        wall_name, length, height = wall[0], wall[4], wall[5]
+        wall_object = Wall(wall_name, length, height, pd.DataFrame(studs, columns=STUD_COLUMNS).round(4),
+                           pd.DataFrame(doors, columns=DOOR_COLUMNS).round(4), pd.DataFrame(windows, columns=WINDOW_COLUMNS).round(4))
+        rows_height = getRowsHeight(height)
+        robot = Robot(wall_object, catalog=self.catalog)
+        robot.setRowHeight(rows_height[0])
+        return self.planner.planWall(robot, rows_height) is not None
+
+    def getOpeningRows(self, wall, openings):
+        """
+        Returns: the door or window dataframe rows of the openings of a wall
+        (a row with missing coordinates if it has none).
+        """
+        if len(openings) == 0:
+            return [[np.nan] * len(OPENING_FIELDS) + wall + [np.nan, np.nan]]
+        return [[x0, y0, 0.0, x1, y1, 0.0, self.getID(), round(x1 - x0, 4), y0] + wall + [x1, x0] for x0, y0, x1, y1, kind in openings]
+
+    def getOpenings(self, length, height):
+        """
+        Returns: a list of non-overlapping openings (x0, y0, x1, y1, kind) of
+        a long wall, from left to right, at least OPENING_MARGIN apart and
+        from the ends of the wall.
+        """
+        count = self.rng.poisson(self.opening_density * length / 10)
+        kinds = ['door' if self.rng.random() < DOOR_SHARE else 'window' for i in range(count)]
+        widths = [roundToSixteenth(self.rng.uniform(*(DOOR_WIDTH if kind == 'door' else WINDOW_WIDTH))) for kind in kinds]
+
+        #Drop openings until they fit in the wall
+        while len(widths) != 0 and sum(widths) + (len(widths) + 1) * OPENING_MARGIN > length:
+            kinds.pop()
+            widths.pop()
+        if len(widths) == 0:
+            return []
+
+        #Split the free length between the gaps around the openings
+        free = length - sum(widths) - (len(widths) + 1) * OPENING_MARGIN
+        gaps = self.rng.dirichlet(np.ones(len(widths) + 1)) * free
+        openings = []
+        x = 0
+        for kind, width, gap in zip(kinds, widths, gaps):
+            x0 = roundToSixteenth(x + OPENING_MARGIN + gap)
+            y0, y1 = DOOR_Y if kind == 'door' else WINDOW_Y
+            openings.append((x0, y0, x0 + width, min(y1, height), kind))
+            x = x0 + width
+        return openings
+
+    def getStudRows(self, wall, stud_type, openings):
+        """
+        Returns: the stud dataframe rows of a wall: the end studs, the OC
+        studs at the stud spacing (cripples within the openings) and a king
+        and a jack stud at each side of the openings.
+        """
+        length = wall[4]
+        studs = [(STUD_WIDTH / 2, 'OC'), (length - STUD_WIDTH / 2, 'OC')]
+        for x in np.arange(1, int(length / self.stud_spacing) + 1) * self.stud_spacing:
+            if x < length - STUD_WIDTH:
+                inside = any(x0 < x < x1 for x0, y0, x1, y1, kind in openings)
+                studs.append((x, 'Cripple' if inside else 'OC'))
+        for x0, y0, x1, y1, kind in openings:
+            studs += [(x0 - STUD_WIDTH * 1.5, 'King'), (x0 - STUD_WIDTH / 2, 'Jack'), (x1 + STUD_WIDTH / 2, 'Jack'), (x1 + STUD_WIDTH * 1.5, 'King')]
+
+        plate_ID = self.getID()
+        rows = []
+        for x, function in sorted(studs):
+            x = round(float(x), 6)
+            rows.append([x, 0.0, 0.125, function, self.getID(), stud_type, True, True,
+                         0.0, 0.0, 0.0, length, 0.0, 0.0, 'BottomPlate', plate_ID, stud_type] + wall[:5] + [x])
+        return rows
+
+
+def generateHouses(num_houses=1, floors=2, walls_per_floor=25, stud_spacing=16, opening_density=0.3, height_mix=None, seed=0, catalog=None):
+    '''
+    Generate the input dataframes of synthetic houses (see
+    SyntheticHouseGenerator).
+
+    Returns: the walls, studs, doors and windows dataframes.
+    '''
+    generator = SyntheticHouseGenerator(stud_spacing, opening_density, height_mix, seed, catalog)
+    return generator.generate(num_houses, floors, walls_per_floor)
+
+
+def writeHouses(output_dir, num_houses=1, floors=2, walls_per_floor=25, stud_spacing=16, opening_density=0.3, height_mix=None, seed=0):
+    '''
+    Generate synthetic houses and write them as input files to output_dir,
+    with the file names of the DataLoader (and a copy of the bundled drywall
+    sheets), so the simulation can read them with --data-dir output_dir.
+
+    Raises ValueError if output_dir is the directory of the bundled input
+    files (DATA_DIR), which would be overwritten.
+
+    Returns: the DataLoader file names written, by dataframe.
+    '''
+    if os.path.abspath(output_dir) == os.path.abspath(DATA_DIR):
+        raise ValueError('The output directory must not be the directory of the bundled input files: ' + DATA_DIR)
+    frames = generateHouses(num_houses, floors, walls_per_floor, stud_spacing, opening_density, height_mix, seed)
+    os.makedirs(output_dir, exist_ok=True)
+    filenames = {'walls': WALLS_FILENAME, 'studs': STUDS_FILENAME, 'doors': DOORS_FILENAME, 'windows': WINDOWS_FILENAME}
+    for filename, df in zip(filenames.values(), frames):
+        df.to_csv(os.path.join(output_dir, filename), index=False)
+    shutil.copyfile(os.path.join(DATA_DIR, DRYWALLS_FILENAME), os.path.join(output_dir, DRYWALLS_FILENAME))
+    return filenames
+
+
+def parseHeightMix(values):
+    '''
+    Parse the --heights arguments, 'height:weight' (weight 1 if missing).
+
+    Returns: dictionary {height: weight}.
+    '''
+    height_mix = {}
+    for value in values:
+        height, _, weight = value.partition(':')
+        height_mix[float(height)] = float(weight) if weight != '' else 1.0
+    return height_mix
+
+
+def main(argv=None):
+    '''
+    Command line entry point: write the input files of synthetic houses.
+    '''
+    parser = argparse.ArgumentParser(description='Generate the walls, studs, doors and windows input files of synthetic houses.')
+    parser.add_argument('output_dir', help='directory of the generated input files')
+    parser.add_argument('--houses', type=int, default=1, help='number of houses (default: 1)')
+    parser.add_argument('--floors', type=int, default=2, help='number of floors per house (default: 2)')
+    parser.add_argument('--walls-per-floor', type=int, default=25, help='number of walls per floor (default: 25)')
+    parser.add_argument('--stud-spacing', type=int, default=16, choices=[16, 24], help='OC spacing of the studs in inches (default: 16)')
+    parser.add_argument('--opening-density', type=float, default=0.3, help='mean number of openings per 10 ft of long wall (default: 0.3)')
+    parser.add_argument('--heights', nargs='+', default=None, metavar='HEIGHT[:WEIGHT]', help='wall heights in ft and their weights (default: the heights of the bundled house)')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generator (default: 0)')
+    args = parser.parse_args(argv)
+
+    height_mix = None if args.heights is None else parseHeightMix(args.heights)
+    writeHouses(args.output_dir, args.houses, args.floors, args.walls_per_floor, args.stud_spacing, args.opening_density, height_mix, args.seed)
+    print('%s houses x %s floors x %s walls written to %s' % (args.houses, args.floors, args.walls_per_floor, args.output_dir))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:02:11 2026
+
+@author: jcuellar
+"""
+
+#The simulation modules are imported from the root of the repository
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from data_loader import getDefaultLoader
+from floor_optimizer import createWalls
+import simulation
+
+#Columns of the result tables holding simulation objects
+OBJECT_COLUMNS = ['vertical_cut', 'horizontal_cut', 'door_clipper', 'window_clipper', 'drywall_object', 'cut_object']
+
+
+@pytest.fixture(scope='session')
+def loader():
+    return getDefaultLoader()
+
+
+@pytest.fixture()
+def walls(loader):
+    #New Wall objects of the house, in the order of the walls dataframe
+    return createWalls(loader.getWalls(), loader.getStuds(), loader.getDoors(), loader.getWindows(), loader.getWallGeometry())
+
+
+@pytest.fixture()
+def run_house():
+    def runHouse(*argv):
+        """
+        Run the command line simulation of the house.
+
+        Returns: the drywall, waste and joints tables, without the columns
+        holding simulation objects.
+        """
+        house = simulation.main(list(argv) + ['--log-level', 'WARNING'])
+        tables = [house.getDrywallDF(), house.getWasteDF(), house.getJointsDF()]
+        return [df.drop(columns=[c for c in OBJECT_COLUMNS if c in df.columns]) for df in tables]
+    return runHouse
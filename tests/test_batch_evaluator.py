@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:52:40 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import pytest
+
+from basic_classes import Drywall, Cut, Position, getRowsHeight, verticalPossibility
+from batch_evaluator import BatchEvaluator, REJECTED, SHEET, OFFCUT
+from robot_class import Robot
+from wall_planner import CheapestSheetPlanner
+
+#Widths of the cuts added to the offcut inventory of the wall (the first one
+#is narrower than a reusable cut)
+CUT_WIDTHS = [1.0, 1.5, 2.3333, 2.6667, 3.1, 4.0, 5.5, 7.25]
+
+
+def setUpRobot(wall, catalog, x, row):
+    '''
+    Returns: a Robot on the reset wall at (x, row), the row below with joints
+    4' and 8' right of x, and the keys of the cuts of the wall inventory.
+    '''
+    wall.reset()
+    robot = Robot(wall, catalog=catalog)
+    robot.setRowHeight(getRowsHeight(wall.getHeight())[row])
+    robot.setRowNumber(row)
+    robot.setRobotPosition(Position(x, 4 * row))
+    if row != 0:
+        wall.setJoints(row - 1, [x + 4, x + 8])
+    drywall = Drywall('4x8', 4, 8, None, 32)
+    keys = []
+    for i, width in enumerate(CUT_WIDTHS):
+        name = 'cut_' + str(i)
+        cut = Cut(drywall, width, 4, 'vertical_cut', name)
+        keys.append(wall.getOffcuts().add(('Simulation_0', wall.getName(), drywall.getID(), name, 0, 0, 4, width, 4 * width, 'vertical_cut', 0), cut))
+    return robot, keys
+
+
+def test_batch_matches_the_placement_of_each_piece(loader, walls):
+    catalog = loader.getCatalog()
+    evaluator = BatchEvaluator(catalog)
+    checked = 0
+    for wall in walls[:20]:
+        if verticalPossibility(wall.getLength(), wall.getHeight(), catalog) == True:
+            continue
+        studs = wall.getStudIndex().getLocations()
+        for x, row in [(0, 0), (float(studs[len(studs) // 2]), 1)]:
+            robot, keys = setUpRobot(wall, catalog, x, row)
+            batch = evaluator.evaluate(robot, offcuts=wall.getOffcuts(), min_area=0)
+            assert len(batch.getOffcuts()) == len(CUT_WIDTHS) - 1
+            for i in range(len(batch)):
+                robot, new_keys = setUpRobot(wall, catalog, x, row)
+                if batch.kind[i] == SHEET:
+                    placed = robot.placeSheet(catalog.getSheets()[batch.index[i]])
+                else:
+                    placed = robot.reuseCut(wall.getOffcuts(), new_keys[keys.index(batch.index[i])])
+                assert placed == (batch.status[i] != REJECTED)
+                if placed:
+                    #The robot is at the right edge of the piece (past the
+                    #end of the wall for the last piece of the row)
+                    assert robot.getDrywall().getWidth() == pytest.approx(batch.width[i])
+                    if robot.wall.isPositionInWall(robot.getRobotPosition()):
+                        assert robot.getRobotPosition().getX() == pytest.approx(batch.edge_x[i])
+                checked += 1
+    assert checked != 0
+
+
+def test_cheapest_planner_picks_the_cheapest_piece(loader, walls):
+    catalog = loader.getCatalog()
+    planner = CheapestSheetPlanner(catalog)
+    kinds = set()
+    for wall in walls[:20]:
+        if verticalPossibility(wall.getLength(), wall.getHeight(), catalog) == True:
+            continue
+        robot, keys = setUpRobot(wall, catalog, 0, 0)
+        batch, costs = planner.getCosts(robot, wall.getOffcuts())
+        kind, index = planner.getNextPiece(robot, wall.getOffcuts())
+        best = [i for i in range(len(batch)) if costs[i] == costs.min()]
+        #Cuts first at the same cost
+        assert (kind, index) == min((batch.kind[i] == SHEET, i, batch.kind[i], batch.index[i]) for i in best)[2:]
+        kinds.add(kind)
+        kinds.add(planner.getNextPiece(robot)[0])
+        assert planner.getNextSheet(robot) is catalog.getSheets()[int(min(range(len(catalog.getSheets())), key=lambda i: (costs[i], i)))]
+    assert kinds == {SHEET, OFFCUT}
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:47:21 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import math
+import numpy as np
+import pytest
+
+from convergence import RunningStats, ConvergenceMonitor, Z_95
+
+
+def test_running_stats_match_numpy():
+    rng = np.random.default_rng(13)
+    values = rng.normal(100, 15, 500)
+    stats = RunningStats()
+    for trial, value in enumerate(values):
+        stats.add(value, trial)
+    assert stats.getCount() == len(values)
+    assert stats.getMean() == pytest.approx(np.mean(values))
+    assert stats.getStd() == pytest.approx(np.std(values, ddof=1))
+    assert stats.getHalfWidth() == pytest.approx(Z_95 * np.std(values, ddof=1) / math.sqrt(len(values)))
+    assert stats.getBest() == values.min()
+    assert stats.getBestTrial() == int(np.argmin(values))
+
+
+def test_running_stats_with_less_than_two_values():
+    stats = RunningStats()
+    stats.add(3.5)
+    assert math.isnan(stats.getStd())
+    assert stats.getHalfWidth() == float('inf')
+
+
+def test_walls_converge_and_stop_converging_when_they_improve():
+    monitor = ConvergenceMonitor(tolerance=1, min_trials=3, patience=2)
+    for trial in range(3):
+        monitor.update('floor', trial, [('a', 10), ('b', 20)])
+    assert monitor.isWallConverged('floor', 'a')
+    assert monitor.isFloorConverged('floor')
+    assert monitor.isDone('floor')
+    #A new best value of the wall: no longer converged
+    monitor.update('floor', 3, [('a', 5), ('b', 20)])
+    assert not monitor.isWallConverged('floor', 'a')
+    assert monitor.isWallConverged('floor', 'b')
+    assert not monitor.isDone('floor')
+
+
+def test_floor_needs_a_stable_total():
+    monitor = ConvergenceMonitor(tolerance=1, min_trials=3)
+    #Every wall within +- 1 ft2, but the walls vary together: the total does not
+    for trial, loss in enumerate([10, 10.8] * 3):
+        monitor.update('floor', trial, [(wall_name, loss) for wall_name in 'abcd'])
+    assert all(monitor.isWallConverged('floor', wall_name) for wall_name in 'abcd')
+    assert not monitor.isFloorStable('floor')
+    assert not monitor.isFloorConverged('floor')
+    assert not monitor.isDone('floor')
+
+
+def test_time_budget_is_shared_by_the_floors_after_min_trials():
+    monitor = ConvergenceMonitor(time_budget=0, min_trials=2)
+    monitor.startFloor('first', remaining_floors=2)
+    assert monitor.isOutOfTime('first')
+    #Every floor runs min_trials trials, even out of time
+    monitor.update('first', 0, [('a', 1)])
+    assert not monitor.isDone('first')
+    monitor.update('first', 1, [('a', 1)])
+    assert monitor.isDone('first')
+
+
+def test_time_budget_split():
+    monitor = ConvergenceMonitor(time_budget=100)
+    monitor.startFloor('first', remaining_floors=4)
+    assert monitor.deadlines['first'] == pytest.approx(25, abs=0.1)
+    assert not monitor.isOutOfTime('first')
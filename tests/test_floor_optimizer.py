@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:33:58 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import itertools
+import numpy as np
+
+from floor_optimizer import maxWeightMatching
+
+
+def bruteMaxWeight(weights, edges, num_right):
+    '''
+    Weight of the maximum weight matching, trying every assignment of the
+    left vertices (None: not matched).
+    '''
+    best = 0
+    for assignment in itertools.product(*[[None] + list(right) for right in edges]):
+        used = [right for right in assignment if right is not None]
+        if len(used) == len(set(used)):
+            best = max(best, sum(weights[left] for left, right in enumerate(assignment) if right is not None))
+    return best
+
+
+def test_matching_has_the_max_weight():
+    rng = np.random.default_rng(11)
+    for test in range(200):
+        num_left, num_right = rng.integers(1, 6), rng.integers(1, 5)
+        weights = rng.choice([8, 12, 16, 32], num_left).tolist()
+        edges = [sorted(rng.choice(num_right, rng.integers(0, num_right + 1), replace=False).tolist()) for left in range(num_left)]
+        matching = maxWeightMatching(weights, edges)
+        #A valid matching: each vertex matched once, along an edge
+        assert len(set(matching.values())) == len(matching)
+        assert all(right in edges[left] for left, right in matching.items())
+        assert sum(weights[left] for left in matching) == bruteMaxWeight(weights, edges, num_right)
+
+
+def test_matching_follows_the_order_of_preference():
+    assert maxWeightMatching([1], [[1, 0]]) == {0: 1}
+    #A gap matched first can be moved to another cut to match a later gap
+    assert maxWeightMatching([2, 1], [[0, 1], [0]]) == {0: 1, 1: 0}
+    #The heavier gap gets the only cut
+    assert maxWeightMatching([1, 2], [[0], [0]]) == {1: 0}
+    assert maxWeightMatching([], []) == {}
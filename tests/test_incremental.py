@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:12:47 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from data_loader import DATA_DIR, WALLS_FILENAME, STUDS_FILENAME, DOORS_FILENAME, WINDOWS_FILENAME, DRYWALLS_FILENAME
+
+
+def copyInputs(data_dir):
+    for filename in (WALLS_FILENAME, STUDS_FILENAME, DOORS_FILENAME, WINDOWS_FILENAME, DRYWALLS_FILENAME):
+        shutil.copy(os.path.join(DATA_DIR, filename), data_dir / filename)
+
+
+def moveFirstWindow(data_dir, offset=1.0):
+    #Slide the first window of the house along its wall
+    path = data_dir / WINDOWS_FILENAME
+    df_windows = pd.read_csv(path)
+    index = df_windows['Windows.Openning.StartPoint.Attribute:X'].first_valid_index()
+    for column in ('Windows.Openning.StartPoint.Attribute:X', 'Windows.Openning.EndPoint.Attribute:X'):
+        df_windows.loc[index, column] += offset
+    df_windows.to_csv(path, index=False)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_edited_window_gives_the_results_of_a_fresh_run(run_house, tmp_path, workers):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    copyInputs(data_dir)
+    argv = ['--trials', '2', '--workers', str(workers), '--data-dir', str(data_dir)]
+    state_file = str(tmp_path / 'state.pkl')
+    before = run_house(*argv, '--incremental', state_file)
+    moveFirstWindow(data_dir)
+    edited = run_house(*argv, '--incremental', state_file)
+    fresh = run_house(*argv, '--incremental', str(tmp_path / 'fresh.pkl'))
+    for edited_df, fresh_df in zip(edited, fresh):
+        pd.testing.assert_frame_equal(edited_df, fresh_df)
+    #The edit is seen by the incremental run
+    assert not before[0].equals(edited[0])
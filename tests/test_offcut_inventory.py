@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:11:52 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import numpy as np
+
+from basic_classes import Drywall, Cut, Position
+from offcut_inventory import OffcutInventory
+
+
+COLUMNS = ['name', 'wall', 'width', 'height']
+
+
+def createInventory(pieces):
+    """
+    pieces: list of (width, height).
+    """
+    inventory = OffcutInventory(COLUMNS)
+    drywall = Drywall('sheet', 4, 8)
+    for i, (width, height) in enumerate(pieces):
+        cut = Cut(drywall, width, height, 'vertical_cut', 'cut_' + str(i))
+        inventory.add(('cut_' + str(i), 'wall_' + str(i % 2), width, height), cut)
+    return inventory
+
+
+def randomPieces(seed, size=60):
+    rng = np.random.default_rng(seed)
+    widths = np.round(rng.uniform(0.5, 8, size), 2)
+    heights = rng.choice([2.0, 3.5, 4.0, 4.5], size)
+    return list(zip(widths.tolist(), heights.tolist()))
+
+
+def test_iterLargestPieces_matches_a_scan_of_the_pieces():
+    pieces = randomPieces(1)
+    inventory = createInventory(pieces)
+    keys = list(inventory.iterLargestPieces(3.5, 1.33333, 2))
+    eligible = [i for i, (width, height) in enumerate(pieces) if height >= 3.5 and width > 1.33333 and width >= 2]
+    #Largest area first, pieces with the same area in the order they were added
+    assert keys == sorted(eligible, key=lambda i: (-pieces[i][0] * pieces[i][1], i))
+
+
+def test_findLargestOnStud_matches_a_scan_of_the_pieces():
+    pieces = randomPieces(2)
+    inventory = createInventory(pieces)
+    position = Position(1.25, 0)
+    studs = [1.25 + 16 / 12 * i for i in range(1, 8)]
+    found = inventory.findLargestOnStud(position, 3.5, 1.33333, 2, studs)
+    on_stud = [i for i, (width, height) in enumerate(pieces) if height >= 3.5 and width > 1.33333 and width >= 2
+               and any(abs(position.getNewPosition(width, 0).getX() - x) <= 0.0625 for x in studs)]
+    assert found == max(on_stud, key=lambda i: (pieces[i][0] * pieces[i][1], -i))
+
+
+def test_add_replaces_a_piece_with_the_same_name():
+    inventory = createInventory([(2, 4), (3, 4)])
+    drywall = Drywall('sheet', 4, 8)
+    key = inventory.add(('cut_0', 'wall_0', 5, 4), Cut(drywall, 5, 4, 'vertical_cut', 'cut_0'))
+    assert len(inventory) == 2
+    assert inventory.getCut(key).getWidth() == 5
+    assert inventory.toDataFrame()['name'].tolist() == ['cut_1', 'cut_0']
+
+
+def test_remove_and_findPiece():
+    inventory = createInventory([(2, 4), (3, 4), (3, 4)])
+    assert inventory.findPiece(4, 3) == 1
+    assert inventory.findPiece(4, 3, wall='wall_0') == 2
+    inventory.remove(1)
+    assert inventory.findPiece(4, 3) == 2
+    inventory.remove(0)
+    inventory.remove(2)
+    assert inventory.isEmpty()
+    assert list(inventory.iterLargestPieces(0, 0, 0)) == []
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:14:05 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+from basic_classes import Cut
+from offcut_registry import OffcutRegistry, SheetRecord
+from trial_random import TrialRandom
+from wall_class import WASTE_COLUMNS
+
+
+def createWaste():
+    #Three offcuts of two sheets, and a sheet with no offcut left
+    registry = OffcutRegistry()
+    for i, ID in enumerate(['Drywall_4x8_1', 'Drywall_4x12_2', 'Drywall_4x8_3']):
+        registry.addSheet(SheetRecord(ID, 32.0 if '4x8' in ID else 48.0, 1, TrialRandom(i)))
+    df_waste = pd.DataFrame([[0, 848959, 'Drywall_4x8_1', 'Drywall_4x8_1_Cut_1', 2.5, 0.0, 8.0, 1.5, 12.0, 'vertical_cut', 1],
+                             [0, 848959, 'Drywall_4x8_1', 'Drywall_4x8_1_Cut_2', 0.0, 8.0, 1.09375, 4.0, 4.375, 'horizontal_cut', 2],
+                             [0, 848960, 'Drywall_4x12_2', 'Drywall_4x12_2_Cut_3', 6.0, 0.0, 9.09375, 3.25, 29.5547, 'vertical_cut', 1]],
+                            columns=WASTE_COLUMNS)
+    return df_waste, registry
+
+
+def rebuildCuts(df_waste, registry):
+    #The cuts of the waste table, then a new cut of the sheet of each one
+    rows = []
+    for row in df_waste[WASTE_COLUMNS].itertuples(index=False, name=None):
+        simulation_number, wall_name, drywall_ID, name, x, y, height, width, area, cut_type, no_cuts = row
+        cut = registry.createCut(drywall_ID, name, height, width, cut_type, x, y, no_cuts, wall_name)
+        new_cut = Cut(cut.getDrywall(), 1.0, 1.0, 'vertical_cut')
+        rows.append((cut.getName(), cut.getID(), cut.getHeight(), cut.getWidth(), cut.getType(), cut.getPosition().getX(), cut.getPosition().getY(), cut.getNoCuts(), cut.getWallName(), new_cut.getName()))
+    return rows
+
+
+def test_pickled_waste_and_registry_rebuild_the_same_cuts():
+    df_waste, registry = createWaste()
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        rebuilt = executor.submit(rebuildCuts, df_waste, registry).result()
+    assert rebuilt == rebuildCuts(*createWaste())
+    assert [row[0] for row in rebuilt] == df_waste['name'].tolist()
+
+
+def test_cuts_of_a_sheet_share_its_record():
+    df_waste, registry = createWaste()
+    first, second = [registry.createCut(row['drywall_ID'], row['name'], row['height'], row['width'], row['type_of_cut'], row['start_point_x'], row['start_point_y'], row['no_cuts'], row['wall']) for _, row in df_waste.iloc[:2].iterrows()]
+    assert first.getDrywall() is second.getDrywall() is registry.getSheet('Drywall_4x8_1')
+
+
+def test_prune_only_drops_sheets_with_no_row_left():
+    df_waste, registry = createWaste()
+    registry.prune(df_waste['drywall_ID'])
+    assert len(registry) == 2
+    assert 'Drywall_4x8_1' in registry and 'Drywall_4x12_2' in registry
+    assert 'Drywall_4x8_3' not in registry
+    #One of the two offcuts of a sheet is used up: the sheet is kept
+    registry.prune(df_waste['drywall_ID'].iloc[1:])
+    assert len(registry) == 2
+    registry.prune(df_waste['drywall_ID'].iloc[2:])
+    assert list(registry.sheets) == ['Drywall_4x12_2']
+
+
+def test_unknown_sheet_raises_key_error():
+    df_waste, registry = createWaste()
+    registry.prune(df_waste['drywall_ID'])
+    with pytest.raises(KeyError):
+        registry.getSheet('Drywall_4x8_3')
+    with pytest.raises(KeyError):
+        registry.createCut('Drywall_4x8_3', 'Drywall_4x8_3_Cut_4', 8.0, 1.0, 'vertical_cut', 0.0, 0.0, 1, 848959)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:37:46 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import numpy as np
+import pandas as pd
+
+from openings import Openings, DOOR_COLUMNS, WINDOW_COLUMNS
+
+
+def bruteCornerRule(rects, x, y, door):
+    '''
+    Corner rule of an edge at (x, y), one opening at a time: the first
+    opening whose corner zone contains x is checked against the row.
+    '''
+    for x0, y0, x1, y1, kind in rects:
+        if door == True:
+            around = (x0 - 1 < x < x0 + 1) or (x1 - 0.125 < x < x1 + 1)
+        else:
+            around = (x0 - 1 <= x <= x0 + 0.125) or (x1 - 0.125 <= x <= x1 + 0.8)
+        if around:
+            return not (((y < y0) and (y + 4 < y0)) or (y > y1))
+    return False
+
+
+def createOpenings():
+    doors = pd.DataFrame([[2.0, 0.0, 5.0, 6.8], [5.5, 0.0, 8.0, 6.8]], columns=DOOR_COLUMNS)
+    windows = pd.DataFrame([[10.0, 3.0, 13.0, 7.0], [np.nan, np.nan, np.nan, np.nan]], columns=WINDOW_COLUMNS)
+    return Openings(doors, windows)
+
+
+def test_corner_rules_match_a_scan_of_the_openings():
+    openings = createOpenings()
+    xs = np.round(np.arange(0, 15, 0.0625), 4)
+    broken = []
+    for y in [0, 4, 8]:
+        doors = [bruteCornerRule(openings.getDoors(), x, y, True) for x in xs]
+        windows = [bruteCornerRule(openings.getWindows(), x, y, False) for x in xs]
+        assert openings.areAroundDoorCorners(xs, y).tolist() == doors
+        assert openings.areAroundWindowCorners(xs, y).tolist() == windows
+        broken.append((any(doors), any(windows)))
+    #Doors up to 6.8', the window from 3' to 7'
+    assert broken == [(True, True), (True, True), (False, False)]
+
+
+def test_corner_rules_of_the_walls_of_the_house(walls):
+    xs = np.round(np.arange(0, 60, 0.125), 4)
+    for wall in walls:
+        openings = wall.getOpenings()
+        for y in [0, 4]:
+            assert openings.areAroundDoorCorners(xs, y).tolist() == [bruteCornerRule(openings.getDoors(), x, y, True) for x in xs]
+            assert openings.areAroundWindowCorners(xs, y).tolist() == [bruteCornerRule(openings.getWindows(), x, y, False) for x in xs]
+
+
+def test_openings_with_missing_coordinates_are_not_clipped():
+    openings = createOpenings()
+    assert openings.getNumDoors() == 2 and openings.getNumWindows() == 2
+    assert openings.clipDoors() == True
+    assert openings.clipWindows() == False
+    assert openings.getDoorInCornerZone(4.9)[0] == 2.0
+    assert openings.getDoorInCornerZone(9) is None
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:58:36 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import types
+
+import pytest
+
+import phase_timer
+from phase_timer import timer, timed, enableTiming, disableTiming, SHEET_SELECTION, STUD_LOOKUP, TIMING_COLUMNS
+
+#Fake clock (ns) moved forward by the timed functions below
+clock = [0]
+
+
+def tick(ns):
+    clock[0] += ns
+
+
+@timed(STUD_LOOKUP)
+def lookup():
+    tick(5)
+
+
+@timed(STUD_LOOKUP)
+def outerLookup():
+    #Same phase: the inner lookup is part of this call
+    tick(1)
+    lookup()
+    tick(1)
+
+
+@timed(SHEET_SELECTION)
+def select():
+    tick(10)
+    lookup()
+    outerLookup()
+    tick(3)
+
+
+@pytest.fixture()
+def fake_clock(monkeypatch):
+    clock[0] = 0
+    monkeypatch.setattr(phase_timer, 'time', types.SimpleNamespace(perf_counter_ns=lambda: clock[0]))
+    enableTiming()
+    yield clock
+    disableTiming()
+    timer.reset()
+
+
+def test_phases_count_their_self_time(fake_clock):
+    select()
+    #select: 25 ns, 12 of them in the stud lookups (5 + 7)
+    assert timer.getCounters() == {SHEET_SELECTION: (1, 13), STUD_LOOKUP: (2, 12)}
+    df = timer.collect(0, 'floor', 'wall')
+    assert list(df.columns) == TIMING_COLUMNS
+    assert df['ns'].sum() == 25
+    assert timer.getCounters() == {}
+
+
+def test_same_phase_inner_calls_are_not_counted_again(fake_clock):
+    outerLookup()
+    lookup()
+    assert timer.getCounters() == {STUD_LOOKUP: (2, 12)}
+
+
+def test_disabled_timer_counts_nothing(fake_clock):
+    disableTiming()
+    select()
+    assert timer.getCounters() == {}
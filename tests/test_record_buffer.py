@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:04:37 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import pandas as pd
+
+from record_buffer import RecordBuffer
+from wall_class import DRYWALL_DTYPES, WASTE_DTYPES, JOINTS_DTYPES
+
+
+def createBuffer():
+    buffer = RecordBuffer(['name', 'width', 'no_cuts'], {'width': 'float64', 'no_cuts': 'int64'})
+    buffer.extend([('a', 4, 0), ('b', 2.5, 1), ('a', 1, 2)])
+    return buffer
+
+
+def test_toDataFrame_matches_the_rows_and_dtypes():
+    df = createBuffer().toDataFrame()
+    expected = pd.DataFrame({'name': ['a', 'b', 'a'], 'width': [4.0, 2.5, 1.0], 'no_cuts': [0, 1, 2]})
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_frame_is_rebuilt_after_a_change():
+    buffer = createBuffer()
+    first = buffer.toDataFrame()
+    assert buffer.toDataFrame() is first
+    buffer.setValue(1, 'width', 3)
+    assert buffer.toDataFrame()['width'].tolist() == [4.0, 3.0, 1.0]
+
+
+def test_dropWhere_and_findRows():
+    buffer = createBuffer()
+    assert buffer.findRows('name', 'a') == [0, 2]
+    buffer.dropWhere('name', 'a')
+    assert len(buffer) == 1
+    assert list(buffer.iterRows()) == [('b', 2.5, 1)]
+
+
+def test_appendBuffer_and_clear():
+    buffer = createBuffer()
+    buffer.appendBuffer(createBuffer())
+    assert len(buffer) == 6
+    assert buffer.getColumn('name') == ['a', 'b', 'a', 'a', 'b', 'a']
+    buffer.clear()
+    assert buffer.isEmpty()
+    assert len(buffer.toDataFrame()) == 0
+
+
+def test_waste_table_keeps_the_numeric_dtypes(run_house):
+    drywall, waste, joints = run_house('--trials', '2', '--min-area', '2')
+    for df, dtypes in [(drywall, DRYWALL_DTYPES), (waste, WASTE_DTYPES), (joints, JOINTS_DTYPES)]:
+        assert len(df) != 0
+        for column, dtype in dtypes.items():
+            assert df[column].dtype == dtype, column
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:48:20 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import numpy as np
+import pytest
+
+from basic_classes import Position, rectangleIntersection, getRectangleBounds, getFourCoordinates
+
+pyclipper = pytest.importorskip('pyclipper')
+
+
+def clipperIntersection(subject, clip):
+    '''
+    Returns: the bounds of the intersection of two rectangles computed by
+    pyclipper, or None if it is empty.
+    '''
+    pc = pyclipper.Pyclipper()
+    pc.AddPath(pyclipper.scale_to_clipper(getFourCoordinates(Position(clip[0], clip[1]), clip[2] - clip[0], clip[3] - clip[1])), pyclipper.PT_CLIP, True)
+    pc.AddPath(pyclipper.scale_to_clipper(getFourCoordinates(Position(subject[0], subject[1]), subject[2] - subject[0], subject[3] - subject[1])), pyclipper.PT_SUBJECT, True)
+    solution = pc.Execute(pyclipper.CT_INTERSECTION, pyclipper.PFT_EVENODD, pyclipper.PFT_EVENODD)
+    if len(solution) == 0:
+        return None
+    return getRectangleBounds(pyclipper.scale_from_clipper(solution[0]))
+
+
+def randomRectangles(rng, size):
+    #Corners on a 1/16' grid, some rectangles only touch the subject
+    x0 = rng.integers(0, 160, size) / 16
+    y0 = rng.integers(0, 130, size) / 16
+    return np.column_stack([x0, y0, x0 + rng.integers(1, 64, size) / 16, y0 + rng.integers(1, 64, size) / 16])
+
+
+def test_intersection_matches_pyclipper():
+    rng = np.random.default_rng(5)
+    for subject in randomRectangles(rng, 20):
+        clips = randomRectangles(rng, 30)
+        overlap, origin_x, origin_y, width, height = rectangleIntersection(tuple(subject), clips)
+        for i, clip in enumerate(clips):
+            expected = clipperIntersection(subject, clip)
+            assert overlap[i] == (expected is not None)
+            if expected is not None:
+                np.testing.assert_allclose([origin_x[i], origin_y[i], origin_x[i] + width[i], origin_y[i] + height[i]], expected, atol=1e-6)
+
+
+def test_touching_rectangles_do_not_overlap():
+    overlap, origin_x, origin_y, width, height = rectangleIntersection((0, 0, 4, 8), [[4, 0, 6, 8], [0, 8, 4, 9], [3, 7, 5, 9]])
+    assert overlap.tolist() == [False, False, True]
+    assert (origin_x[2], origin_y[2], width[2], height[2]) == (3, 7, 1, 1)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:21:14 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import pandas as pd
+import pytest
+
+import simulation
+from result_store import ResultStore, PARTITIONS, TABLES, toStorableFrame
+
+pytest.importorskip('pyarrow')
+
+
+def sortRows(df):
+    #Same rows in any order
+    return df.sort_values(list(df.columns), key=lambda column: column.astype(str)).reset_index(drop=True)
+
+
+def test_store_has_the_tables_of_the_simulation(tmp_path):
+    argv = ['--trials', '2', '--workers', '2', '--log-level', 'WARNING']
+    house = simulation.main(argv)
+    simulation.main(argv + ['--parquet-dir', str(tmp_path)])
+    store = ResultStore(str(tmp_path))
+    for table, df in [('drywall', house.getDrywallDF()), ('waste', house.getWasteDF()), ('joints', house.getJointsDF())]:
+        stored = store.read(table, 'Residential House Prototype')
+        assert set(stored['trial']) == {0, 1}
+        pd.testing.assert_frame_equal(sortRows(stored.drop(columns=PARTITIONS)), sortRows(toStorableFrame(df, table)))
+
+
+def test_writing_a_trial_again_replaces_it(tmp_path):
+    store = ResultStore(str(tmp_path))
+    columns = TABLES['joints'][0]
+    first = pd.DataFrame([[0, 848959, 4.0, 0.0, 4.0]], columns=columns)
+    second = pd.DataFrame([[0, 848959, 8.0, 0.0, 4.0], [0, 848959, 12.0, 0.0, 4.0]], columns=columns)
+    store.writeTrial('house', 'floor 1', 0, [], [first], pd.DataFrame())
+    store.writeTrial('house', 'floor/2', 0, [], [first], pd.DataFrame())
+    store.writeTrial('house', 'floor 1', 0, [], [second], pd.DataFrame())
+    df = store.getJointsDF('house', 'floor 1')
+    assert df['x'].tolist() == [8.0, 12.0]
+    assert set(store.getJointsDF('house')['floor']) == {'floor 1', 'floor/2'}
+    assert len(store.getJointsDF('house', trials=[1])) == 0
+    assert len(store.getDrywallDF()) == 0
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:19:43 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import pytest
+
+from basic_classes import Position, getRowsHeight, verticalPossibility
+from batch_evaluator import LAST
+from robot_class import Robot
+from row_solver import RowSolver
+
+
+def getHorizontalWalls(walls, catalog):
+    return [wall for wall in walls if verticalPossibility(wall.getLength(), wall.getHeight(), catalog) == False]
+
+
+def createRobot(wall, catalog):
+    robot = Robot(wall, catalog=catalog)
+    robot.setRowHeight(getRowsHeight(wall.getHeight())[0])
+    return robot
+
+
+def getMinCost(solver, robot, x, memo):
+    '''
+    Lowest cutting loss of the rest of the row from an edge at x, one
+    transition at a time (inf if the row cannot be completed).
+    '''
+    if (robot.wall.getLength() - 0.125) <= x:
+        return 0
+    if x not in memo:
+        memo[x] = float('inf')
+        sheets = solver.getCatalog().getSheets()
+        for status, edge, width, index in solver.getTransitions(robot, Position(x, 0)):
+            loss = sheets[index].getNominalArea() - width * robot.getRowHeight()
+            rest = 0 if status == LAST else getMinCost(solver, robot, edge.getX(), memo)
+            memo[x] = min(memo[x], loss + rest)
+    return memo[x]
+
+
+def test_solveRow_finds_the_lowest_cutting_loss(loader, walls):
+    catalog = loader.getCatalog()
+    solver = RowSolver(catalog)
+    for wall in getHorizontalWalls(walls, catalog):
+        robot = createRobot(wall, catalog)
+        plan = solver.solveRow(robot)
+        expected = getMinCost(solver, robot, 0, {})
+        if plan is None:
+            assert expected == float('inf')
+        else:
+            assert plan.getCost() == pytest.approx(expected, abs=1e-3)
+
+
+def test_robot_follows_the_row_plan(loader, walls):
+    catalog = loader.getCatalog()
+    solver = RowSolver(catalog)
+    for wall in getHorizontalWalls(walls, catalog)[:10]:
+        robot = createRobot(wall, catalog)
+        plan = solver.solveRow(robot)
+        for sheet, edge in zip(plan.getSheets(), plan.getEdges()):
+            assert robot.placeSheet(sheet) == True
+            assert robot.getRobotPosition().getX() == pytest.approx(edge)
+        #The row is done at the end of the wall (or within 1.5in of it)
+        assert robot.getRobotPosition().getX() >= (wall.getLength() - 0.125)
+
+
+def test_getBestRows_are_sorted_by_cost(loader, walls):
+    catalog = loader.getCatalog()
+    solver = RowSolver(catalog)
+    for wall in getHorizontalWalls(walls, catalog)[:10]:
+        robot = createRobot(wall, catalog)
+        plans = solver.getBestRows(robot, Position(0, 0), robot.getRowHeight(), k=3)
+        costs = [plan.getCost() for plan in plans]
+        assert costs == sorted(costs)
+        assert costs[0] == solver.solveRow(robot).getCost()
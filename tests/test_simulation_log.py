@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:21:47 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import json
+
+import simulation
+from simulation_log import trace
+
+
+def runHouse(loader, trace_path=None, num_workers=1):
+    return simulation.runSimulationForHouse(2, 'house', loader.getWalls().iloc[:3], loader.getStuds(), loader.getDoors(), loader.getWindows(), 10, 12,
+                                            num_workers=num_workers, trace_path=trace_path)
+
+
+def test_trace_is_only_written_by_the_traced_run(loader, tmp_path):
+    path = str(tmp_path / 'trace.jsonl')
+    runHouse(loader, path)
+    assert not trace.isEnabled()
+    with open(path) as file:
+        events = [json.loads(line) for line in file]
+    assert len(events) != 0 and {event['trial'] for event in events} == {0, 1}
+    #Untraced runs after it, serial and in a pool, do not add to the file
+    runHouse(loader)
+    runHouse(loader, num_workers=2)
+    with open(path) as file:
+        assert len(file.readlines()) == len(events)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:23:09 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import numpy as np
+import pytest
+
+from stud_index import StudIndex
+
+
+def bruteOnStud(locations, x):
+    return any((stud - 0.0625) <= x <= (stud + 0.0625) for stud in locations)
+
+
+def bruteDistanceLeftOf(locations, x):
+    left = [stud for stud in locations if stud < x]
+    return x - max(left) if len(left) != 0 else np.nan
+
+
+def test_queries_match_a_scan_of_the_studs_of_every_wall(walls):
+    rng = np.random.default_rng(3)
+    for wall in walls:
+        index = wall.getStudIndex()
+        locations = index.getLocations().tolist()
+        #Random edges and edges close to the bounds of the stud zones
+        xs = np.concatenate([rng.uniform(-1, wall.getLength() + 1, 50),
+                             np.repeat(locations, 4) + np.tile([-0.0625, 0.0625, -0.07, 0.07], len(locations))])
+        on_stud = [bruteOnStud(locations, x) for x in xs]
+        assert [index.isOnStud(x) for x in xs] == on_stud
+        assert index.areOnStuds(xs).tolist() == on_stud
+        distances = [bruteDistanceLeftOf(locations, x) for x in xs]
+        np.testing.assert_allclose(index.getDistancesToStudLeftOf(xs), distances)
+        for x, distance in zip(xs, distances):
+            if np.isnan(distance):
+                with pytest.raises(ValueError):
+                    index.getDistanceToStudLeftOf(x)
+            else:
+                assert index.getDistanceToStudLeftOf(x) == pytest.approx(distance)
+
+
+def test_unsorted_locations_with_duplicates():
+    index = StudIndex([4, 0, 2, 2])
+    assert index.getLocations().tolist() == [0, 2, 2, 4]
+    assert index.getLocationsRightOf(2) == [2, 2, 4]
+    assert index.getStudLeftOf(2) == 0
+    assert index.getStudLeftOf(2.01) == 2
+    #Plain floats, not numpy scalars, end up in the cuts and positions
+    assert all(type(x) is float for x in index.getLocationsRightOf(0) + [index.getStudLeftOf(3)])
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:41:09 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import os
+
+import pytest
+
+from data_loader import DATA_DIR, WALLS_FILENAME, DataLoader
+from synthetic_house import writeHouses
+
+
+def test_written_houses_can_be_loaded(tmp_path):
+    writeHouses(str(tmp_path), floors=1, walls_per_floor=3)
+    loader = DataLoader(str(tmp_path))
+    assert len(loader.getWalls()) == 3
+    assert len(loader.getCatalog()) > 0
+
+
+def test_bundled_input_files_are_not_overwritten():
+    path = os.path.join(DATA_DIR, WALLS_FILENAME)
+    modified = os.path.getmtime(path)
+    with pytest.raises(ValueError):
+        writeHouses(DATA_DIR + os.sep, floors=1, walls_per_floor=3)
+    assert os.path.getmtime(path) == modified
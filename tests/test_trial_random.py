@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:02:15 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import pandas as pd
+
+from trial_random import TrialRandom, getTrialSeed, getWallSeed, deriveSeed
+
+
+def test_seeds_are_stable_and_distinct():
+    assert deriveSeed(0, 'house', 'floor', 1) == deriveSeed('0', 'house', 'floor', '1')
+    seeds = {getTrialSeed(0, 'house', 'floor', trial) for trial in range(100)}
+    assert len(seeds) == 100
+    assert getTrialSeed(1, 'house', 'floor', 0) != getTrialSeed(0, 'house', 'floor', 0)
+    assert getWallSeed(7, 848959) != getWallSeed(7, 848960)
+
+
+def test_same_seed_same_draws():
+    a, b = TrialRandom(42), TrialRandom(42)
+    assert [a.choice(range(10)) for i in range(50)] == [b.choice(range(10)) for i in range(50)]
+    assert a.choices('abc', 20) == b.choices('abc', 20)
+
+
+def test_id_draws_do_not_change_the_selection_stream():
+    a, b = TrialRandom(42), TrialRandom(42)
+    b.choices('abcdef', 100)
+    assert [a.choice(range(10)) for i in range(50)] == [b.choice(range(10)) for i in range(50)]
+
+
+def test_trials_do_not_depend_on_the_number_of_workers(run_house):
+    serial = run_house('--trials', '2')
+    parallel = run_house('--trials', '2', '--workers', '2')
+    for a, b in zip(serial, parallel):
+        pd.testing.assert_frame_equal(a, b)
+
+
+def test_trials_depend_on_the_seed(run_house):
+    drywall, waste, joints = run_house('--trials', '1')
+    other, waste, joints = run_house('--trials', '1', '--seed', '1')
+    assert not drywall.equals(other)
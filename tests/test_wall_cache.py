@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:05:32 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import pandas as pd
+import pytest
+
+from row_solver import RowSolver, LayoutCost
+from wall_planner import BeamPlanner, CheapestSheetPlanner
+from wall_cache import WallCache, getWallFingerprint, isCacheable
+
+
+def getWallInputs(loader, index=0):
+    df_walls = loader.getWalls()
+    wall_name = df_walls['Attribute:ID'].iloc[index]
+    studs, doors, windows = loader.getWallGeometry().getWall(wall_name)
+    return df_walls['Attribute:Length'].iloc[index], df_walls['Attribute:Height'].iloc[index], studs, doors, windows
+
+
+def test_fingerprint_ignores_the_order_and_noise_of_the_inputs(loader):
+    catalog = loader.getCatalog()
+    length, height, studs, doors, windows = getWallInputs(loader)
+    key = getWallFingerprint(length, height, studs, doors, windows, catalog, 10, 12, RowSolver(catalog))
+    noisy = studs.iloc[::-1].copy()
+    noisy['Studs.Stud.InsertLocation.Attribute:X'] += 1e-7
+    assert getWallFingerprint(length + 1e-7, height, noisy, doors, windows, catalog, 10, 12, RowSolver(catalog)) == key
+
+
+def test_fingerprint_changes_with_the_wall_and_the_settings(loader):
+    catalog = loader.getCatalog()
+    length, height, studs, doors, windows = getWallInputs(loader)
+    planner = RowSolver(catalog)
+    key = getWallFingerprint(length, height, studs, doors, windows, catalog, 10, 12, planner)
+    moved = studs.copy()
+    moved.iloc[0, moved.columns.get_loc('Studs.Stud.InsertLocation.Attribute:X')] += 0.5
+    other_doors = pd.concat([doors, pd.DataFrame([[1.0, 0.0, 4.0, 6.8]], columns=['Doors.Openning.StartPoint.Attribute:X', 'Doors.Openning.StartPoint.Attribute:Y', 'Doors.Openning.EndPoint.Attribute:X', 'Doors.Openning.EndPoint.Attribute:Y'])])
+    keys = [getWallFingerprint(length + 1, height, studs, doors, windows, catalog, 10, 12, planner),
+            getWallFingerprint(length, height, moved, doors, windows, catalog, 10, 12, planner),
+            getWallFingerprint(length, height, studs, other_doors, windows, catalog, 10, 12, planner),
+            getWallFingerprint(length, height, studs, doors, windows, catalog, 5, 12, planner),
+            getWallFingerprint(length, height, studs, doors, windows, catalog, 10, 12, RowSolver(catalog, LayoutCost(1, 1))),
+            getWallFingerprint(length, height, studs, doors, windows, catalog, 10, 12, BeamPlanner(catalog, 2))]
+    assert key not in keys
+    assert len(set(keys)) == len(keys)
+
+
+def test_least_recently_used_layouts_are_dropped():
+    cache = WallCache(max_entries=2)
+    cache.put('a', ['4x8'])
+    cache.put('b', ['4x12'])
+    assert cache.get('a') == ['4x8']
+    cache.put('c', ['4x8', '4x8'])
+    assert cache.get('b') is None
+    assert cache.get('a') == ['4x8'] and cache.get('c') == ['4x8', '4x8']
+    assert (len(cache), cache.getHits(), cache.getMisses()) == (2, 3, 1)
+    with pytest.raises(ValueError):
+        WallCache(max_entries=0)
+
+
+def test_layouts_are_shared_through_the_directory(tmp_path):
+    WallCache(directory=str(tmp_path)).put('a', ['4x8'])
+    assert WallCache(directory=str(tmp_path)).get('a') == ['4x8']
+
+
+def test_cached_walls_give_the_same_results(run_house):
+    #Cuts of 2ft2 and more are reused: the incoming cuts are part of the keys
+    for method in ['row_dp', 'beam', 'cheapest']:
+        fresh = run_house('--trials', '2', '--method', method, '--min-area', '2')
+        cached = run_house('--trials', '2', '--method', method, '--min-area', '2', '--cache')
+        for a, b in zip(fresh, cached):
+            pd.testing.assert_frame_equal(a, b)
+
+
+def test_cheapest_sheet_planner_is_not_cached(loader, run_house):
+    assert not isCacheable(CheapestSheetPlanner(loader.getCatalog()))
+    fresh = run_house('--trials', '2', '--method', 'cheapest', '--min-area', '2')
+    cached = run_house('--trials', '2', '--method', 'cheapest', '--min-area', '2', '--cache')
+    for a, b in zip(fresh, cached):
+        pd.testing.assert_frame_equal(a, b)
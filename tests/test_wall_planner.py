@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:06:19 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import pickle
+import pandas as pd
+
+import simulation
+from basic_classes import getRowsHeight, verticalPossibility
+from robot_class import Robot
+from wall_planner import BeamPlanner
+
+
+def getMultiRowWalls(walls, catalog):
+    return [wall for wall in walls if verticalPossibility(wall.getLength(), wall.getHeight(), catalog) == False and len(getRowsHeight(wall.getHeight())) > 1]
+
+
+def test_beam_planner_follows_its_plan(loader, walls):
+    catalog = loader.getCatalog()
+    planner = BeamPlanner(catalog, 2)
+    plans = []
+    planWall = planner.planWall
+
+    def countPlans(robot, rows_height):
+        plans.append(robot.getRobotPosition())
+        return planWall(robot, rows_height)
+
+    planner.planWall = countPlans
+    sheets = 0
+    for wall in getMultiRowWalls(walls, catalog)[:5]:
+        studs, doors, windows = loader.getWallGeometry().getWall(wall.getName())
+        wall = simulation.runSimulation_Wall_to_Wall(0, wall.getName(), wall.getLength(), wall.getHeight(), studs, doors, windows, pd.DataFrame(), 10, 12, catalog=catalog, planner=planner)
+        sheets += len(wall.getWallDataframe())
+    #Planned again only when the robot leaves the plan, not for every sheet
+    assert 0 < len(plans) < sheets
+    #The plan is not sent to other processes
+    del planner.planWall
+    copy = pickle.loads(pickle.dumps(planner))
+    assert copy.wall is None and copy.steps == []
+    assert planner.steps != []
+
+
+def test_next_row_is_staggered_against_the_nailed_joints(loader, walls):
+    catalog = loader.getCatalog()
+    checked = 0
+    for wall in getMultiRowWalls(walls, catalog):
+        planner = BeamPlanner(catalog, 2)
+        rows_height = getRowsHeight(wall.getHeight())
+        robot = Robot(wall, catalog=catalog)
+        robot.setRowHeight(rows_height[0])
+        joints = []
+        wall.setJoints(0, joints)
+        sheet = planner.getNextSheet(robot, rows_height)
+        if sheet is None or robot.placeSheet(sheet) == False or wall.isPositionInWall(robot.getRobotPosition()) == False:
+            continue
+        joints.append(robot.getRobotPosition().getX())
+        plan = planner.planWall(robot, rows_height)
+        if plan is None:
+            continue
+        row_joints = joints + plan.getRows()[0].getJoints(wall.getLength())
+        for edge in plan.getRows()[1].getJoints(wall.getLength()):
+            assert all(abs(edge - joint) > 0.4 for joint in row_joints)
+        checked += 1
+    assert checked != 0
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:38:06 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import pandas as pd
+
+import simulation
+from offcut_registry import OffcutRegistry
+from robot_class import WallPool
+from trial_random import TrialRandom
+
+
+def getWallState(wall):
+    return dict(wall), wall.getJoints(), wall.getCuttingLosses(), len(wall.getOffcuts()), [wall.getWallDataframe(), wall.getJointsDF(), wall.getWasteDF()]
+
+
+def simulateWall(loader, pool, index, trial):
+    df_walls = loader.getWalls()
+    wall_name, length, height = df_walls[['Attribute:ID', 'Attribute:Length', 'Attribute:Height']].iloc[index]
+    geometry = loader.getWallGeometry()
+    rng = TrialRandom(trial)
+    registry = OffcutRegistry()
+    robot = pool.getRobot(wall_name, length, height, geometry, rng, loader.getCatalog(), registry)
+    studs, doors, windows = geometry.getWall(wall_name)
+    return simulation.runSimulation_Wall_to_Wall(trial, wall_name, length, height, studs, doors, windows, pd.DataFrame(), 10, 12, rng, loader.getCatalog(), registry=registry, robot=robot)
+
+
+def test_reset_wall_is_like_a_new_wall(loader):
+    pool = WallPool()
+    wall = simulateWall(loader, pool, 0, 0)
+    assert len(wall) != 0
+    robot = pool.getRobot(wall.getName(), wall.getLength(), wall.getHeight(), loader.getWallGeometry())
+    assert robot.wall is wall
+    assert robot.getRobotPosition() == (0, 0)
+    state = getWallState(wall)
+    new_state = getWallState(WallPool().getRobot(wall.getName(), wall.getLength(), wall.getHeight(), loader.getWallGeometry()).wall)
+    assert state[:4] == new_state[:4]
+    for a, b in zip(state[4], new_state[4]):
+        pd.testing.assert_frame_equal(a, b)
+
+
+def test_a_new_geometry_builds_a_new_wall(loader):
+    pool = WallPool()
+    wall = simulateWall(loader, pool, 0, 0)
+    geometry = simulation.WallGeometry(loader.getStuds(), loader.getDoors(), loader.getWindows())
+    assert pool.getRobot(wall.getName(), wall.getLength(), wall.getHeight(), geometry).wall is not wall
+    assert pool.getRobot(wall.getName(), wall.getLength() + 1, wall.getHeight(), geometry).wall is not wall
+
+
+def test_pooled_walls_give_the_same_results(loader):
+    df_walls = loader.getWalls().iloc[:15]
+    geometry = loader.getWallGeometry()
+    inputs = (df_walls, loader.getStuds(), loader.getDoors(), loader.getWindows(), 10, 12, 0)
+    try:
+        for trial in [0, 1, 0]:
+            fresh = simulation.runTrial(trial, 'floor', *inputs, geometry=geometry)
+            pooled = simulation.runTrial(trial, 'floor', *inputs, geometry=geometry, reuse_walls=True)
+            assert len(simulation.wall_pool) == len(df_walls)
+            for frames, pooled_frames in [(fresh[0], pooled[0]), (fresh[1], pooled[1])]:
+                for a, b in zip(frames, pooled_frames):
+                    pd.testing.assert_frame_equal(a, b)
+            pd.testing.assert_frame_equal(fresh[2], pooled[2])
+            assert fresh[3] == pooled[3]
+    finally:
+        simulation.wall_pool.clear()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:26:40 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import hashlib
+import random
+
+
+def deriveSeed(*parts):
+    '''
+    Derive a 64-bit seed from any number of parts (numbers or names). The same
+    parts always give the same seed, on any machine and in any process.
+    '''
+    key = '/'.join(str(part) for part in parts)
+    return int(hashlib.sha256(key.encode('utf-8')).hexdigest()[:16], 16)
+
+
+def getTrialSeed(seed, house_name, floor_name, trial):
+    '''
+    Seed of one trial of the simulation of a floor.
+
+    seed: base seed of the run.
+    house_name, floor_name: names of the house and floor.
+    trial: trial number.
+    '''
+    return deriveSeed(seed, house_name, floor_name, trial)
+
+
+def getWallSeed(trial_seed, wall_name):
+    '''
+    Seed of the random numbers of one wall in a trial, for runs where each
+    wall has its own streams (incremental runs).
+
+    trial_seed: seed of the trial (see getTrialSeed).
+    wall_name: name of the wall.
+    '''
+    return deriveSeed(trial_seed, 'wall', wall_name)
+
+
+class TrialRandom(object):
+    """
+    The random number streams of one simulation trial.
+
+    Sheet selection and ID generation draw from separate streams, so
+    generating IDs never changes which sheets the robot selects, and a trial
+    can be replayed on its own from its seed (see getTrialSeed).
+    """
+    def __init__(self, seed):
+        self.seed = seed
+        self.selection = random.Random(deriveSeed(seed, 'selection'))
+        self.ids = random.Random(deriveSeed(seed, 'ids'))
+
+    def getSeed(self):
+        return self.seed
+
+    def choice(self, seq):
+        """
+        Randomly select an element of seq (sheet selection stream).
+        """
+        return self.selection.choice(seq)
+
+    def choices(self, population, k):
+        """
+        Randomly select k elements of population, with replacement (ID stream).
+        """
+        return self.ids.choices(population, k=k)
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:02:31 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+from collections import OrderedDict
+import hashlib
+import os
+import pickle
+import numpy as np
+
+from openings import Openings
+from row_solver import RowSolver
+from wall_planner import BeamPlanner, CheapestSheetPlanner
+from floor_optimizer import FloorPlan, MIN_CUT_WIDTH
+from simulation_log import getLogger
+
+logger = getLogger('cache')
+
+
+def roundValues(values):
+    return tuple(round(float(value), 4) for value in values)
+
+
+def getPlannerKey(planner):
+    '''
+    Returns: a tuple describing the configuration of a planner (the layouts
+    it returns depend only on this and on the wall).
+    '''
+    if isinstance(planner, FloorPlan):
+        return ('floor', getPlannerKey(planner.planner))
+    if isinstance(planner, BeamPlanner):
+        return ('beam', planner.getBeamWidth(), roundValues(planner.getLayoutCost().getWeights()))
+    if isinstance(planner, RowSolver):
+        return ('row_dp', roundValues(planner.getLayoutCost().getWeights()))
+    if isinstance(planner, CheapestSheetPlanner):
+        return ('cheapest', roundValues(planner.getLayoutCost().getWeights()))
+    if planner is None:
+        return ('random',)
+    raise ValueError('Unknown planner: ' + str(planner))
+
+
+def isCacheable(planner):
+    '''
+    Returns: True if the layouts of a planner can be cached: the sheets
+    are chosen by a planner, not at random. The CheapestSheetPlanner also
+    chooses the cuts the wall reuses (see simulation.reuseCheapestCut),
+    which a CachedPlanner does not replay, so it is not cached.
+    '''
+    if isinstance(planner, FloorPlan):
+        return planner.planner is not None
+    return planner is not None and not isinstance(planner, CheapestSheetPlanner)
+
+
+def getIncomingOffcuts(df_waste, registry, min_area, with_walls=False):
+    '''
+    Returns: a tuple with the (height, width, no. cuts of the sheet) of the
+    cuts of the waste dataframe a wall could reuse (the other cuts are never
+    picked by the reuse strategies), in inventory order.
+
+    registry: OffcutRegistry with the sheets of the cuts.
+    with_walls: add the wall each cut comes from (the FloorPlan assigns cuts
+    of a given wall).
+    '''
+    offcuts = []
+    if df_waste.empty:
+        return ()
+    for height, width, drywall_ID, wall_name in zip(df_waste['height'], df_waste['width'], df_waste['drywall_ID'], df_waste['wall']):
+        if width > MIN_CUT_WIDTH and width >= min_area:
+            piece = (round(float(height), 4), round(float(width), 4), roundValues(np.ravel(registry.getSheet(drywall_ID).getNoCuts())))
+            if with_walls:
+                piece += (int(wall_name),)
+            offcuts.append(piece)
+    return tuple(offcuts)
+
+
+def getWallFingerprint(wall_length, wall_height, unique_stud_df, unique_door_df, unique_window_df, catalog, max_cuts, min_area, planner, wall_name=None):
+    '''
+    Returns: a tuple with everything the layout of a wall depends on, other
+    than the cuts left by the walls before it: length, height, stud X
+    locations, door and window rectangles, sheet catalog, max. cuts and min.
+    area and the planner configuration.
+
+    wall_name: only used with a FloorPlan planner, to add the planned sheets
+    and assigned cuts of the wall.
+    '''
+    studs = roundValues(sorted(unique_stud_df['Studs.Stud.InsertLocation.Attribute:X']))
+    rectangles = tuple(roundValues(rectangle) for rectangle in Openings(unique_door_df, unique_window_df).getRectangles())
+    sheets = tuple((sheet.getName(), round(float(sheet.getHeight()), 4), round(float(sheet.getWidth()), 4)) for sheet in catalog.getSheets())
+    key = (round(float(wall_length), 4), round(float(wall_height), 4), studs, rectangles, sheets, int(max_cuts), round(float(min_area), 4), getPlannerKey(planner))
+    if isinstance(planner, FloorPlan):
+        key += (planner.getWallKey(wall_name),)
+    return key
+
+
+class CachedPlanner(object):
+    """
+    Planner of a wall run with a WallCache: replays the sheets stored for the
+    wall, or asks the planner and records its answers.
+
+    The robot loop is deterministic for a given planner, so replaying the
+    sheets of an identical wall rebuilds the same drywall, waste and joint
+    records (with new IDs) without laying out the wall again.
+    """
+    def __init__(self, planner, catalog, sheets=None):
+        """
+        planner: RowSolver, BeamPlanner or FloorPlan.
+        catalog: DrywallCatalog the sheet names are looked up in.
+        sheets: sheet names stored for the wall (None to record them).
+        """
+        self.planner = planner
+        self.catalog = catalog
+        self.replay = sheets is not None
+        self.sheets = [] if sheets is None else sheets
+        self.next_sheet = 0
+        self.deterministic = True
+
+    def isRecording(self):
+        return self.replay == False
+
+    def isDeterministic(self):
+        """
+        Returns: False if the planner found no sheet inside the wall (the
+        robot placed a random sheet instead), so the layout cannot be cached.
+        """
+        return self.deterministic
+
+    def getSheets(self):
+        return self.sheets
+
+    def getNextSheet(self, robot, rows_height=None):
+        if self.replay and self.next_sheet < len(self.sheets):
+            name = self.sheets[self.next_sheet]
+            self.next_sheet += 1
+            return None if name is None else self.catalog.getSheet(name)
+
+        #Record the answer (or keep going past the end of a replay)
+        sheet = self.planner.getNextSheet(robot, rows_height)
+        if self.replay == False:
+            self.sheets.append(None if sheet is None else sheet.getName())
+        if sheet is None and robot.getRobotPosition().getX() < (robot.wall.getLength() - 0.125):
+            self.deterministic = False
+        return sheet
+
+    def findAssignedCut(self, robot, offcuts):
+        return self.planner.findAssignedCut(robot, offcuts)
+
+
+class WallCache(object):
+    """
+    Content-addressed cache of the layouts of walls.
+
+    A wall is identified by a fingerprint of everything the simulation of the
+    wall depends on: length, height, stud X locations, door and window
+    rectangles, sheet catalog, max. cuts and min. area, planner configuration
+    and the reusable cuts left by the walls before it. Walls with the same
+    fingerprint (e.g. mirrored walls, the same wall on the next trial or in
+    another house) get the same layout.
+
+    The cache keeps the sheets chosen by the planner, not the result tables:
+    on a hit the robot loop replays them (CachedPlanner), which is cheap
+    next to the layout search, and the records get their own IDs and live
+    cut objects. Random sheets (no planner) are not cached.
+
+    At most max_entries layouts are kept in memory (least recently used are
+    dropped). If a directory is given, the layouts are also stored there
+    (one pickle per fingerprint) and shared by every process using it.
+    """
+    def __init__(self, max_entries=1024, directory=None):
+        """
+        max_entries: max. number of layouts kept in memory.
+        directory: directory of the on-disk store (None for memory only).
+        """
+        if max_entries < 1:
+            raise ValueError('The cache must hold at least 1 entry')
+        self.max_entries = max_entries
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def getHits(self):
+        return self.hits
+
+    def getMisses(self):
+        return self.misses
+
+    def getKey(self, wall_length, wall_height, unique_stud_df, unique_door_df, unique_window_df, df_waste, registry, catalog, max_cuts, min_area, planner, wall_name=None):
+        """
+        Returns: the fingerprint (hex digest) of a wall and the reusable cuts
+        coming in from the walls before it (see getWallFingerprint).
+
+        registry: OffcutRegistry with the sheets of the cuts of df_waste.
+        """
+        key = getWallFingerprint(wall_length, wall_height, unique_stud_df, unique_door_df, unique_window_df, catalog, max_cuts, min_area, planner, wall_name)
+        key += (getIncomingOffcuts(df_waste, registry, min_area, isinstance(planner, FloorPlan)),)
+        return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+    def getPath(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def get(self, key):
+        """
+        Returns: the sheet names stored for the fingerprint key, or None.
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        if self.directory is not None and os.path.exists(self.getPath(key)):
+            with open(self.getPath(key), 'rb') as file:
+                sheets = pickle.load(file)
+            self.store(key, sheets)
+            self.hits += 1
+            return sheets
+
+        self.misses += 1
+        return None
+
+    def put(self, key, sheets):
+        """
+        Store the sheet names of a wall (in memory and on disk).
+        """
+        self.store(key, sheets)
+        if self.directory is not None:
+            #Write to a temporary file first, other processes may read it
+            path = self.getPath(key)
+            temp_path = path + '.' + str(os.getpid())
+            with open(temp_path, 'wb') as file:
+                pickle.dump(list(sheets), file)
+            os.replace(temp_path, path)
+
+    def store(self, key, sheets):
+        self.entries[key] = list(sheets)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
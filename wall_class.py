@@ -10,14 +10,35 @@ import pandas as pd
 import numpy as np
 import random
 import string
-import matplotlib.pylab as plt
-import matplotlib.patches as patches
-import matplotlib as mpl
-import pyclipper
-import seaborn as sns
-mpl.style.use(['seaborn-white'])
 
 import basic_classes
+from record_buffer import RecordBuffer
+from offcut_inventory import OffcutInventory
+from offcut_registry import OffcutRegistry
+from stud_index import StudIndex
+from openings import Openings
+from simulation_log import getLogger
+from phase_timer import timed, DATAFRAME_UPDATE, WASTE_BOOKKEEPING
+
+logger = getLogger('wall')
+
+#Column labels and dtypes of the result tables. The cuts are stored by name
+#(0 if there is no cut) and the sheets by drywall ID, see OffcutRegistry
+DRYWALL_COLUMNS = ['simulation', 'wall', 'drywall_ID', 'name', 'start_point_x', 'start_point_y', 'height', 'width', 'vertical_cut', 'horizontal_cut', 'door_clipper', 'window_clipper', 'no_cuts']
+DRYWALL_DTYPES = {'wall': 'int64', 'start_point_x': 'float64', 'start_point_y': 'float64', 'height': 'float64', 'width': 'float64', 'no_cuts': 'int64'}
+WASTE_COLUMNS = ['simulation', 'wall', 'drywall_ID', 'name', 'start_point_x', 'start_point_y', 'height', 'width', 'area_ft2', 'type_of_cut', 'no_cuts']
+WASTE_DTYPES = {'wall': 'int64', 'start_point_x': 'float64', 'start_point_y': 'float64', 'height': 'float64', 'width': 'float64', 'area_ft2': 'float64', 'no_cuts': 'int64'}
+JOINTS_COLUMNS = ['simulation', 'wall', 'x', 'y', 'length']
+JOINTS_DTYPES = {'wall': 'int64', 'x': 'float64', 'y': 'float64', 'length': 'float64'}
+
+
+def getCutName(cut):
+    '''
+    Returns: the name of a cut of a drywall, 0 if there is no cut.
+    '''
+    if isinstance(cut, int):
+        return cut
+    return cut.getName()
 
 
 class Wall(dict):
@@ -30,7 +51,7 @@ class Wall(dict):
     A wall has a width and a height. At any particular time, a wall has certain number of
     drywall sheets.
     '''
-    def __init__(self, wall_name, length, height, studs_df, doors_df, windows_df):
+    def __init__(self, wall_name, length, height, studs_df, doors_df, windows_df, registry=None):
         """
         Initializes a wall with the specified width and height.
 
@@ -38,39 +59,67 @@ class Wall(dict):
 
         width: an integer > 0
         height: an integer > 0
+        registry: OffcutRegistry with the sheets of the cuts of the waste
+        dataframes (a new one if None).
         """
         self.wall_name = int(wall_name)
         self.length = length
         self.height = height
         self.studs_df = studs_df
+        self.stud_index = StudIndex(studs_df['Studs.Stud.InsertLocation.Attribute:X'])
         self.doors_df = doors_df
         self.windows_df = windows_df
+        self.openings = Openings(doors_df, windows_df)
         self.joints = {}
-        self.df_joints = pd.DataFrame(columns=['simulation', 'wall', 'x', 'y', 'length'])
+        self.joints_records = RecordBuffer(JOINTS_COLUMNS, JOINTS_DTYPES)
         self.cutting_losses = []
-        self.drywall_dataframe = pd.DataFrame(columns=['simulation', 'wall', 'drywall_ID', 'name', 'start_point_x', 'start_point_y', 'height', 'width', 'vertical_cut', 'horizontal_cut', 'door_clipper', 'window_clipper', 'no_cuts'])
-        self.waste_dataframe = pd.DataFrame(columns=['simulation', 'wall', 'drywall_ID', 'drywall_object', 'cut_object','name', 'start_point_x', 'start_point_y', 'height', 'width', 'area_ft2', 'type_of_cut', 'no_cuts'])
-        self.backup_waste = pd.DataFrame(columns=['simulation', 'wall', 'drywall_ID', 'drywall_object', 'cut_object','name', 'start_point_x', 'start_point_y', 'height', 'width', 'area_ft2', 'type_of_cut', 'no_cuts'])
-        self.waste = pd.DataFrame(columns=['simulation', 'wall', 'drywall_ID', 'drywall_object', 'cut_object','name', 'start_point_x', 'start_point_y', 'height', 'width', 'area_ft2', 'type_of_cut', 'no_cuts'])
+        self.drywall_records = RecordBuffer(DRYWALL_COLUMNS, DRYWALL_DTYPES)
+        self.waste_records = RecordBuffer(WASTE_COLUMNS, WASTE_DTYPES)
+        self.offcuts = OffcutInventory(WASTE_COLUMNS, WASTE_DTYPES)
+        self.registry = OffcutRegistry() if registry is None else registry
+        #Waste dataframe of a wall with no saved waste (replaced, never
+        #modified, by saveWasteDF)
+        self.empty_waste = RecordBuffer(WASTE_COLUMNS, WASTE_DTYPES).toDataFrame()
+        self.waste = self.empty_waste
         #self.plates_list = plates_list
 
+    def reset(self, registry=None):
+        """
+        Clear the wall for a new trial: the placed sheets, joints, cutting
+        losses, result buffers, offcut inventory and waste dataframe are
+        emptied in place. The geometry (size, studs, openings and their
+        indexes) is kept, so a wall can be simulated again without being
+        built again.
+
+        The dataframes returned before the reset (getWallDataframe,
+        getJointsDF, getWasteDF) are copies and are not affected.
+
+        registry: OffcutRegistry of the new trial (a new one if None).
+        """
+        dict.clear(self)
+        self.joints.clear()
+        self.joints_records.clear()
+        del self.cutting_losses[:]
+        self.drywall_records.clear()
+        self.waste_records.clear()
+        self.offcuts.clear()
+        self.registry = OffcutRegistry() if registry is None else registry
+        self.waste = self.empty_waste
+
     def getJoints(self):
         return self.joints
     def getJointsDF(self):
-        return self.df_joints
+        return self.joints_records.toDataFrame()
     def setJoints(self, row, joints):
         self.joints[row] = joints
+    @timed(DATAFRAME_UPDATE)
     def setJointsDF(self, robot, joints):
         simulation_number = 'Simulation_' + str(robot.getSimulationNumber())
         #columns=['simulation', 'wall', 'x', 'y', 'length']
-        df = pd.DataFrame(joints, columns=['x'])
-        df['simulation'] = simulation_number
-        df['wall'] = self.wall_name
-        df['y'] = robot.getRobotPosition().getY()
-        df['length'] = robot.getRowHeight()
-        df = df[['simulation', 'wall', 'x', 'y', 'length']]
-        #df = pd.DataFrame(np.array([[simulation_number, self.wall_name, robot.getRobotPosition().getX(), robot.getRobotPosition().getY(), robot.getRowHeight()]]), columns=columns)
-        self.df_joints = self.df_joints.append(df, ignore_index=True)
+        y = robot.getRobotPosition().getY()
+        length = robot.getRowHeight()
+        for x in joints:
+            self.joints_records.append((simulation_number, self.wall_name, x, y, length))
     def getCuttingLosses(self):
         return self.cutting_losses
     def setCuttingLosses(self, cutting_loss_area):
@@ -83,24 +132,33 @@ class Wall(dict):
         return self.height
     def getStuds(self):
         return self.studs_df
+    def getStudIndex(self):
+        return self.stud_index
     def getDoors(self):
         return self.doors_df
     def getWindows(self):
         return self.windows_df
+    def getOpenings(self):
+        return self.openings
     def getWaste(self):
-        return self.waste_dataframe
+        return self.waste_records.toDataFrame()
+    def getWasteRecords(self):
+        return self.waste_records
+    @timed(WASTE_BOOKKEEPING)
+    def clearWaste(self):
+        self.waste_records.clear()
     def getBackupWaste(self):
-        return self.backup_waste
+        return self.offcuts.toDataFrame()
+    def getOffcuts(self):
+        return self.offcuts
+    def getRegistry(self):
+        return self.registry
     def changeCuts(self, cut):
-        df_drywall = self.getWallDataframe()
-        index = df_drywall.index[df_drywall['drywall_ID'] == cut.getDrywall().getID()]
-        self.drywall_dataframe.loc[index, 'no_cuts'] = self.drywall_dataframe.loc[index, 'no_cuts'] + 1
-        # print('CHANGE CUTS NO')
-        # print(index)
-        # print(cut.getID())
-        # #print(self.drywall_dataframe)
-        # print(self.drywall_dataframe.iloc[index])
-        cut.getDrywall().setNoCuts(self.drywall_dataframe.loc[index, 'no_cuts'].values)
+        records = self.drywall_records
+        index = records.findRows('drywall_ID', cut.getDrywall().getID())
+        for i in index:
+            records.setValue(i, 'no_cuts', records.getValue(i, 'no_cuts') + 1)
+        cut.getDrywall().setNoCuts(np.array([records.getValue(i, 'no_cuts') for i in index]))
 
     def placeDrywallAtPosition(self, position, drywall):
         """
@@ -119,8 +177,9 @@ class Wall(dict):
             self[point] = drywall.getWidth(), drywall.getHeight(), drywall.getCuttingLosses()
 
     def getWallDataframe(self):
-        return self.drywall_dataframe
+        return self.drywall_records.toDataFrame()
 
+    @timed(DATAFRAME_UPDATE)
     def updateDrywallDataframe(self, position, drywall, simulation_number):
         """
         Mark the drywall under the position 'position' as nailed. Assumes that
@@ -132,28 +191,31 @@ class Wall(dict):
         Returns:
             drywall dataframe
         """
-        #Set column labels
-        columns=['simulation', 'wall', 'drywall_ID', 'name', 'start_point_x', 'start_point_y', 'height', 'width', 'vertical_cut', 'horizontal_cut', 'door_clipper', 'window_clipper', 'no_cuts']
-        #Create new dataframe to append
-        df2 = pd.DataFrame(np.array([[simulation_number, self.wall_name, drywall.getID(), drywall.getName(), position.getX(), position.getY(), drywall.getHeight(), drywall.getWidth(), drywall.getVerticalCut(), drywall.getHorizontalCut(), drywall.getDoorClipper(), drywall.getWindowClipper(), drywall.getNoCuts()]]), columns=columns)
-        df2['wall'] = df2['wall'].astype('int64')
-        #Append dataframe to self(wall)
-        self.drywall_dataframe = self.drywall_dataframe.append(df2, ignore_index=True)
+        #Append row to self(wall)
+        self.drywall_records.append((simulation_number, self.wall_name, drywall.getID(), drywall.getName(), position.getX(), position.getY(), drywall.getHeight(), drywall.getWidth(), getCutName(drywall.getVerticalCut()), getCutName(drywall.getHorizontalCut()), getCutName(drywall.getDoorClipper()), getCutName(drywall.getWindowClipper()), drywall.getNoCuts()))
 
+    @timed(WASTE_BOOKKEEPING)
     def backup_WasteDF(self, df_waste):
         """
-        Mark the drywall under the position 'position' as nailed. Assumes that
-        'position' represents a valid position on the wall.
+        Add cutting losses to the offcut inventory of the wall, so they can be
+        reused. Pieces with a name already in the inventory replace the old one.
+        The cuts are rebuilt from the rows, their sheets are looked up in the
+        registry of the wall.
 
-        position: a Position class object
-        cut: a Cut class object
-
-        Returns:
-            waste dataframe
+        df_waste: a waste dataframe or a RecordBuffer with the waste columns
+        (e.g. self.getWasteRecords()).
         """
-        self.backup_waste = self.backup_waste.append(df_waste, ignore_index=True)
-        self.backup_waste = self.backup_waste.drop_duplicates(subset='name', keep='last')
+        if isinstance(df_waste, RecordBuffer):
+            rows = df_waste.iterRows()
+        elif df_waste.empty:
+            return
+        else:
+            rows = df_waste[WASTE_COLUMNS].itertuples(index=False, name=None)
+        for row in rows:
+            simulation_number, wall_name, drywall_ID, name, x, y, height, width, area, cut_type, no_cuts = row
+            self.offcuts.add(row, self.registry.createCut(drywall_ID, name, height, width, cut_type, x, y, no_cuts, wall_name))
 
+    @timed(WASTE_BOOKKEEPING)
     def saveWasteDF(self):
         """
         Mark the drywall under the position 'position' as nailed. Assumes that
@@ -165,12 +227,15 @@ class Wall(dict):
         Returns:
             waste dataframe
         """
-        self.waste = self.waste.append(self.backup_waste, ignore_index=True)
+        self.waste = pd.concat([self.waste, self.offcuts.toDataFrame()], ignore_index=True)
         self.waste = self.waste.drop_duplicates(subset='name', keep='last')
+        #Only keep the sheets of the cuts left for the next walls
+        self.registry.prune(self.waste['drywall_ID'])
 
     def getWasteDF(self):
         return self.waste
 
+    @timed(WASTE_BOOKKEEPING)
     def updateWasteDF(self, cut, simulation_number):
         """
         Mark the drywall under the position 'position' as nailed. Assumes that
@@ -182,22 +247,17 @@ class Wall(dict):
         Returns:
             waste dataframe
         """
-        #Set column labels
-        columns=['simulation', 'wall', 'drywall_ID', 'drywall_object', 'cut_object','name', 'start_point_x', 'start_point_y', 'height', 'width', 'area_ft2', 'type_of_cut', 'no_cuts']
-
-        #Append to dataframe if not empty
+        #Append to waste records if not empty
         if cut.getArea() != 0:
-            df1 = pd.DataFrame(np.array([[simulation_number, cut.getWallName(), cut.getID(), cut.getDrywall(), cut, cut.getName(), cut.getPosition().getX(), cut.getPosition().getY(), cut.getHeight(), cut.getWidth(), cut.getArea(), cut.getType(), cut.getNoCuts()]]), columns=columns)
-            self.waste_dataframe = self.waste_dataframe.append(df1, ignore_index=True)
-            
+            self.registry.addSheet(cut.getDrywall())
+            self.waste_records.append((simulation_number, cut.getWallName(), cut.getID(), cut.getName(), cut.getPosition().getX(), cut.getPosition().getY(), cut.getHeight(), cut.getWidth(), cut.getArea(), cut.getType(), cut.getNoCuts()))
 
+
+    @timed(WASTE_BOOKKEEPING)
     def updateWasteDF_VC_HC(self, drywall, simulation_number):
         """
 
         """
-        #Set column labels
-        columns=['simulation', 'wall', 'drywall_ID', 'drywall_object', 'cut_object','name', 'start_point_x', 'start_point_y', 'height', 'width', 'area_ft2', 'type_of_cut', 'no_cuts']
-
         #Import cuts
         vc = drywall.getVerticalCut() #vertical cut
         hc = drywall.getHorizontalCut() #horizontal cut
@@ -205,18 +265,18 @@ class Wall(dict):
         #Append to dataframe if not empty
         if vc != 0:
             if vc.getArea() != 0:
-                print('Yes, vertical cut should be added')
-                df1 = pd.DataFrame(np.array([[simulation_number, self.wall_name, vc.getID(), vc.getDrywall(), vc, vc.getName(), vc.getPosition().getX(), vc.getPosition().getY(), vc.getHeight(), vc.getWidth(), vc.getArea(), vc.getType(), vc.getNoCuts()]]), columns=columns)
-                self.waste_dataframe = self.waste_dataframe.append(df1, ignore_index=True)
-                #print(self.waste_dataframe)
+                logger.debug('Vertical cut added to the waste')
+                self.registry.addSheet(vc.getDrywall())
+                self.waste_records.append((simulation_number, self.wall_name, vc.getID(), vc.getName(), vc.getPosition().getX(), vc.getPosition().getY(), vc.getHeight(), vc.getWidth(), vc.getArea(), vc.getType(), vc.getNoCuts()))
 
         if hc != 0:
             if hc.getArea() != 0:
-                df2 = pd.DataFrame(np.array([[simulation_number, self.wall_name, hc.getID(), hc.getDrywall(), hc, hc.getName(), hc.getPosition().getX(), hc.getPosition().getY(), hc.getHeight(), hc.getWidth(), hc.getArea(), hc.getType(), hc.getNoCuts()]]), columns=columns)
-                self.waste_dataframe = self.waste_dataframe.append(df2, ignore_index=True)
+                self.registry.addSheet(hc.getDrywall())
+                self.waste_records.append((simulation_number, self.wall_name, hc.getID(), hc.getName(), hc.getPosition().getX(), hc.getPosition().getY(), hc.getHeight(), hc.getWidth(), hc.getArea(), hc.getType(), hc.getNoCuts()))
     
+    @timed(DATAFRAME_UPDATE)
     def DropDrywallResults(self, simulation_number):
-        self.drywall_dataframe = self.drywall_dataframe[self.drywall_dataframe['simulation']!=simulation_number]
+        self.drywall_records.dropWhere('simulation', simulation_number)
     
     def getWallArea(self):
         """
@@ -259,6 +319,7 @@ class Wall(dict):
 
     def visualization(self, simulation_number, total_cutting_loss_area):
 
+        plt, patches, sns = basic_classes.importPlotting()
         sns_colors = sns.hls_palette(10, h=.5)
         #qualitative_colors = sns.color_palette("Set3", 10)
         #sns_color = sns.color_palette("husl", 8)
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:40:06 2026
+
+@author: jcuellar
+"""
+
+#Import relevant libraries
+import numpy as np
+
+from row_solver import RowSolver, LayoutCost
+from batch_evaluator import BatchEvaluator, REJECTED, SHEET
+
+
+class WallPlan(object):
+    """
+    The rows of a wall laid out by a wall planner, from the current row of the
+    robot up to the top of the wall.
+    """
+    def __init__(self, rows, cost):
+        """
+        rows: list of RowPlan, from the bottom.
+        cost: total cost of the rows.
+        """
+        self.rows = rows
+        self.cost = cost
+
+    def getRows(self):
+        return self.rows
+
+    def getCost(self):
+        return self.cost
+
+    def getCuttingLoss(self):
+        return round(sum(row.getCuttingLoss() for row in self.rows), 4)
+
+    def getNumSheets(self):
+        return sum(row.getNumSheets() for row in self.rows)
+
+    def getNumCuts(self):
+        return sum(row.getNumCuts() for row in self.rows)
+
+
+class BeamPlanner(object):
+    """
+    Beam search planner of the layout of a whole wall.
+
+    Joint staggering couples each row to the one below, so the best row on its
+    own can force a bad row above it. The planner keeps the beam_width
+    cheapest partial layouts (rows 0..r) and extends each of them with the
+    beam_width cheapest layouts of the next row (RowSolver.getBestRows,
+    staggered against the joints of that partial layout). A wider beam finds
+    cheaper walls at a higher cost per plan.
+
+    The plan of a wall is kept while the robot follows it: the next sheet is
+    taken from the plan as long as the robot is at the left edge of a planned
+    sheet with the joints the plan expects (e.g. a reused cut ending at a
+    planned edge). The wall is only planned again when the robot leaves the
+    plan.
+    """
+    def __init__(self, catalog, beam_width=4, cost=None):
+        """
+        catalog: DrywallCatalog with the sheets that can be placed.
+        beam_width: number of partial layouts kept after each row.
+        cost: LayoutCost of the layouts (defaults to the cutting loss area).
+        """
+        if beam_width < 1:
+            raise ValueError('The beam width must be at least 1')
+        self.beam_width = beam_width
+        self.cost = LayoutCost() if cost is None else cost
+        self.row_solver = RowSolver(catalog, self.cost)
+        #Plan being followed: its wall and its steps (see getPlanSteps)
+        self.wall = None
+        self.steps = []
+        self.next_step = 0
+
+    def __getstate__(self):
+        #The plan being followed is for a wall of this process: it is not
+        #sent to other processes
+        state = self.__dict__.copy()
+        state.update(wall=None, steps=[], next_step=0)
+        return state
+
+    def getBeamWidth(self):
+        return self.beam_width
+
+    def getLayoutCost(self):
+        return self.cost
+
+    def planWall(self, robot, rows_height):
+        """
+        Plan the rest of the wall: the current row of the robot from the robot
+        position (staggered against the joints set on the wall), then every
+        row above it from the start of the wall. The row above the current
+        row is staggered against the joints already nailed on the current row
+        (set on the wall) and the planned ones.
+
+        robot: the Robot (its wall, position and row number are used).
+        rows_height: list with the height of every row of the wall.
+
+        Returns: the WallPlan with the lowest cost, or None if the wall cannot
+        be completed with the sheets of the catalog.
+        """
+        wall = robot.wall
+        first_row = robot.getRowNumber()
+        position = robot.getRobotPosition()
+        nailed_joints = list(wall.getJoints().get(first_row, []))
+
+        #Partial layouts: (cost, no. sheets, sheet indexes, rows). Layouts
+        #with the same cost are ranked like in RowSolver
+        beam = [(0, 0, (), [])]
+        for row in range(first_row, len(rows_height)):
+            if row == first_row:
+                start = position
+            else:
+                start = position.getNewPosition(-position.getX(), 4 * (row - first_row))
+
+            candidates = []
+            for cost, num_sheets, indexes, rows in beam:
+                if row == first_row:
+                    previous_joints = None
+                elif row == first_row + 1:
+                    previous_joints = nailed_joints + rows[-1].getJoints(wall.getLength())
+                else:
+                    previous_joints = rows[-1].getJoints(wall.getLength())
+                for plan in self.row_solver.getBestRows(robot, start, rows_height[row], previous_joints, self.beam_width):
+                    plan_indexes = tuple(self.getSheetIndex(sheet) for sheet in plan.getSheets())
+                    candidates.append((cost + plan.getCost(), num_sheets + plan.getNumSheets(), indexes + (plan_indexes,), rows + [plan]))
+
+            if len(candidates) == 0:
+                return None
+            candidates.sort(key=lambda candidate: candidate[:3])
+            beam = candidates[:self.beam_width]
+
+        cost, num_sheets, indexes, rows = beam[0]
+        return WallPlan(rows, cost)
+
+    def getSheetIndex(self, sheet):
+        return self.row_solver.getCatalog().getSheets().index(sheet)
+
+    def getPlanSteps(self, robot, plan):
+        """
+        Returns: a list with a (row, x, sheet, joints below, joints before)
+        tuple per sheet of a WallPlan of the robot: the row number and X
+        location of the left edge of the sheet, and the joints of the row
+        below (None for the first row of the wall) and of its own row, left
+        of the sheet, the wall has when the robot gets there following the
+        plan.
+        """
+        wall = robot.wall
+        wall_edge = wall.getLength() - 0.0625
+        first_row = robot.getRowNumber()
+        joints = wall.getJoints()
+        below = None if first_row == 0 else tuple(joints.get(first_row - 1, []))
+        steps = []
+        for i, row_plan in enumerate(plan.getRows()):
+            if i == 0:
+                x, row_joints = robot.getRobotPosition().getX(), tuple(joints.get(first_row, []))
+            else:
+                x, row_joints = 0, ()
+            for sheet, edge in zip(row_plan.getSheets(), row_plan.getEdges()):
+                steps.append((first_row + i, x, sheet, below, row_joints))
+                if edge < wall_edge:
+                    row_joints = row_joints + (edge,)
+                x = edge
+            below = row_joints
+        return steps
+
+    def findPlannedSheet(self, robot):
+        """
+        Returns: the sheet of the plan being followed at the robot position,
+        or None if the robot is not on the plan (another wall, a position or
+        joints the plan does not expect).
+        """
+        if robot.wall is not self.wall:
+            return None
+        row = robot.getRowNumber()
+        x = robot.getRobotPosition().getX()
+        joints = robot.wall.getJoints()
+        for i in range(self.next_step, len(self.steps)):
+            step_row, step_x, sheet, below, before = self.steps[i]
+            if step_row > row or (step_row == row and step_x > x):
+                break
+            if step_row == row and step_x == x:
+                if (below is None or tuple(joints.get(row - 1, [])) == below) and tuple(joints.get(row, [])) == before:
+                    self.next_step = i
+                    return sheet
+                break
+        return None
+
+    def getNextSheet(self, robot, rows_height):
+        """
+        Returns: the next sheet of the best layout of the rest of the wall
+        (the plan being followed, or a new plan if the robot left it), or
+        None if the wall cannot be completed.
+        """
+        sheet = self.findPlannedSheet(robot)
+        if sheet is not None:
+            return sheet
+        plan = self.planWall(robot, rows_height)
+        if plan is None or len(plan.getRows()) == 0:
+            self.wall, self.steps, self.next_step = None, [], 0
+            return None
+        self.wall, self.steps, self.next_step = robot.wall, self.getPlanSteps(robot, plan), 0
+        return self.steps[0][2]
+
+
+class CheapestSheetPlanner(object):
+    """
+    One-step planner: the next piece is the one that can be placed at the
+    robot position with the lowest cost (LayoutCost of its cutting loss, new
+    sheets and cuts), a sheet of the catalog or a cut of the offcut inventory
+    of the wall. All the pieces are evaluated at once (BatchEvaluator), so the
+    robot does not retry random sheets until one complies with the design
+    rules. Pieces with the same cost are ranked with the cuts first (a cut
+    left unused ends up as waste), then in the order of the evaluation
+    (catalog order, cuts from the largest area).
+    """
+    def __init__(self, catalog, cost=None):
+        """
+        catalog: DrywallCatalog with the sheets that can be placed.
+        cost: LayoutCost of the sheets (defaults to the cutting loss area).
+        """
+        self.catalog = catalog
+        self.cost = LayoutCost() if cost is None else cost
+        self.evaluator = BatchEvaluator(catalog)
+        sheets = catalog.getSheets()
+        self.sheet_heights = np.array([sheet.getHeight() for sheet in sheets], dtype='float64')
+        self.sheet_widths = np.array([sheet.getWidth() for sheet in sheets], dtype='float64')
+
+    def getCatalog(self):
+        return self.catalog
+
+    def getLayoutCost(self):
+        return self.cost
+
+    def getCosts(self, robot, offcuts=None, min_area=0, max_cuts=None):
+        """
+        Evaluate the pieces that can be placed at the robot position: the
+        sheets of the catalog and, if given, the eligible cuts of an offcut
+        inventory (see BatchEvaluator.evaluate for min_area and max_cuts).
+
+        Returns
+        (batch, costs): the CandidateBatch and the cost of each piece (inf if
+        it cannot be placed).
+        """
+        batch = self.evaluator.evaluate(robot, offcuts=offcuts, min_area=min_area, max_cuts=max_cuts)
+        widths, heights = self.sheet_widths, self.sheet_heights
+        if len(batch) > len(widths):
+            cuts = [offcuts.getCut(key) for key in batch.index[batch.getOffcuts()]]
+            widths = np.concatenate([widths, [cut.getWidth() for cut in cuts]])
+            heights = np.concatenate([heights, [cut.getHeight() for cut in cuts]])
+        no_cuts = (batch.width < widths).astype(int) + (heights > robot.getRowHeight())
+        new_sheets = (batch.kind == SHEET).astype(int)
+        costs = self.cost.getCost(np.round(batch.loss, 4), new_sheets, no_cuts)
+        return batch, np.where(batch.status != REJECTED, costs, np.inf)
+
+    def getNextPiece(self, robot, offcuts=None, min_area=0, max_cuts=None):
+        """
+        Returns: the (kind, index) of the cheapest piece that can be placed at
+        the robot position (SHEET and its index in the catalog, or OFFCUT and
+        its key in the inventory), or None if no piece complies with the
+        design rules (or the row is done).
+        """
+        if (robot.wall.getLength() - 0.125) <= robot.getRobotPosition().getX():
+            return None
+        batch, costs = self.getCosts(robot, offcuts, min_area, max_cuts)
+        #Lowest cost, then cuts first, then order of the evaluation
+        best = np.lexsort((np.arange(len(costs)), batch.kind == SHEET, costs))[0]
+        if np.isinf(costs[best]):
+            return None
+        return int(batch.kind[best]), int(batch.index[best])
+
+    def getNextSheet(self, robot, rows_height=None):
+        """
+        Returns: the cheapest sheet of the catalog that can be placed at the
+        robot position, or None if no sheet complies with the design rules
+        (or the row is done).
+        """
+        piece = self.getNextPiece(robot)
+        if piece is None:
+            return None
+        return self.catalog.getSheets()[piece[1]]